@@ -25,6 +25,7 @@ Grid_Width = 15            # Number of columns
 Grid_Height = 15           # Number of rows
 Screen_Width = 1000        # Width of the game window
 Screen_Height = 800        # Height of the game window
+HPA_Cluster_Size = 5       # Cluster size for the hierarchical search mode in the UI
 
 # Reproducibility
 Global_Seed = None         # Set this to fix randomness for repeatable results
@@ -0,0 +1,127 @@
+import heapq
+import random
+from array import array
+
+
+def bidirectional_search(graph, start, end, Noise_Level=0, Max_Depth=None, stats=None, Heuristic=None):
+    """
+    Runs bidirectional A* on a prebuilt GridGraph.
+
+    One frontier grows from the start towards the end and another from the end
+    towards the start, always expanding the side with the smaller open list.
+    The best meeting cost found so far (mu) is updated whenever a relaxed node
+    has already been reached by the other side, and the search stops once
+    the smallest f-value of either frontier is at least mu. With the plain
+    Manhattan or landmark heuristic this returns an optimal path.
+
+    Args:
+        graph (GridGraph): Flattened grid built once per map
+        start (tuple[int, int]): Starting tile
+        end (tuple[int, int]): Goal tile
+        Noise_Level (int, optional): Adds randomness to the heuristic
+        Max_Depth (int, optional): Maximum nodes allowed to be expanded (both directions combined)
+        stats (dict, optional): If given, receives "forward" and "backward" expansion counts
+        Heuristic (LandmarkHeuristic, optional): Supplies per-goal estimate tables instead of Manhattan distance
+
+    Returns:
+        tuple[List[tuple[int, int]], int]: The final path (if any) and number of nodes explored
+    """
+    width = graph.width
+    offsets = graph.offsets
+    targets = graph.targets
+    start_node = graph.to_node(start)
+    end_node = graph.to_node(end)
+
+    explored = [0, 0]  # Forward, backward
+
+    def finish(path):
+        if stats is not None:
+            stats["forward"] = explored[0]
+            stats["backward"] = explored[1]
+        return path, explored[0] + explored[1]
+
+    if start_node == end_node:
+        explored[0] = 1
+        return finish([start])
+
+    if graph.is_wall(end_node):
+        return finish(None)  # The goal can never be entered
+
+    noisy = bool(Noise_Level and Noise_Level > 0)
+    low, high = -Noise_Level / 10, Noise_Level / 10
+    uniform = random.uniform
+
+    # Index 0 searches towards the end, index 1 towards the start
+    table_to = Heuristic.table_to if Heuristic is not None else graph.manhattan_table
+    h_tables = (table_to(end_node), table_to(start_node))
+    g_scores = (array("i", [-1]) * graph.size, array("i", [-1]) * graph.size)
+    came_from = (array("i", [-1]) * graph.size, array("i", [-1]) * graph.size)
+    closed = (bytearray(graph.size), bytearray(graph.size))
+    open_sets = ([(h_tables[0][start_node], start_node)], [(h_tables[1][end_node], end_node)])
+    g_scores[0][start_node] = 0
+    g_scores[1][end_node] = 0
+
+    best_cost = float("inf")  # mu
+    meeting_node = -1
+
+    while open_sets[0] and open_sets[1]:
+        # Drop already-expanded entries so the tops are real frontier nodes
+        for side in (0, 1):
+            open_set = open_sets[side]
+            while open_set and closed[side][open_set[0][1]]:
+                heapq.heappop(open_set)
+        if not open_sets[0] or not open_sets[1]:
+            break
+
+        if max(open_sets[0][0][0], open_sets[1][0][0]) >= best_cost:
+            break
+
+        side = 0 if len(open_sets[0]) <= len(open_sets[1]) else 1
+        other = 1 - side
+        _, current = heapq.heappop(open_sets[side])
+        closed[side][current] = 1
+        explored[side] += 1
+
+        if Max_Depth is not None and explored[0] + explored[1] > Max_Depth:
+            return finish(None)
+
+        g_here, g_there = g_scores[side], g_scores[other]
+        h_table = h_tables[side]
+        parents = came_from[side]
+        new_cost = g_here[current] + 1  # Assume all moves cost 1
+
+        for index in range(offsets[current], offsets[current + 1]):
+            neighbour = targets[index]
+            old_cost = g_here[neighbour]
+
+            if old_cost == -1 or new_cost < old_cost:
+                parents[neighbour] = current
+                g_here[neighbour] = new_cost
+                if noisy:
+                    total_estimate = new_cost + h_table[neighbour] * (1 + uniform(low, high))
+                else:
+                    total_estimate = new_cost + h_table[neighbour]
+                heapq.heappush(open_sets[side], (total_estimate, neighbour))
+
+                if g_there[neighbour] != -1 and new_cost + g_there[neighbour] < best_cost:
+                    best_cost = new_cost + g_there[neighbour]
+                    meeting_node = neighbour
+
+    if meeting_node == -1:
+        return finish(None)  # No path found
+
+    # Walk back to the start, then forward to the end through the backward parents
+    path = []
+    current = meeting_node
+    while current != start_node:
+        path.append(divmod(current, width))
+        current = came_from[0][current]
+    path.append(start)
+    path.reverse()
+
+    current = meeting_node
+    while current != end_node:
+        current = came_from[1][current]
+        path.append(divmod(current, width))
+
+    return finish(path)
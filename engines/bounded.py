@@ -0,0 +1,238 @@
+import heapq
+
+from engines.grid_graph import trace_path
+from engines.workspace import default_pool
+
+DEFAULT_WEIGHT_RANGE = (1.0, 3.0)
+DEFAULT_WEIGHT_STEP = 0.5
+
+
+def weighted_search(graph, start, end, Weight=1.0, Max_Depth=None, Heuristic=None, workspace=None, stats=None):
+    """
+    Runs weighted A* (f = g + Weight * h) on a prebuilt GridGraph.
+
+    Inflating the heuristic pulls the search towards the goal, so it expands
+    fewer nodes; with a consistent heuristic the path is at most Weight times
+    longer than optimal. Expanded nodes are never reopened. Weight = 1 is plain A*.
+    A stats dict receives the same counters as search_graph's.
+
+    Args:
+        graph (GridGraph): Flattened grid built once per map
+        start (tuple[int, int]): Starting tile
+        end (tuple[int, int]): Goal tile
+        Weight (float): Suboptimality bound w >= 1
+        Max_Depth (int, optional): Maximum nodes allowed to be expanded
+        Heuristic (LandmarkHeuristic, optional): Supplies per-goal estimate tables instead of Manhattan distance
+        workspace (SearchWorkspace, optional): Arrays reused across searches; borrowed from the shared pool if omitted
+        stats (dict, optional): Receives the search counters (see engines.counters)
+
+    Returns:
+        tuple[List[tuple[int, int]], int]: The final path (if any) and number of nodes explored
+    """
+    if workspace is not None:
+        return _weighted_search(graph, start, end, Weight, Max_Depth, Heuristic, workspace, stats)
+
+    workspace = default_pool.acquire(graph.size)
+    try:
+        return _weighted_search(graph, start, end, Weight, Max_Depth, Heuristic, workspace, stats)
+    finally:
+        default_pool.release(workspace)
+
+
+def _weighted_search(graph, start, end, Weight, Max_Depth, Heuristic, workspace, stats):
+    width = graph.width
+    offsets = graph.offsets
+    targets = graph.targets
+    start_node = graph.to_node(start)
+    end_node = graph.to_node(end)
+    h_table = Heuristic.table_to(end_node) if Heuristic is not None else graph.manhattan_table(end_node)
+
+    generation = workspace.begin()
+    g_score = workspace.g_score
+    came_from = workspace.came_from
+    seen = workspace.seen
+    closed_set = workspace.closed
+
+    open_set = workspace.heap
+    open_set.append((0, start_node))
+    g_score[start_node] = 0
+    seen[start_node] = generation
+    explored_count = 0
+
+    # Counters are plain locals, copied into stats on the way out as in search_graph
+    pushes, stale_pops, peak_open, reopens = 1, 0, 1, 0
+    try:
+        while open_set:
+            if len(open_set) > peak_open:
+                peak_open = len(open_set)
+            _, current = heapq.heappop(open_set)
+
+            if closed_set[current] == generation:
+                stale_pops += 1
+                continue
+            closed_set[current] = generation
+            explored_count += 1
+
+            if Max_Depth is not None and explored_count > Max_Depth:
+                return None, explored_count
+
+            if current == end_node:
+                return trace_path(came_from, start_node, current, start, width), explored_count
+
+            new_cost = g_score[current] + 1  # Assume all moves cost 1
+            for index in range(offsets[current], offsets[current + 1]):
+                neighbour = targets[index]
+
+                if closed_set[neighbour] == generation:
+                    continue
+                if seen[neighbour] != generation:
+                    seen[neighbour] = generation
+                elif new_cost < g_score[neighbour]:
+                    reopens += 1
+                else:
+                    continue
+
+                came_from[neighbour] = current
+                g_score[neighbour] = new_cost
+                heapq.heappush(open_set, (new_cost + Weight * h_table[neighbour], neighbour))
+                pushes += 1
+
+        return None, explored_count  # No path found
+    finally:
+        if stats is not None:
+            stats.update(pushes=pushes, stale_pops=stale_pops, peak_open=peak_open, reopens=reopens,
+                         frontier=len(open_set), closed=explored_count)
+
+
+def focal_search(graph, start, end, Weight=1.0, Max_Depth=None, Heuristic=None, stats=None):
+    """
+    Runs focal search (A*epsilon) on a prebuilt GridGraph.
+
+    The open list stays ordered by f = g + h, but the next node is chosen from
+    the focal list: every open node with f <= Weight * (smallest open f). Among
+    those, the node with the smallest h (closest to the goal) is expanded.
+    Nodes reached again by a shorter route are reopened, which keeps the path
+    within Weight times the optimal length.
+
+    A stats dict receives the same counters as search_graph's, taken on the
+    f-ordered open list; stale pops also count discarded focal entries.
+
+    Args:
+        graph (GridGraph): Flattened grid built once per map
+        start (tuple[int, int]): Starting tile
+        end (tuple[int, int]): Goal tile
+        Weight (float): Suboptimality bound w >= 1
+        Max_Depth (int, optional): Maximum nodes allowed to be expanded
+        Heuristic (LandmarkHeuristic, optional): Supplies per-goal estimate tables instead of Manhattan distance
+        stats (dict, optional): Receives the search counters (see engines.counters)
+
+    Returns:
+        tuple[List[tuple[int, int]], int]: The final path (if any) and number of nodes explored
+    """
+    width = graph.width
+    offsets = graph.offsets
+    targets = graph.targets
+    start_node = graph.to_node(start)
+    end_node = graph.to_node(end)
+    h_table = Heuristic.table_to(end_node) if Heuristic is not None else graph.manhattan_table(end_node)
+
+    g_score = {start_node: 0}
+    came_from = {}
+    closed_set = set()
+
+    # Heap entries are only valid while the node is open with that same g
+    open_heap = [(h_table[start_node], start_node, 0)]  # All open nodes by f
+    pending = [(h_table[start_node], start_node, 0)]  # Open nodes not yet moved into focal, by f
+    focal = []  # (h, -g, node, g)
+    explored_count = 0
+
+    def is_open(node, g):
+        return node not in closed_set and g_score[node] == g
+
+    pushes, stale_pops, peak_open, reopens = 1, 0, 1, 0
+    try:
+        while True:
+            if len(open_heap) > peak_open:
+                peak_open = len(open_heap)
+            while open_heap and not is_open(open_heap[0][1], open_heap[0][2]):
+                heapq.heappop(open_heap)
+                stale_pops += 1
+            if not open_heap:
+                return None, explored_count  # No path found
+
+            bound = Weight * open_heap[0][0]
+            while pending and pending[0][0] <= bound:
+                _, node, g = heapq.heappop(pending)
+                if is_open(node, g):
+                    heapq.heappush(focal, (h_table[node], -g, node, g))
+
+            _, _, current, current_g = heapq.heappop(focal)
+            if not is_open(current, current_g):
+                stale_pops += 1
+                continue
+
+            closed_set.add(current)
+            explored_count += 1
+
+            if Max_Depth is not None and explored_count > Max_Depth:
+                return None, explored_count
+
+            if current == end_node:
+                path = []
+                while current != start_node:
+                    path.append(divmod(current, width))
+                    current = came_from[current]
+                path.append(start)
+                path.reverse()
+                return path, explored_count
+
+            new_cost = current_g + 1  # Assume all moves cost 1
+            for index in range(offsets[current], offsets[current + 1]):
+                neighbour = targets[index]
+                old_cost = g_score.get(neighbour)
+
+                if old_cost is None or new_cost < old_cost:
+                    if old_cost is not None:
+                        reopens += 1
+                    closed_set.discard(neighbour)  # Reopen if it was reached by a longer route
+                    came_from[neighbour] = current
+                    g_score[neighbour] = new_cost
+                    f = new_cost + h_table[neighbour]
+                    heapq.heappush(open_heap, (f, neighbour, new_cost))
+                    pushes += 1
+                    if f <= bound:
+                        heapq.heappush(focal, (h_table[neighbour], -new_cost, neighbour, new_cost))
+                    else:
+                        heapq.heappush(pending, (f, neighbour, new_cost))
+    finally:
+        if stats is not None:
+            stats.update(pushes=pushes, stale_pops=stale_pops, peak_open=peak_open, reopens=reopens,
+                         frontier=len(open_heap), closed=len(closed_set))
+
+
+# Bounded-suboptimal modes used by the "bounded" benchmark agent
+BOUNDED_MODES = {
+    "weighted": weighted_search,
+    "focal": focal_search,
+}
+
+BOUNDED_MODE_LABELS = {
+    "weighted": "Weighted A*",
+    "focal": "Focal Search (A*ε)",
+}
+
+
+def run_bounded(mode, graph, start, end, Weight=1.0, Max_Depth=None, Heuristic=None, stats=None):
+    """
+    Runs one of the bounded-suboptimal modes on a prebuilt GridGraph.
+
+    Raises:
+        ValueError: If the mode is unknown or Weight is below 1
+    """
+    if mode not in BOUNDED_MODES:
+        raise ValueError(f"Unknown bounded search mode: {mode}")
+    if Weight < 1:
+        raise ValueError(f"Weight must be at least 1, got {Weight}")
+
+    return BOUNDED_MODES[mode](graph, start, end, Weight=Weight, Max_Depth=Max_Depth, Heuristic=Heuristic,
+                               stats=stats)
@@ -0,0 +1,101 @@
+import random
+import time
+
+from engines.grid_graph import GridGraph, search_graph
+from engines.incremental import IncrementalPlanner
+
+DEFAULT_CHURN_CHANGES = 10  # --churn 0 benchmarks the dynamic agent on the static map instead
+DEFAULT_CHURN_CELLS = 10  # Tiles toggled per change, like the D key in the simulation
+DEFAULT_ADD_FRACTION = 0.5
+MAX_DRAWS = 100  # Random draws per toggle before giving up on finding a tile of the wanted kind
+
+
+def churn_stream(grid, start, end, changes, cells_per_change=DEFAULT_CHURN_CELLS, add_fraction=DEFAULT_ADD_FRACTION,
+                 seed=None):
+    """
+    Generates a seeded stream of wall changes, applying each one to the grid before it is yielded.
+
+    Every change toggles up to cells_per_change tiles. Each toggle adds a wall
+    to an empty tile with probability add_fraction and removes an existing
+    wall otherwise; tiles are drawn uniformly over the map, like the D key in
+    the simulation, and the start and goal are never touched. The same grid
+    and seed always give the same stream.
+
+    Args:
+        grid (List[List[int]]): The map grid, modified in place (0 = walkable, 1 = wall)
+        start (tuple[int, int]): Starting tile
+        end (tuple[int, int]): Goal tile
+        changes (int): Number of changes to generate
+        cells_per_change (int): Tiles toggled per change
+        add_fraction (float): Share of toggles that add a wall
+        seed (int, optional): Seed for the stream
+
+    Yields:
+        List[tuple[int, int]]: The tiles toggled by each change
+    """
+    rng = random.Random(seed)
+    height, width = len(grid), len(grid[0])
+
+    for _ in range(changes):
+        changed = []
+        for _ in range(cells_per_change):
+            add_wall = rng.random() < add_fraction
+            for _ in range(MAX_DRAWS):
+                pos = (rng.randrange(height), rng.randrange(width))
+                if pos != start and pos != end and (grid[pos[0]][pos[1]] != 1) == add_wall and pos not in changed:
+                    break
+            else:
+                continue  # No tile of the wanted kind turned up
+
+            grid[pos[0]][pos[1]] = 1 if add_wall else 0
+            changed.append(pos)
+        yield changed
+
+
+def replay_churn(grid, start, end, changes, cells_per_change=DEFAULT_CHURN_CELLS, add_fraction=DEFAULT_ADD_FRACTION,
+                 seed=None, reference=True):
+    """
+    Plans once with the incremental (LPA*) planner, then replays a churn stream
+    and repairs the plan after every change.
+
+    Only the planner's own work is timed. With reference=True every state of
+    the map is also solved by a fresh A* search (timed separately), which gives
+    the cost of replanning from zero and the optimal path length the repaired
+    path must match.
+
+    Args:
+        grid (List[List[int]]): The map grid, modified in place as the changes are applied
+        start (tuple[int, int]): Starting tile
+        end (tuple[int, int]): Goal tile
+        changes (int): Number of changes to replay
+        cells_per_change (int): Tiles toggled per change
+        add_fraction (float): Share of toggles that add a wall
+        seed (int, optional): Seed for the churn stream
+        reference (bool): Also run a fresh A* search after every change
+
+    Yields:
+        dict: The initial plan (change 0), then one entry per change, with the
+        cells changed, path, nodes (re-)expanded and seconds taken, plus
+        fresh_expanded, fresh_seconds and fresh_length with reference=True
+    """
+    planner = IncrementalPlanner(grid, start, end)
+    stream = churn_stream(grid, start, end, changes, cells_per_change, add_fraction, seed=seed)
+
+    for change in range(changes + 1):
+        cells = next(stream) if change else []
+
+        start_time = time.perf_counter()
+        path, expanded = planner.update_cells(cells) if change else planner.plan()
+        seconds = time.perf_counter() - start_time
+
+        step = {"change": change, "cells": cells, "path": path, "expanded": expanded, "seconds": seconds}
+
+        if reference:
+            graph = GridGraph(grid)  # Built outside the timed section, like a batch's map
+            start_time = time.perf_counter()
+            fresh_path, fresh_expanded = search_graph(graph, start, end)
+            step["fresh_seconds"] = time.perf_counter() - start_time
+            step["fresh_expanded"] = fresh_expanded
+            step["fresh_length"] = len(fresh_path) if fresh_path else -1
+
+        yield step
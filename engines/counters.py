@@ -0,0 +1,71 @@
+import math
+
+# Search-internals counters reported in the `stats` dict of the A* engines:
+#   pushes            Entries added to the open list (including the start node)
+#   stale_pops        Entries popped for nodes that were already expanded (wasted queue work)
+#   peak_open         Largest open-list size seen during the search
+#   reopens           Times a node already reached was given a cheaper g-value
+#   branching_factor  Effective branching factor b*, solving N + 1 = 1 + b* + ... + b*^d
+#                     for N expanded nodes and a solution of d moves
+SEARCH_COUNTERS = ("pushes", "stale_pops", "peak_open", "reopens", "branching_factor")
+
+MAX_NEWTON_STEPS = 30  # Cap on the branching factor solver (it usually settles in under 10)
+
+# Column names used in the metrics CSVs
+COUNTER_COLUMNS = {
+    "pushes": "Heap Pushes",
+    "stale_pops": "Stale Pops",
+    "peak_open": "Peak Open",
+    "reopens": "Reopens",
+    "branching_factor": "Branching Factor",
+}
+
+
+def _geometric_sum(b, depth):
+    # 1 + b + ... + b^d and its derivative, in closed form; expm1/log1p keep it accurate near b = 1
+    e = b - 1
+    if abs(e) < 1e-8:
+        return depth + 1 + e * depth * (depth + 1) / 2, depth * (depth + 1) / 2
+    total = math.expm1((depth + 1) * math.log1p(e)) / e
+    return total, ((depth + 1) * b ** depth - total) / e
+
+
+def effective_branching_factor(expanded, depth, tolerance=1e-6, max_iterations=MAX_NEWTON_STEPS):
+    """
+    Solves N + 1 = 1 + b + b^2 + ... + b^d for b with Newton's method.
+
+    The sum is convex in b, so starting above the root ((N + 1)^(1/d) bounds it)
+    every step moves down towards it without overshooting. Each step costs O(1)
+    through the closed form of the geometric sum, and the number of steps is capped.
+
+    Args:
+        expanded (int): Nodes expanded (N)
+        depth (int): Moves in the solution (d)
+
+    Returns:
+        float | None: The effective branching factor, or None without a solution
+    """
+    if not expanded or not depth or depth < 1:
+        return None
+
+    target = expanded + 1
+    b = target ** (1.0 / depth)
+    for _ in range(max_iterations):
+        total, slope = _geometric_sum(b, depth)
+        step = (total - target) / slope
+        b -= step
+        if abs(step) < tolerance:
+            break
+    return round(b, 4)
+
+
+def finish_counters(stats, path, explored):
+    """
+    Adds the effective branching factor to a stats dict once the search is over.
+
+    Call it outside any timed section: the engines only collect the raw counters.
+    """
+    if stats is None:
+        return
+    depth = len(path) - 1 if path else None
+    stats["branching_factor"] = effective_branching_factor(explored, depth)
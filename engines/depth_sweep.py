@@ -0,0 +1,63 @@
+import time
+
+from engines.grid_graph import search_graph
+
+
+class DepthTrace:
+    def __init__(self, graph, start, end, Heuristic=None, open_list="heap"):
+        """
+        Runs one unlimited A* search and records its expansion order.
+
+        Without noise the expansion order is deterministic, so a search limited
+        to Max_Depth = N is exactly this order cut off at position N. Every depth
+        budget can therefore be answered from a single trace.
+
+        Args:
+            graph (GridGraph): Flattened map grid
+            start (tuple[int, int]): Starting tile
+            end (tuple[int, int]): Goal tile
+            Heuristic (LandmarkHeuristic, optional): Replaces the Manhattan heuristic
+            open_list (str, optional): Open list used by the traced search, see engines.open_list
+        """
+        self.start = start
+        self.end = end
+        self.expansion_order = []
+
+        start_time = time.perf_counter()
+        self.path, _ = search_graph(
+            graph, start, end, expansion_order=self.expansion_order, Heuristic=Heuristic, open_list=open_list)
+        self.search_time = time.perf_counter() - start_time
+
+    @property
+    def total_expanded(self):
+        return len(self.expansion_order)
+
+    def result(self, Max_Depth):
+        """
+        Returns what A_Star_Search(..., Max_Depth=Max_Depth) would have returned.
+
+        Args:
+            Max_Depth (int | None): Maximum nodes allowed to be expanded
+
+        Returns:
+            tuple[List[tuple[int, int]], int]: The path (if any) and number of nodes explored
+        """
+        if Max_Depth is None or self.total_expanded <= Max_Depth:
+            # The full search fits inside the budget
+            path = list(self.path) if self.path is not None else None
+            return path, self.total_expanded
+
+        # The budget runs out before the search finishes: the limited search
+        # expands one node past the budget and then gives up
+        return None, Max_Depth + 1
+
+
+def sweep_depths(graph, start, end, depths, Heuristic=None, open_list="heap"):
+    """
+    Answers every depth budget in `depths` from a single traced search.
+
+    Returns:
+        dict[int, tuple[List[tuple[int, int]], int]]: (path, nodes explored) per depth
+    """
+    trace = DepthTrace(graph, start, end, Heuristic=Heuristic, open_list=open_list)
+    return {depth: trace.result(depth) for depth in depths}
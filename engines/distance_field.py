@@ -0,0 +1,167 @@
+import numpy as np
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
+
+
+def open_mask_from_grid(grid):
+    """
+    Converts a list-of-lists grid into a boolean NumPy mask (True = walkable).
+    """
+    return np.asarray(grid, dtype=np.int8) != 1
+
+
+def distance_field(open_mask, goal, targets=None):
+    """
+    Computes BFS distances to the goal with a vectorised wavefront.
+
+    Each step shifts the whole frontier one tile in the four directions at once,
+    so the Python loop runs once per distance level rather than once per cell.
+
+    Args:
+        open_mask (np.ndarray): Boolean grid, True where the tile is walkable
+        goal (tuple[int, int]): Goal tile
+        targets (List[tuple[int, int]], optional): Stop as soon as all of these are labelled
+
+    Returns:
+        np.ndarray: int32 distances to the goal, -1 where unreachable (or not yet reached)
+    """
+    dist = np.full(open_mask.shape, -1, dtype=np.int32)
+    if not open_mask[goal]:
+        return dist  # The goal can never be entered
+
+    dist[goal] = 0
+    frontier = np.zeros(open_mask.shape, dtype=bool)
+    frontier[goal] = True
+    pending = np.array(sorted(targets), dtype=np.intp).reshape(-1, 2) if targets else None
+    step = 0
+
+    while frontier.any():
+        if pending is not None:
+            pending = pending[dist[pending[:, 0], pending[:, 1]] < 0]
+            if not len(pending):
+                break
+
+        step += 1
+        wave = np.zeros_like(frontier)
+        wave[1:, :] |= frontier[:-1, :]
+        wave[:-1, :] |= frontier[1:, :]
+        wave[:, 1:] |= frontier[:, :-1]
+        wave[:, :-1] |= frontier[:, 1:]
+        wave &= open_mask
+        wave &= dist < 0
+
+        dist[wave] = step
+        frontier = wave
+
+    return dist
+
+
+def _start_distance(dist, start):
+    """
+    Distance from start to goal. A start on a wall may still step off onto open tiles.
+    """
+    if dist[start] >= 0:
+        return int(dist[start])
+
+    rows, cols = dist.shape
+    best = -1
+    for dr, dc in DIRECTIONS:
+        r, c = start[0] + dr, start[1] + dc
+        if 0 <= r < rows and 0 <= c < cols and dist[r, c] >= 0:
+            if best == -1 or dist[r, c] + 1 < best:
+                best = int(dist[r, c]) + 1
+    return best
+
+
+def descend_gradient(dist, start, start_distance):
+    """
+    Follows the distance field downhill from start to the goal.
+
+    Returns:
+        List[tuple[int, int]]: Path from start to goal, one tile per step
+    """
+    rows, cols = dist.shape
+    path = [start]
+    current = start
+    remaining = start_distance
+
+    while remaining > 0:
+        remaining -= 1
+        for dr, dc in DIRECTIONS:
+            r, c = current[0] + dr, current[1] + dc
+            if 0 <= r < rows and 0 <= c < cols and dist[r, c] == remaining:
+                current = (r, c)
+                break
+        path.append(current)
+
+    return path
+
+
+def _field_targets(open_mask, starts):
+    """
+    Tiles that must be labelled before every start's distance is known.
+    A start on a wall depends on its open neighbours instead of itself.
+    """
+    rows, cols = open_mask.shape
+    targets = set()
+    for start in starts:
+        if open_mask[start]:
+            targets.add(start)
+            continue
+        for dr, dc in DIRECTIONS:
+            r, c = start[0] + dr, start[1] + dc
+            if 0 <= r < rows and 0 <= c < cols and open_mask[r, c]:
+                targets.add((r, c))
+    return targets
+
+
+def batch_search(grid, pairs):
+    """
+    Answers many (start, end) queries on the same grid with one distance field per goal.
+
+    Pairs are grouped by goal. For each goal a BFS distance field is grown only
+    until every start in the group is labelled, and each path is read off by
+    descending the gradient. Nodes explored for a pair is the number of tiles a
+    BFS from the goal settles up to that start's distance (or the whole
+    reachable area when the start is unreachable).
+
+    Args:
+        grid (List[List[int]] | np.ndarray): The map grid (0 = walkable, 1 = wall)
+        pairs (List[tuple[tuple[int, int], tuple[int, int]]]): (start, end) queries
+
+    Returns:
+        List[tuple[List[tuple[int, int]] | None, int]]: (path, nodes explored) per pair, in input order
+    """
+    open_mask = open_mask_from_grid(grid)
+    results = [None] * len(pairs)
+
+    by_goal = {}
+    for index, (start, end) in enumerate(pairs):
+        by_goal.setdefault(tuple(end), []).append(index)
+
+    for goal, indices in by_goal.items():
+        starts = [tuple(pairs[i][0]) for i in indices]
+        dist = distance_field(open_mask, goal, targets=_field_targets(open_mask, starts))
+        full_area = None
+
+        # settled[d] = number of tiles with distance <= d
+        labelled = dist[dist >= 0]
+        settled = np.cumsum(np.bincount(labelled)) if labelled.size else np.zeros(1, dtype=np.int64)
+
+        for index, start in zip(indices, starts):
+            if start == goal:
+                results[index] = ([start], 1)
+                continue
+
+            start_distance = _start_distance(dist, start)
+            if start_distance < 0:
+                if full_area is None:
+                    # Finish the wavefront so the count reflects the whole reachable area
+                    full_area = int((distance_field(open_mask, goal) >= 0).sum())
+                results[index] = (None, full_area)
+                continue
+
+            explored = int(settled[min(start_distance, len(settled) - 1)])
+            results[index] = (descend_gradient(dist, start, start_distance), explored)
+
+    return results
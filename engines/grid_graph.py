@@ -0,0 +1,329 @@
+import heapq
+import random
+from array import array
+
+import numpy as np
+
+from engines.open_list import make_open_list
+from engines.workspace import default_pool
+
+MAX_CACHED_GOALS = 4
+
+
+class GridGraph:
+    def __init__(self, grid):
+        """
+        Flattens a list-of-lists grid into a compact, integer-indexed graph.
+
+        Each cell is numbered row-major (node = row * width + col), so ordering
+        node ids matches ordering (row, col) tuples. Neighbours are stored once
+        in a CSR-style table: the neighbours of node n are
+        targets[offsets[n]:offsets[n + 1]], in the same Up, Down, Left, Right
+        order used by lookahead.get_Neighbours.
+
+        Args:
+            grid (List[List[int]]): The map grid (0 = walkable, 1 = wall)
+        """
+        self.height = len(grid)
+        self.width = len(grid[0]) if grid else 0
+        self.size = self.height * self.width
+
+        walls = np.array(grid, dtype=np.int64).reshape(self.height, self.width) == 1 if self.size else None
+
+        # 1 byte per cell; 1 = wall
+        self.cells = bytearray(walls.astype(np.uint8).tobytes()) if self.size else bytearray()
+
+        self.offsets = array("i", bytes(4 * (self.size + 1)))
+        self.targets = array("i")
+        if self.size:
+            self._build_neighbour_table(walls)
+
+        # Manhattan distance tables for recently requested goals
+        self._h_tables = {}
+
+    def _build_neighbour_table(self, walls):
+        """
+        Fills the CSR offsets/targets arrays with every walkable neighbour of every cell.
+
+        Vectorised over the whole grid: one boolean mask per direction marks the
+        cells whose neighbour that way is walkable, and reading the (cells, 4)
+        mask row by row keeps the Up, Down, Left, Right order within each cell.
+        """
+        width, height = self.width, self.height
+        open_cells = ~walls
+        has = np.zeros((height, width, 4), dtype=bool)
+        has[1:, :, 0] = open_cells[:-1, :]  # Up
+        has[:-1, :, 1] = open_cells[1:, :]  # Down
+        has[:, 1:, 2] = open_cells[:, :-1]  # Left
+        has[:, :-1, 3] = open_cells[:, 1:]  # Right
+        has = has.reshape(self.size, 4)
+
+        steps = np.array([-width, width, -1, 1], dtype=np.int64)
+        nodes = np.arange(self.size, dtype=np.int64)[:, None]
+        targets = (nodes + steps)[has]
+
+        offsets = np.zeros(self.size + 1, dtype=np.int32)
+        np.cumsum(has.sum(axis=1), out=offsets[1:])
+        self.offsets = array("i", offsets.tobytes())
+        self.targets = array("i", targets.astype(np.int32).tobytes())
+
+    def to_node(self, pos):
+        """
+        Converts a (row, col) position into its integer node id.
+        """
+        return pos[0] * self.width + pos[1]
+
+    def to_pos(self, node):
+        """
+        Converts an integer node id back into a (row, col) position.
+        """
+        return divmod(node, self.width)
+
+    def is_wall(self, node):
+        return self.cells[node] == 1
+
+    def neighbours(self, node):
+        """
+        Returns the walkable neighbour ids of a node as an array slice.
+        """
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def manhattan_table(self, goal):
+        """
+        Returns the Manhattan distance from every node to the goal node.
+
+        Tables are cached per graph for a handful of goals, so repeated searches
+        towards the same goal only pay for it once.
+
+        Args:
+            goal (int): Goal node id
+
+        Returns:
+            array[int]: Distance to goal, indexed by node id
+        """
+        table = self._h_tables.get(goal)
+        if table is None:
+            if len(self._h_tables) >= MAX_CACHED_GOALS:
+                self._h_tables.clear()
+            goal_row, goal_col = divmod(goal, self.width)
+            row_dist = [abs(row - goal_row) for row in range(self.height)]
+            col_dist = [abs(col - goal_col) for col in range(self.width)]
+            table = array("i", [dr + dc for dr in row_dist for dc in col_dist])
+            self._h_tables[goal] = table
+        return table
+
+
+def search_graph(graph, start, end, Noise_Level=0, Max_Depth=None, expansion_order=None, Heuristic=None,
+                 open_list="heap", workspace=None, stats=None):
+    """
+    Runs A* on a prebuilt GridGraph with optional noise and depth limit.
+
+    Behaves exactly like lookahead.A_Star_Search (same expansion order, same
+    tie-breaking and the same number of random draws for the noisy heuristic),
+    but works on integer node ids with preallocated score and parent arrays
+    instead of tuple-keyed dictionaries.
+
+    open_list="bucket" swaps the binary heap for a bucket queue that breaks f
+    ties towards larger g. That expands fewer nodes, but in a different order
+    than A_Star_Search; noisy searches always use the heap.
+
+    The arrays come from a SearchWorkspace that is reset in O(1) between
+    searches. Without one, a workspace is borrowed from the shared pool.
+
+    If a stats dict is given it receives the raw counters listed in engines.counters
+    (pushes, stale pops, peak open-list size, reopens), plus the final sizes of
+    the frontier (open-list entries) and the closed set. The branching factor is
+    left to engines.counters.finish_counters, outside the search.
+
+    Args:
+        graph (GridGraph): Flattened grid built once per map
+        start (tuple[int, int]): Starting tile
+        end (tuple[int, int]): Goal tile
+        Noise_Level (int, optional): Adds randomness to the heuristic
+        Max_Depth (int, optional): Maximum nodes allowed to be expanded
+        expansion_order (list, optional): If given, every expanded node id is appended to it
+        Heuristic (LandmarkHeuristic, optional): Supplies per-goal estimate tables instead of Manhattan distance
+        open_list (str, optional): "heap" (default) or "bucket", see engines.open_list
+        workspace (SearchWorkspace, optional): Arrays sized to graph.size, reused across searches
+        stats (dict, optional): Receives the search counters
+
+    Returns:
+        tuple[List[tuple[int, int]], int]: The final path (if any) and number of nodes explored
+    """
+    if workspace is not None:
+        result = _search(
+            graph, start, end, Noise_Level, Max_Depth, expansion_order, Heuristic, open_list, workspace, stats)
+    else:
+        workspace = default_pool.acquire(graph.size)
+        try:
+            result = _search(
+                graph, start, end, Noise_Level, Max_Depth, expansion_order, Heuristic, open_list, workspace, stats)
+        finally:
+            default_pool.release(workspace)
+    return result
+
+
+def _search(graph, start, end, Noise_Level, Max_Depth, expansion_order, Heuristic, open_list, workspace, stats):
+    # The heap search keeps its own copy of the _search_open_list loop on purpose: with heapq inlined it runs
+    # 20-25% faster than through an open-list object's push/pop methods (256x256 random, maze and rooms maps).
+    # A change to one loop belongs in the other; the engine tests check they agree
+    noisy = bool(Noise_Level and Noise_Level > 0)
+    if open_list != "heap" and not noisy:
+        return _search_open_list(
+            graph, start, end, make_open_list(open_list), Max_Depth, expansion_order, Heuristic, workspace, stats)
+
+    width = graph.width
+    offsets = graph.offsets
+    targets = graph.targets
+    start_node = graph.to_node(start)
+    end_node = graph.to_node(end)
+    h_table = Heuristic.table_to(end_node) if Heuristic is not None else graph.manhattan_table(end_node)
+
+    generation = workspace.begin()
+    g_score = workspace.g_score
+    came_from = workspace.came_from
+    seen = workspace.seen
+    closed_set = workspace.closed
+
+    if noisy:
+        # A_Star_Search draws once for the start tile; keep the RNG stream aligned
+        low, high = -Noise_Level / 10, Noise_Level / 10
+        random.uniform(low, high)
+
+    open_set = workspace.heap
+    open_set.append((0, start_node))
+    g_score[start_node] = 0
+    seen[start_node] = generation
+    explored_count = 0
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    uniform = random.uniform
+
+    # Counters are plain locals; they are only copied into stats on the way out
+    pushes, stale_pops, peak_open, reopens = 1, 0, 1, 0
+    try:
+        while open_set:
+            if len(open_set) > peak_open:
+                peak_open = len(open_set)
+            _, current = heappop(open_set)
+
+            if closed_set[current] == generation:
+                stale_pops += 1
+                continue
+            closed_set[current] = generation
+            explored_count += 1
+            if expansion_order is not None:
+                expansion_order.append(current)
+
+            if Max_Depth is not None and explored_count > Max_Depth:
+                return None, explored_count
+
+            if current == end_node:
+                return trace_path(came_from, start_node, current, start, width), explored_count
+
+            new_cost = g_score[current] + 1  # Assume all moves cost 1
+            for index in range(offsets[current], offsets[current + 1]):
+                neighbour = targets[index]
+
+                if seen[neighbour] != generation:
+                    seen[neighbour] = generation
+                elif new_cost < g_score[neighbour]:
+                    reopens += 1
+                else:
+                    continue
+
+                came_from[neighbour] = current
+                g_score[neighbour] = new_cost
+                if noisy:
+                    total_estimate = new_cost + h_table[neighbour] * (1 + uniform(low, high))
+                else:
+                    total_estimate = new_cost + h_table[neighbour]
+                heappush(open_set, (total_estimate, neighbour))
+                pushes += 1
+
+        return None, explored_count  # No path found
+    finally:
+        if stats is not None:
+            stats.update(pushes=pushes, stale_pops=stale_pops, peak_open=peak_open, reopens=reopens,
+                         frontier=len(open_set), closed=explored_count)
+
+
+def _search_open_list(graph, start, end, open_set, Max_Depth, expansion_order, Heuristic, workspace, stats):
+    """
+    Noise-free search_graph on a pluggable open list (integer f-values only).
+    """
+    width = graph.width
+    offsets = graph.offsets
+    targets = graph.targets
+    start_node = graph.to_node(start)
+    end_node = graph.to_node(end)
+    h_table = Heuristic.table_to(end_node) if Heuristic is not None else graph.manhattan_table(end_node)
+
+    generation = workspace.begin()
+    g_score = workspace.g_score
+    came_from = workspace.came_from
+    seen = workspace.seen
+    closed_set = workspace.closed
+
+    push = open_set.push
+    pop = open_set.pop
+    push(start_node, 0, 0)
+    g_score[start_node] = 0
+    seen[start_node] = generation
+    explored_count = 0
+
+    pushes, stale_pops, peak_open, reopens = 1, 0, 1, 0
+    try:
+        while open_set:
+            if len(open_set) > peak_open:
+                peak_open = len(open_set)
+            current = pop()
+
+            if closed_set[current] == generation:
+                stale_pops += 1
+                continue
+            closed_set[current] = generation
+            explored_count += 1
+            if expansion_order is not None:
+                expansion_order.append(current)
+
+            if Max_Depth is not None and explored_count > Max_Depth:
+                return None, explored_count
+
+            if current == end_node:
+                return trace_path(came_from, start_node, current, start, width), explored_count
+
+            new_cost = g_score[current] + 1  # Assume all moves cost 1
+            for index in range(offsets[current], offsets[current + 1]):
+                neighbour = targets[index]
+
+                if seen[neighbour] != generation:
+                    seen[neighbour] = generation
+                elif new_cost < g_score[neighbour]:
+                    reopens += 1
+                else:
+                    continue
+
+                came_from[neighbour] = current
+                g_score[neighbour] = new_cost
+                push(neighbour, new_cost + h_table[neighbour], new_cost)
+                pushes += 1
+
+        return None, explored_count  # No path found
+    finally:
+        if stats is not None:
+            stats.update(pushes=pushes, stale_pops=stale_pops, peak_open=peak_open, reopens=reopens,
+                         frontier=len(open_set), closed=explored_count)
+
+
+def trace_path(came_from, start_node, current, start, width):
+    """
+    Follows parent links back from the goal and returns the path start-first.
+    """
+    path = []
+    while current != start_node:
+        path.append(divmod(current, width))
+        current = came_from[current]
+    path.append(start)
+    path.reverse()
+    return path
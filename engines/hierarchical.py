@@ -0,0 +1,473 @@
+import heapq
+import random
+from collections import deque
+from collections.abc import Sequence
+from itertools import chain
+
+DEFAULT_CLUSTER_SIZE = 16
+MAX_SINGLE_ENTRANCE = 6  # Openings at least this wide get a transition at each end
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
+
+
+class RefinedPath(Sequence):
+    def __init__(self, tiles, length):
+        """
+        Concrete path whose tiles are only produced when they are read.
+
+        The length is known up front (the cost of the abstract path), so len()
+        never refines anything; indexing or iterating pulls just enough tiles
+        from the refinement to reach the ones asked for, and keeps them.
+
+        Args:
+            tiles (Iterator[tuple[int, int]]): The path's tiles in order, e.g. from HierarchicalGrid.refine
+            length (int): Number of tiles the iterator yields
+        """
+        self._tiles = []
+        self._pending = tiles
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("path index out of range")
+
+        tiles = self._tiles
+        while len(tiles) <= index:
+            tiles.append(next(self._pending))
+        return tiles[index]
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self[index]
+
+
+class HierarchicalGrid:
+    def __init__(self, grid, cluster_size=DEFAULT_CLUSTER_SIZE):
+        """
+        Two-level HPA* abstraction of a grid.
+
+        The grid is split into square clusters. Wherever two neighbouring
+        clusters share an opening, transition tiles are placed on both sides
+        (one in the middle of short openings, one at each end of long ones).
+        Transition tiles inside a cluster are linked by their exact in-cluster
+        distance, which gives a small abstract graph to search before refining
+        the result back into tiles.
+
+        Args:
+            grid (List[List[int]]): Live reference to the map grid (0 = walkable, 1 = wall)
+            cluster_size (int): Width and height of each cluster in tiles
+        """
+        self.grid = grid
+        self.height = len(grid)
+        self.width = len(grid[0])
+        self.cluster_size = cluster_size
+        self.cluster_rows = -(-self.height // cluster_size)
+        self.cluster_cols = -(-self.width // cluster_size)
+
+        self.borders = {}      # Border key -> list of (tile, tile) transition pairs
+        self.inter_edges = {}  # Transition tile -> set of paired tiles across a border
+        self.intra_edges = {}  # Cluster -> {tile: {tile: distance}}
+
+        for key in self._all_borders():
+            self._build_border(key)
+        for cluster_row in range(self.cluster_rows):
+            for cluster_col in range(self.cluster_cols):
+                self._build_cluster((cluster_row, cluster_col))
+
+    # Layout helpers
+
+    def _is_walkable(self, pos):
+        row, col = pos
+        return 0 <= row < self.height and 0 <= col < self.width and self.grid[row][col] != 1
+
+    def cluster_of(self, pos):
+        return pos[0] // self.cluster_size, pos[1] // self.cluster_size
+
+    def _bounds(self, cluster):
+        top = cluster[0] * self.cluster_size
+        left = cluster[1] * self.cluster_size
+        return top, min(top + self.cluster_size, self.height), left, min(left + self.cluster_size, self.width)
+
+    def _all_borders(self):
+        for cluster_row in range(self.cluster_rows):
+            for cluster_col in range(self.cluster_cols):
+                if cluster_col + 1 < self.cluster_cols:
+                    yield (cluster_row, cluster_col), "right"
+                if cluster_row + 1 < self.cluster_rows:
+                    yield (cluster_row, cluster_col), "down"
+
+    def _border_clusters(self, key):
+        (cluster_row, cluster_col), side = key
+        if side == "right":
+            return (cluster_row, cluster_col), (cluster_row, cluster_col + 1)
+        return (cluster_row, cluster_col), (cluster_row + 1, cluster_col)
+
+    def _borders_of_cell(self, pos):
+        """
+        Borders whose transitions depend on this tile (it lies on the cluster edge).
+        """
+        cluster = self.cluster_of(pos)
+        top, bottom, left, right = self._bounds(cluster)
+        keys = []
+        if pos[1] == right - 1 and cluster[1] + 1 < self.cluster_cols:
+            keys.append((cluster, "right"))
+        if pos[1] == left and cluster[1] > 0:
+            keys.append(((cluster[0], cluster[1] - 1), "right"))
+        if pos[0] == bottom - 1 and cluster[0] + 1 < self.cluster_rows:
+            keys.append((cluster, "down"))
+        if pos[0] == top and cluster[0] > 0:
+            keys.append(((cluster[0] - 1, cluster[1]), "down"))
+        return keys
+
+    # Abstract graph construction
+
+    def _build_border(self, key):
+        """
+        Finds the openings along one border and places transition pairs on them.
+        """
+        for a, b in self.borders.get(key, []):
+            self.inter_edges.get(a, set()).discard(b)
+            self.inter_edges.get(b, set()).discard(a)
+
+        first, _ = self._border_clusters(key)
+        top, bottom, left, right = self._bounds(first)
+        if key[1] == "right":
+            pairs_along = [((row, right - 1), (row, right)) for row in range(top, bottom)]
+        else:
+            pairs_along = [((bottom - 1, col), (bottom, col)) for col in range(left, right)]
+
+        transitions = []
+        run = []
+        for pair in pairs_along + [None]:
+            if pair is not None and self._is_walkable(pair[0]) and self._is_walkable(pair[1]):
+                run.append(pair)
+                continue
+            if run:
+                if len(run) < MAX_SINGLE_ENTRANCE:
+                    transitions.append(run[len(run) // 2])
+                else:
+                    transitions.append(run[0])
+                    transitions.append(run[-1])
+                run = []
+
+        self.borders[key] = transitions
+        for a, b in transitions:
+            self.inter_edges.setdefault(a, set()).add(b)
+            self.inter_edges.setdefault(b, set()).add(a)
+
+    def _cluster_transitions(self, cluster):
+        top, bottom, left, right = self._bounds(cluster)
+        tiles = set()
+        for key in ((cluster, "right"), (cluster, "down"),
+                    ((cluster[0], cluster[1] - 1), "right"), ((cluster[0] - 1, cluster[1]), "down")):
+            for a, b in self.borders.get(key, []):
+                for tile in (a, b):
+                    if top <= tile[0] < bottom and left <= tile[1] < right:
+                        tiles.add(tile)
+        return tiles
+
+    def _build_cluster(self, cluster):
+        """
+        Links every pair of transition tiles in a cluster by their in-cluster distance.
+        """
+        tiles = self._cluster_transitions(cluster)
+        top, bottom, left, right = self._bounds(cluster)
+        width = right - left
+        size = (bottom - top) * width
+
+        # Flat local copy of the cluster so each BFS works on plain integer indices
+        open_tiles = [self.grid[row][col] != 1 for row in range(top, bottom) for col in range(left, right)]
+        local = {tile: (tile[0] - top) * width + (tile[1] - left) for tile in tiles}
+        tile_at = {index: tile for tile, index in local.items()}
+
+        edges = {}
+        for tile, source in local.items():
+            dist = [-1] * size
+            dist[source] = 0
+            queue = deque([source])
+            remaining = len(local) - 1
+            reached = {}
+
+            while queue and remaining:
+                current = queue.popleft()
+                cost = dist[current] + 1
+                col = current % width
+                for neighbour, ok in ((current - width, current >= width),
+                                      (current + width, current + width < size),
+                                      (current - 1, col > 0),
+                                      (current + 1, col < width - 1)):
+                    if ok and dist[neighbour] == -1 and open_tiles[neighbour]:
+                        dist[neighbour] = cost
+                        queue.append(neighbour)
+                        if neighbour in tile_at:
+                            reached[tile_at[neighbour]] = cost
+                            remaining -= 1
+
+            edges[tile] = reached
+        self.intra_edges[cluster] = edges
+
+    def _local_bfs(self, source, cluster, targets=None, goal=None):
+        """
+        Breadth-first search that never leaves the cluster.
+
+        Returns:
+            tuple[dict, dict, int]: Distances to reached targets (or goal), parents, tiles expanded
+        """
+        top, bottom, left, right = self._bounds(cluster)
+        parents = {source: None}
+        found = {}
+        queue = deque([(source, 0)])
+        expanded = 0
+
+        while queue:
+            current, cost = queue.popleft()
+            expanded += 1
+            if targets is not None and current in targets:
+                found[current] = cost
+            if current == goal:
+                found[current] = cost
+                break
+
+            for dr, dc in DIRECTIONS:
+                neighbour = (current[0] + dr, current[1] + dc)
+                if (neighbour not in parents and top <= neighbour[0] < bottom
+                        and left <= neighbour[1] < right and self._is_walkable(neighbour)):
+                    parents[neighbour] = current
+                    queue.append((neighbour, cost + 1))
+
+        return found, parents, expanded
+
+    def update_cell(self, pos):
+        """
+        Rebuilds only the clusters affected by a tile changing between wall and empty.
+
+        Suitable as a GridWorld wall listener (see attach).
+
+        Returns:
+            set[tuple[int, int]]: Clusters whose abstract edges were rebuilt
+        """
+        affected = {self.cluster_of(pos)}
+        for key in self._borders_of_cell(pos):
+            self._build_border(key)
+            affected.update(self._border_clusters(key))
+
+        for cluster in affected:
+            self._build_cluster(cluster)
+        return affected
+
+    def attach(self, grid_world):
+        """
+        Keeps the abstraction in sync with a GridWorld whenever Toggle_Wall changes a tile.
+        Replaces any abstraction attached to that GridWorld before.
+        """
+        grid_world.wall_listeners["hierarchy"] = self.update_cell
+
+    # Search
+
+    def _connect(self, pos):
+        """
+        Temporary abstract edges from a query tile to the transitions of its cluster.
+        """
+        cluster = self.cluster_of(pos)
+        tiles = set(self.intra_edges.get(cluster, {}))
+        distances, _, expanded = self._local_bfs(pos, cluster, targets=tiles)
+        return distances, expanded
+
+    def find_abstract_path(self, start, end, Noise_Level=0, Max_Depth=None, stats=None):
+        """
+        Searches the abstract graph between two tiles.
+
+        Max_Depth limits the tiles expanded to connect start and end to their
+        clusters plus the abstract nodes expanded.
+
+        Returns:
+            List[tuple[int, int]] | None: Abstract waypoints from start to end
+        """
+        return self._abstract_search(start, end, Noise_Level, Max_Depth, stats)[0]
+
+    def _abstract_search(self, start, end, Noise_Level, Max_Depth, stats, used=0):
+        # find_abstract_path, plus the path's cost: every abstract edge costs its exact tile distance.
+        # `used` is what the query already expanded, which also counts against Max_Depth
+        concrete = 0
+        start_edges, expanded = self._connect(start)
+        concrete += expanded
+        end_edges, expanded = self._connect(end)
+        concrete += expanded
+
+        if Max_Depth is not None and used + concrete > Max_Depth:
+            if stats is not None:
+                stats["concrete"] = stats.get("concrete", 0) + concrete
+            return None, None
+
+        if self.cluster_of(start) == self.cluster_of(end):
+            local, _, expanded = self._local_bfs(start, self.cluster_of(start), goal=end)
+            concrete += expanded
+            if end in local:
+                start_edges = dict(start_edges)
+                start_edges[end] = local[end]
+
+        noisy = bool(Noise_Level and Noise_Level > 0)
+        low, high = -Noise_Level / 10, Noise_Level / 10
+
+        def estimate(pos):
+            base = abs(pos[0] - end[0]) + abs(pos[1] - end[1])
+            return base * (1 + random.uniform(low, high)) if noisy else base
+
+        open_set = [(estimate(start), start)]
+        g_score = {start: 0}
+        came_from = {}
+        closed_set = set()
+        abstract = 0
+        path = None
+        cost = None
+
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            if current in closed_set:
+                continue
+            closed_set.add(current)
+            abstract += 1
+
+            if Max_Depth is not None and used + concrete + abstract > Max_Depth:
+                break
+
+            if current == end:
+                cost = g_score[end]
+                path = [current]
+                while current in came_from:
+                    current = came_from[current]
+                    path.append(current)
+                path.reverse()
+                break
+
+            if current == start:
+                edges = list(start_edges.items())
+            else:
+                edges = list(self.intra_edges[self.cluster_of(current)].get(current, {}).items())
+            edges += [(other, 1) for other in self.inter_edges.get(current, ())]
+            if current in end_edges:
+                edges.append((end, end_edges[current]))
+
+            for neighbour, edge_cost in edges:
+                new_cost = g_score[current] + edge_cost
+                if neighbour not in g_score or new_cost < g_score[neighbour]:
+                    g_score[neighbour] = new_cost
+                    came_from[neighbour] = current
+                    heapq.heappush(open_set, (new_cost + estimate(neighbour), neighbour))
+
+        if stats is not None:
+            stats["abstract"] = stats.get("abstract", 0) + abstract
+            stats["concrete"] = stats.get("concrete", 0) + concrete
+        return path, cost
+
+    def refine(self, abstract_path, stats=None):
+        """
+        Lazily turns abstract waypoints into tiles, one abstract edge at a time.
+
+        Yields:
+            tuple[int, int]: Each tile of the concrete path, starting with the first waypoint
+        """
+        yield abstract_path[0]
+        for a, b in zip(abstract_path, abstract_path[1:]):
+            if b in self.inter_edges.get(a, ()) and self.cluster_of(a) != self.cluster_of(b):
+                yield b  # Crossing a border is a single step
+                continue
+
+            cluster = self.cluster_of(a)
+            _, parents, expanded = self._local_bfs(a, cluster, goal=b)
+            if stats is not None:
+                stats["concrete"] = stats.get("concrete", 0) + expanded
+
+            segment = []
+            current = b
+            while current != a:
+                segment.append(current)
+                current = parents[current]
+            yield from reversed(segment)
+
+    def find_path(self, start, end, Noise_Level=0, Max_Depth=None, stats=None, lazy=False):
+        """
+        Runs HPA*: abstract search, then refinement into tiles.
+
+        By default the whole path is refined before returning, so the nodes
+        explored (and any timing around the call) include every tile expanded.
+        With lazy=True the path is a RefinedPath instead: its length is known
+        straight away, but each abstract edge is only refined when one of its
+        tiles is read, so an agent can start walking before the rest exists.
+        That refinement happens after the call and is not counted. Either way
+        the nodes explored equal stats["abstract"] + stats["concrete"].
+
+        Max_Depth limits every expansion, abstract and concrete, so a query
+        whose refinement would exceed it fails; it always refines eagerly.
+        The path is near-optimal rather than guaranteed optimal, as with any
+        HPA* abstraction.
+
+        Args:
+            start (tuple[int, int]): Starting tile
+            end (tuple[int, int]): Goal tile
+            Noise_Level (int, optional): Adds randomness to the abstract heuristic
+            Max_Depth (int, optional): Maximum nodes (abstract plus tiles) allowed to be expanded
+            stats (dict, optional): Receives "abstract" and "concrete" expansion counts
+            lazy (bool, optional): Refine the path on demand (for the simulation's agent)
+
+        Returns:
+            tuple[List[tuple[int, int]] | RefinedPath, int]: The final path (if any) and total nodes explored
+        """
+        stats = {} if stats is None else stats
+        stats["abstract"] = 0
+        stats["concrete"] = 0
+        lazy = lazy and Max_Depth is None
+
+        if start == end:
+            stats["concrete"] = 1
+            return [start], 1
+        if not self._is_walkable(end):
+            return None, 0
+
+        if not self._is_walkable(start):
+            # A start on a wall can still step off it, but is not part of any cluster's
+            # open area; plan from each open neighbour and keep the shortest result
+            best = None
+            for dr, dc in DIRECTIONS:
+                neighbour = (start[0] + dr, start[1] + dc)
+                if self._is_walkable(neighbour):
+                    path = self._plan(neighbour, end, Noise_Level, Max_Depth, stats, lazy)
+                    if path and (best is None or len(path) < len(best)):
+                        best = path
+            if best is None:
+                path = None
+            elif lazy:
+                path = RefinedPath(chain([start], best), len(best) + 1)
+            else:
+                path = [start] + best
+        else:
+            path = self._plan(start, end, Noise_Level, Max_Depth, stats, lazy)
+
+        explored = stats["abstract"] + stats["concrete"]
+        if Max_Depth is not None and explored > Max_Depth:
+            path = None  # A wall start plans from each neighbour, all within one budget
+        return path, explored
+
+    def _plan(self, start, end, Noise_Level, Max_Depth, stats, lazy):
+        if start == end:
+            return [start]
+        used = stats["abstract"] + stats["concrete"]
+        abstract_path, cost = self._abstract_search(start, end, Noise_Level, Max_Depth, stats, used=used)
+        if not abstract_path:
+            return None
+        if lazy:
+            # Tiles refined later are not part of this query's count
+            return RefinedPath(self.refine(abstract_path), cost + 1)
+
+        path = []
+        for tile in self.refine(abstract_path, stats=stats):
+            path.append(tile)
+            if Max_Depth is not None and stats["abstract"] + stats["concrete"] > Max_Depth:
+                return None
+        return path
@@ -0,0 +1,145 @@
+import heapq
+
+from lookahead import heuristics
+
+INF = float("inf")
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
+
+
+class IncrementalPlanner:
+    def __init__(self, grid, start, end):
+        """
+        Lifelong Planning A* (LPA*) for a fixed start and goal on a changing grid.
+
+        The planner keeps its g/rhs values and open list between calls. After
+        walls change, only the cells whose costs are affected are re-expanded,
+        instead of running a fresh A* search from zero.
+
+        Args:
+            grid (List[List[int]]): Live reference to the map grid (0 = walkable, 1 = wall)
+            start (tuple[int, int]): Starting tile
+            end (tuple[int, int]): Goal tile
+        """
+        self.grid = grid
+        self.start = start
+        self.end = end
+        self.height = len(grid)
+        self.width = len(grid[0])
+
+        self.g = {}
+        self.rhs = {start: 0}
+        self.open_set = []
+        self.open_keys = {}  # Current key of every node on the open list
+
+        self.last_expanded = 0
+        self.total_expanded = 0
+        self._push(start)
+
+    def _is_walkable(self, pos):
+        row, col = pos
+        return 0 <= row < self.height and 0 <= col < self.width and self.grid[row][col] != 1
+
+    def _neighbours(self, pos):
+        row, col = pos
+        for dr, dc in DIRECTIONS:
+            neighbour = (row + dr, col + dc)
+            if self._is_walkable(neighbour):
+                yield neighbour
+
+    def _calculate_key(self, pos):
+        best = min(self.g.get(pos, INF), self.rhs.get(pos, INF))
+        return (best + heuristics(pos, self.end), best)
+
+    def _push(self, pos):
+        key = self._calculate_key(pos)
+        self.open_keys[pos] = key
+        heapq.heappush(self.open_set, (key, pos))
+
+    def _top_key(self):
+        # Drop entries that were removed or re-keyed since they were pushed
+        while self.open_set:
+            key, pos = self.open_set[0]
+            if self.open_keys.get(pos) == key:
+                return key
+            heapq.heappop(self.open_set)
+        return (INF, INF)
+
+    def _update_vertex(self, pos):
+        if pos != self.start:
+            if self._is_walkable(pos):
+                self.rhs[pos] = min(
+                    (self.g.get(n, INF) + 1 for n in self._neighbours(pos)), default=INF)
+            else:
+                self.rhs[pos] = INF
+
+        self.open_keys.pop(pos, None)
+        if self.g.get(pos, INF) != self.rhs.get(pos, INF):
+            self._push(pos)
+
+    def _compute_shortest_path(self):
+        expanded = 0
+        while (self._top_key() < self._calculate_key(self.end)
+               or self.rhs.get(self.end, INF) != self.g.get(self.end, INF)):
+            if not self.open_set:
+                break
+
+            _, current = heapq.heappop(self.open_set)
+            del self.open_keys[current]
+            expanded += 1
+
+            if self.g.get(current, INF) > self.rhs.get(current, INF):
+                # Overconsistent: settle the node
+                self.g[current] = self.rhs[current]
+            else:
+                # Underconsistent: its old cost is no longer valid
+                self.g[current] = INF
+                self._update_vertex(current)
+
+            for neighbour in self._neighbours(current):
+                self._update_vertex(neighbour)
+
+        self.last_expanded = expanded
+        self.total_expanded += expanded
+        return expanded
+
+    def _extract_path(self):
+        if self.g.get(self.end, INF) == INF:
+            return None
+
+        path = [self.end]
+        current = self.end
+        while current != self.start:
+            current = min(self._neighbours(current), key=lambda n: self.g.get(n, INF))
+            path.append(current)
+        path.reverse()
+        return path
+
+    def plan(self):
+        """
+        Brings the search up to date and returns the current shortest path.
+
+        Returns:
+            tuple[List[tuple[int, int]], int]: The path (if any) and number of nodes (re-)expanded by this call
+        """
+        expanded = self._compute_shortest_path()
+        return self._extract_path(), expanded
+
+    def update_cells(self, changed_cells):
+        """
+        Repairs the search after the given cells were toggled between wall and empty.
+
+        Args:
+            changed_cells (Iterable[tuple[int, int]]): Cells whose wall state changed
+
+        Returns:
+            tuple[List[tuple[int, int]], int]: The path (if any) and number of nodes re-expanded
+        """
+        for pos in changed_cells:
+            row, col = pos
+            self._update_vertex(pos)
+            for dr, dc in DIRECTIONS:
+                neighbour = (row + dr, col + dc)
+                if 0 <= neighbour[0] < self.height and 0 <= neighbour[1] < self.width:
+                    self._update_vertex(neighbour)
+
+        return self.plan()
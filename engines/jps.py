@@ -0,0 +1,158 @@
+import heapq
+import random
+from array import array
+
+
+def _walkable(graph, row, col):
+    return 0 <= row < graph.height and 0 <= col < graph.width and not graph.cells[row * graph.width + col]
+
+
+def _jump(graph, row, col, dr, dc, goal):
+    """
+    Slides from (row, col) in direction (dr, dc) until a jump point, the goal or a dead end.
+
+    Moving horizontally stops at forced neighbours (an opening above or below
+    that was blocked one step back). Moving vertically also stops wherever a
+    horizontal scan from the current cell would find a jump point, since that
+    is where a 4-connected path can turn.
+
+    Returns:
+        tuple[int, int] | None: The jump point reached, or None
+    """
+    while True:
+        row += dr
+        col += dc
+        if not _walkable(graph, row, col):
+            return None
+        if (row, col) == goal:
+            return row, col
+
+        if dc:
+            if ((_walkable(graph, row - 1, col) and not _walkable(graph, row - 1, col - dc)) or
+                    (_walkable(graph, row + 1, col) and not _walkable(graph, row + 1, col - dc))):
+                return row, col
+        else:
+            if ((_walkable(graph, row, col - 1) and not _walkable(graph, row - dr, col - 1)) or
+                    (_walkable(graph, row, col + 1) and not _walkable(graph, row - dr, col + 1))):
+                return row, col
+            if _jump(graph, row, col, 0, 1, goal) or _jump(graph, row, col, 0, -1, goal):
+                return row, col
+
+
+def _directions(graph, row, col, parent):
+    """
+    Returns the pruned set of directions to scan from a jump point.
+    """
+    if parent is None:
+        return [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+    parent_row, parent_col = parent
+    dr = (row > parent_row) - (row < parent_row)
+    dc = (col > parent_col) - (col < parent_col)
+
+    if dc:
+        # Horizontal travel: keep going, or turn up/down
+        candidates = [(-1, 0), (1, 0), (0, dc)]
+    else:
+        # Vertical travel: keep going, or turn left/right
+        candidates = [(0, -1), (0, 1), (dr, 0)]
+
+    return [(r, c) for r, c in candidates if _walkable(graph, row + r, col + c)]
+
+
+def jump_point_search(graph, start, end, Noise_Level=0, Max_Depth=None, Heuristic=None):
+    """
+    Runs Jump Point Search on a prebuilt GridGraph (4-connected, unit move cost).
+
+    Straight runs of symmetric cells are skipped by jumping, so only jump points
+    go through the open list. The returned path is expanded back into every
+    cell it passes through, so it can be drawn and logged like an A* path.
+
+    Args:
+        graph (GridGraph): Flattened grid built once per map
+        start (tuple[int, int]): Starting tile
+        end (tuple[int, int]): Goal tile
+        Noise_Level (int, optional): Adds randomness to the heuristic
+        Max_Depth (int, optional): Maximum jump points allowed to be expanded
+        Heuristic (LandmarkHeuristic, optional): Supplies per-goal estimate tables instead of Manhattan distance
+
+    Returns:
+        tuple[List[tuple[int, int]], int]: The final path (if any) and number of jump points explored
+    """
+    width = graph.width
+    end_node = graph.to_node(end)
+    h_table = Heuristic.table_to(end_node) if Heuristic is not None else graph.manhattan_table(end_node)
+
+    noisy = bool(Noise_Level and Noise_Level > 0)
+    low, high = -Noise_Level / 10, Noise_Level / 10
+
+    start_node = graph.to_node(start)
+    g_score = array("i", [-1]) * graph.size
+    came_from = array("i", [-1]) * graph.size
+    closed_set = bytearray(graph.size)
+
+    open_set = [(0, start_node)]
+    g_score[start_node] = 0
+    explored_count = 0
+
+    while open_set:
+        _, current = heapq.heappop(open_set)
+
+        if closed_set[current]:
+            continue
+        closed_set[current] = 1
+        explored_count += 1
+
+        if Max_Depth is not None and explored_count > Max_Depth:
+            return None, explored_count
+
+        row, col = divmod(current, width)
+
+        if current == end_node:
+            jump_points = []
+            while current != start_node:
+                jump_points.append(divmod(current, width))
+                current = came_from[current]
+            jump_points.append(start)
+            jump_points.reverse()
+            return _expand_path(jump_points), explored_count
+
+        parent = divmod(came_from[current], width) if came_from[current] != -1 else None
+
+        for dr, dc in _directions(graph, row, col, parent):
+            jump_point = _jump(graph, row, col, dr, dc, end)
+            if jump_point is None:
+                continue
+
+            neighbour = jump_point[0] * width + jump_point[1]
+            if closed_set[neighbour]:
+                continue
+
+            new_cost = g_score[current] + abs(jump_point[0] - row) + abs(jump_point[1] - col)
+            old_cost = g_score[neighbour]
+
+            if old_cost == -1 or new_cost < old_cost:
+                came_from[neighbour] = current
+                g_score[neighbour] = new_cost
+                if noisy:
+                    total_estimate = new_cost + h_table[neighbour] * (1 + random.uniform(low, high))
+                else:
+                    total_estimate = new_cost + h_table[neighbour]
+                heapq.heappush(open_set, (total_estimate, neighbour))
+
+    return None, explored_count  # No path found
+
+
+def _expand_path(jump_points):
+    """
+    Fills in every cell between consecutive jump points (always straight lines).
+    """
+    path = [jump_points[0]]
+    for (row, col), (next_row, next_col) in zip(jump_points, jump_points[1:]):
+        dr = (next_row > row) - (next_row < row)
+        dc = (next_col > col) - (next_col < col)
+        while (row, col) != (next_row, next_col):
+            row += dr
+            col += dc
+            path.append((row, col))
+    return path
@@ -0,0 +1,163 @@
+import os
+import tempfile
+from array import array
+
+import numpy as np
+
+import config
+from engines.distance_field import distance_field, open_mask_from_grid
+from utils.map_utils import grid_digest
+
+LANDMARK_CACHE_DIR = os.path.join(config.DATA_DIR, "cache", "landmarks")
+DEFAULT_LANDMARK_COUNT = 4
+
+
+def select_landmarks(open_mask, count):
+    """
+    Picks landmarks by farthest-point selection.
+
+    The first landmark is the tile farthest from the first open tile; each
+    following one is the tile whose distance to its nearest chosen landmark is
+    largest. Spreading landmarks to the edges of the map gives tighter bounds.
+    Landmarks are placed in the region reachable from the first open tile.
+
+    Returns:
+        tuple[List[tuple[int, int]], np.ndarray]: Landmarks and their (K, rows, cols) distance fields
+    """
+    open_cells = np.argwhere(open_mask)
+    if not len(open_cells) or count <= 0:
+        return [], np.zeros((0,) + open_mask.shape, dtype=np.int32)
+
+    # Distance from each tile to its nearest landmark so far (-1 = unreachable)
+    nearest = distance_field(open_mask, tuple(open_cells[0]))
+    landmarks = []
+    fields = []
+
+    for _ in range(count):
+        candidate = np.unravel_index(np.argmax(nearest), nearest.shape)
+        if nearest[candidate] <= 0 and landmarks:
+            break  # Every reachable tile is already a landmark
+
+        landmark = (int(candidate[0]), int(candidate[1]))
+        field = distance_field(open_mask, landmark)
+        landmarks.append(landmark)
+        fields.append(field)
+        nearest = field if len(landmarks) == 1 else np.minimum(nearest, field)
+
+    return landmarks, np.stack(fields)
+
+
+class LandmarkHeuristic:
+    def __init__(self, grid, count=DEFAULT_LANDMARK_COUNT, cache_dir=LANDMARK_CACHE_DIR):
+        """
+        ALT (A*, Landmarks, Triangle inequality) heuristic for one map.
+
+        Exact BFS distances from K landmarks are precomputed once and stored on
+        disk, keyed by a hash of the grid, so later runs on the same map only load
+        them. Tables are loaded lazily on first use. For any landmark L,
+        |d(L, a) - d(L, b)| is a lower bound on d(a, b); the heuristic is the
+        largest such bound, never less than Manhattan distance.
+
+        Args:
+            grid (List[List[int]]): The map grid (0 = empty, 1 = wall)
+            count (int): Number of landmarks (K)
+            cache_dir (str): Folder holding the cached distance tables
+        """
+        self.grid = grid
+        self.count = count
+        self.digest = grid_digest(grid)
+        self.cache_path = os.path.join(cache_dir, f"{self.digest}_k{count}.npz")
+        self.width = len(grid[0])
+
+        self._landmarks = None
+        self._tables = None
+        self._goal_tables = {}
+
+    def _load(self):
+        if self._tables is not None:
+            return
+
+        if os.path.exists(self.cache_path):
+            with np.load(self.cache_path) as data:
+                self._landmarks = [tuple(pos) for pos in data["landmarks"].tolist()]
+                self._tables = data["tables"]
+            return
+
+        landmarks, fields = select_landmarks(open_mask_from_grid(self.grid), self.count)
+        self._landmarks = landmarks
+        self._tables = fields.reshape(len(landmarks), -1).astype(np.int32)
+
+        # Written to a temp file and renamed, so another process never loads a half-written table
+        cache_dir = os.path.dirname(self.cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".npz.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    landmarks=np.array(landmarks, dtype=np.int32).reshape(-1, 2),
+                    tables=self._tables,
+                )
+            os.replace(temp_path, self.cache_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def prepare(self):
+        """
+        Loads the distance tables now instead of on first use, building and saving them if needed.
+        """
+        self._load()
+
+    @property
+    def landmarks(self):
+        self._load()
+        return self._landmarks
+
+    def __call__(self, a, b):
+        """
+        Heuristic estimate between two tiles, for use with lookahead.A_Star_Search.
+        """
+        self._load()
+        estimate = abs(a[0] - b[0]) + abs(a[1] - b[1])
+        node_a = a[0] * self.width + a[1]
+        node_b = b[0] * self.width + b[1]
+
+        for table in self._tables:
+            dist_a, dist_b = table[node_a], table[node_b]
+            if dist_a >= 0 and dist_b >= 0:
+                estimate = max(estimate, abs(int(dist_a) - int(dist_b)))
+        return estimate
+
+    def table_to(self, goal):
+        """
+        Heuristic from every node to one goal node, for the GridGraph engines.
+
+        Args:
+            goal (int): Goal node id
+
+        Returns:
+            array[int]: Estimate to goal, indexed by node id
+        """
+        table = self._goal_tables.get(goal)
+        if table is not None:
+            return table
+
+        self._load()
+        height = len(self.grid)
+        rows, cols = np.divmod(np.arange(height * self.width), self.width)
+        goal_row, goal_col = divmod(goal, self.width)
+        estimate = np.abs(rows - goal_row) + np.abs(cols - goal_col)
+
+        if len(self._tables):
+            to_goal = self._tables[:, goal][:, None]
+            valid = (self._tables >= 0) & (to_goal >= 0)
+            bounds = np.where(valid, np.abs(self._tables - to_goal), 0).max(axis=0)
+            estimate = np.maximum(estimate, bounds)
+
+        table = array("i")
+        table.frombytes(estimate.astype(np.int32).tobytes())
+        if len(self._goal_tables) >= 4:
+            self._goal_tables.clear()
+        self._goal_tables[goal] = table
+        return table
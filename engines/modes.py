@@ -0,0 +1,91 @@
+import weakref
+
+from engines.grid_graph import search_graph
+from engines.bidirectional import bidirectional_search
+from engines.jps import jump_point_search
+from engines.hierarchical import HierarchicalGrid
+
+# One HPA* abstraction per GridGraph, built on first use
+_hierarchies = weakref.WeakKeyDictionary()
+
+
+def _astar(graph, start, end, Noise_Level=0, Max_Depth=None, stats=None, Heuristic=None, open_list="heap"):
+    return search_graph(
+        graph, start, end, Noise_Level=Noise_Level, Max_Depth=Max_Depth, Heuristic=Heuristic,
+        open_list=open_list, stats=stats)
+
+
+def _jps(graph, start, end, Noise_Level=0, Max_Depth=None, stats=None, Heuristic=None):
+    return jump_point_search(
+        graph, start, end, Noise_Level=Noise_Level, Max_Depth=Max_Depth, Heuristic=Heuristic)
+
+
+def get_hierarchy(graph):
+    """
+    Returns the HPA* abstraction for a GridGraph, building it the first time.
+    """
+    hierarchy = _hierarchies.get(graph)
+    if hierarchy is None:
+        width = graph.width
+        grid = [list(graph.cells[row * width:(row + 1) * width]) for row in range(graph.height)]
+        hierarchy = HierarchicalGrid(grid)
+        _hierarchies[graph] = hierarchy
+    return hierarchy
+
+
+def _hierarchical(graph, start, end, Noise_Level=0, Max_Depth=None, stats=None, Heuristic=None):
+    return get_hierarchy(graph).find_path(
+        start, end, Noise_Level=Noise_Level, Max_Depth=Max_Depth, stats=stats)
+
+
+# Every mode runs on a GridGraph and shares the (path, explored_count) interface
+SEARCH_MODES = {
+    "astar": _astar,
+    "bidirectional": bidirectional_search,
+    "jps": _jps,
+    "hierarchical": _hierarchical,
+}
+
+SEARCH_MODE_LABELS = {
+    "astar": "A*",
+    "bidirectional": "Bidirectional A*",
+    "jps": "Jump Point Search",
+    "hierarchical": "Hierarchical (HPA*)",
+}
+
+
+def run_search(mode, graph, start, end, Noise_Level=0, Max_Depth=None, stats=None, Heuristic=None,
+               open_list="heap"):
+    """
+    Runs the selected search mode on a prebuilt GridGraph.
+
+    Args:
+        mode (str): One of SEARCH_MODES
+        graph (GridGraph): Flattened map grid
+        start (tuple[int, int]): Starting tile
+        end (tuple[int, int]): Goal tile
+        Noise_Level (int, optional): Adds randomness to the heuristic
+        Max_Depth (int, optional): Maximum nodes allowed to be expanded
+        stats (dict, optional): Receives mode-specific counters, e.g. per-direction expansions
+            or the astar counters listed in engines.counters
+        Heuristic (LandmarkHeuristic, optional): Replaces the Manhattan heuristic
+        open_list (str, optional): Open list for the astar mode ("heap" or "bucket")
+
+    Returns:
+        tuple[List[tuple[int, int]], int]: The final path (if any) and number of nodes explored
+
+    Raises:
+        ValueError: If the mode is unknown, or a non-heap open list is requested outside astar
+    """
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"Unknown search mode: {mode}")
+
+    if open_list != "heap":
+        if mode != "astar":
+            raise ValueError(f"The {open_list} open list is only available in astar mode")
+        return _astar(
+            graph, start, end, Noise_Level=Noise_Level, Max_Depth=Max_Depth, stats=stats, Heuristic=Heuristic,
+            open_list=open_list)
+
+    return SEARCH_MODES[mode](
+        graph, start, end, Noise_Level=Noise_Level, Max_Depth=Max_Depth, stats=stats, Heuristic=Heuristic)
@@ -0,0 +1,172 @@
+import heapq
+
+import numpy as np
+
+from engines.grid_graph import trace_path
+from engines.workspace import default_pool
+
+MIN_NOISE_BLOCK = 64
+MAX_NOISE_BLOCK = 4096
+
+
+class NoiseStream:
+    def __init__(self, rng, Noise_Level):
+        """
+        Hands out heuristic noise factors drawn from a private NumPy generator.
+
+        Factors are drawn a block at a time, so the search pays a list lookup per
+        push instead of a Python-level RNG call. Blocks start small and double,
+        so short searches don't pay for a large draw. Splitting the draws into blocks
+        does not change the values, so the sequence depends only on the
+        generator's seed and each search stays reproducible and independent of
+        any other search running at the same time.
+
+        Args:
+            rng (np.random.Generator): Generator owned by this search
+            Noise_Level (int | float): Amount of noise to apply (factor in 1 ± Noise_Level / 10)
+        """
+        self.rng = rng
+        self.low = 1 - Noise_Level / 10
+        self.high = 1 + Noise_Level / 10
+        self.block_size = MIN_NOISE_BLOCK
+
+    def next_block(self):
+        """
+        Draws the next block of noise factors as a plain list.
+        """
+        block = self.rng.uniform(self.low, self.high, self.block_size).tolist()
+        self.block_size = min(self.block_size * 2, MAX_NOISE_BLOCK)
+        return block
+
+
+def noisy_search(graph, start, end, Noise_Level, rng, Max_Depth=None, Heuristic=None, workspace=None, stats=None):
+    """
+    Runs the noisy-heuristic A* with its own random generator.
+
+    Same search as search_graph with noise (one noise factor per heap push), but
+    the Manhattan table to the goal comes precomputed from the GridGraph and the
+    factors come from a per-search NoiseStream instead of the global `random`
+    module, so no global seeding is needed. A stats dict receives the same
+    counters as search_graph's.
+
+    Args:
+        graph (GridGraph): Flattened grid built once per map
+        start (tuple[int, int]): Starting tile
+        end (tuple[int, int]): Goal tile
+        Noise_Level (int | float): Amount of noise to apply (0 = none)
+        rng (np.random.Generator): Generator owned by this search
+        Max_Depth (int, optional): Maximum nodes allowed to be expanded
+        Heuristic (LandmarkHeuristic, optional): Supplies per-goal estimate tables instead of Manhattan distance
+        workspace (SearchWorkspace, optional): Arrays reused across searches; borrowed from the shared pool if omitted
+        stats (dict, optional): Receives the search counters (see engines.counters)
+
+    Returns:
+        tuple[List[tuple[int, int]], int]: The final path (if any) and number of nodes explored
+    """
+    if workspace is not None:
+        return _noisy_search(graph, start, end, Noise_Level, rng, Max_Depth, Heuristic, workspace, stats)
+
+    workspace = default_pool.acquire(graph.size)
+    try:
+        return _noisy_search(graph, start, end, Noise_Level, rng, Max_Depth, Heuristic, workspace, stats)
+    finally:
+        default_pool.release(workspace)
+
+
+def _noisy_search(graph, start, end, Noise_Level, rng, Max_Depth, Heuristic, workspace, stats):
+    width = graph.width
+    offsets = graph.offsets
+    targets = graph.targets
+    start_node = graph.to_node(start)
+    end_node = graph.to_node(end)
+    h_table = Heuristic.table_to(end_node) if Heuristic is not None else graph.manhattan_table(end_node)
+
+    generation = workspace.begin()
+    g_score = workspace.g_score
+    came_from = workspace.came_from
+    seen = workspace.seen
+    closed_set = workspace.closed
+
+    noisy = bool(Noise_Level and Noise_Level > 0)
+    stream = NoiseStream(rng, Noise_Level) if noisy else None
+    block, block_index = [], 0
+
+    open_set = workspace.heap
+    open_set.append((0, start_node))
+    g_score[start_node] = 0
+    seen[start_node] = generation
+    explored_count = 0
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    # Counters are plain locals, copied into stats on the way out as in search_graph
+    pushes, stale_pops, peak_open, reopens = 1, 0, 1, 0
+    try:
+        while open_set:
+            if len(open_set) > peak_open:
+                peak_open = len(open_set)
+            _, current = heappop(open_set)
+
+            if closed_set[current] == generation:
+                stale_pops += 1
+                continue
+            closed_set[current] = generation
+            explored_count += 1
+
+            if Max_Depth is not None and explored_count > Max_Depth:
+                return None, explored_count
+
+            if current == end_node:
+                return trace_path(came_from, start_node, current, start, width), explored_count
+
+            new_cost = g_score[current] + 1  # Assume all moves cost 1
+            for index in range(offsets[current], offsets[current + 1]):
+                neighbour = targets[index]
+
+                if seen[neighbour] != generation:
+                    seen[neighbour] = generation
+                elif new_cost < g_score[neighbour]:
+                    reopens += 1
+                else:
+                    continue
+
+                came_from[neighbour] = current
+                g_score[neighbour] = new_cost
+                if noisy:
+                    if block_index == len(block):
+                        block, block_index = stream.next_block(), 0
+                    total_estimate = new_cost + h_table[neighbour] * block[block_index]
+                    block_index += 1
+                else:
+                    total_estimate = new_cost + h_table[neighbour]
+                heappush(open_set, (total_estimate, neighbour))
+                pushes += 1
+
+        return None, explored_count  # No path found
+    finally:
+        if stats is not None:
+            stats.update(pushes=pushes, stale_pops=stale_pops, peak_open=peak_open, reopens=reopens,
+                         frontier=len(open_set), closed=explored_count)
+
+
+def run_noise_trials(graph, start, end, Noise_Level, trials, seed=None, Max_Depth=None, Heuristic=None):
+    """
+    Runs many independent Monte Carlo noise trials on one map.
+
+    Each trial gets its own generator spawned from a single SeedSequence, so
+    trial i is reproducible on its own and trials can run in any order or in
+    parallel without sharing RNG state.
+
+    Returns:
+        List[tuple[List[tuple[int, int]], int]]: (path, nodes explored) per trial
+    """
+    children = np.random.SeedSequence(seed).spawn(trials)
+    workspace = default_pool.acquire(graph.size)
+    try:
+        return [
+            noisy_search(graph, start, end, Noise_Level, np.random.default_rng(child),
+                         Max_Depth=Max_Depth, Heuristic=Heuristic, workspace=workspace)
+            for child in children
+        ]
+    finally:
+        default_pool.release(workspace)
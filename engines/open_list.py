@@ -0,0 +1,106 @@
+OPEN_LIST_KINDS = ("heap", "bucket")
+
+
+class BucketOpenList:
+    def __init__(self):
+        """
+        Bucket queue for small non-negative integer priorities.
+
+        Nodes are grouped by f, and within an f bucket by g; pop takes the
+        lowest f and, among ties, the largest g (the node closest to the goal),
+        newest first. Each node is queued at most once: pushing a queued node
+        with a new priority moves it (a real decrease-key), so no stale entries
+        pile up. Both the f cursor and the per-bucket g cursor are moved lazily,
+        which gives amortised O(1) push and pop while f only grows, as it does
+        for A* with unit costs and a consistent heuristic.
+
+        The constant factor is higher than the heap's: the g tie-breaking saves
+        expansions on open maps, but on mazes (one f value rarely holds many
+        nodes) it expands about as many nodes and ends up slower overall.
+        """
+        self._buckets = []  # f -> {g: {node: None}} (dicts keep insertion order)
+        self._counts = []  # f -> nodes queued in that bucket
+        self._tops = []  # f -> upper bound on the largest occupied g
+        self._entries = {}  # node -> (f, g) while queued
+        self._cursor = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def push(self, node, f, g):
+        old = self._entries.get(node)
+        if old is not None:
+            if old == (f, g):
+                return
+            self._remove(node, *old)
+
+        if f >= len(self._buckets):
+            # Grow geometrically: on mazes f rises by one every few pushes
+            grow = max(f + 1, 2 * len(self._buckets)) - len(self._buckets)
+            self._buckets.extend({} for _ in range(grow))
+            self._counts.extend([0] * grow)
+            self._tops.extend([0] * grow)
+
+        by_g = self._buckets[f]
+        nodes = by_g.get(g)
+        if nodes is None:
+            nodes = by_g[g] = {}
+        nodes[node] = None
+        if not self._counts[f] or g > self._tops[f]:
+            self._tops[f] = g
+        self._counts[f] += 1
+
+        self._entries[node] = (f, g)
+        if f < self._cursor:
+            self._cursor = f
+
+    def pop(self):
+        counts = self._counts
+        f = self._cursor
+        while not counts[f]:
+            f += 1
+        self._cursor = f
+
+        by_g = self._buckets[f]
+        g = self._tops[f]
+        while g not in by_g:
+            g -= 1
+        self._tops[f] = g
+
+        nodes = by_g[g]
+        node, _ = nodes.popitem()
+        if not nodes:
+            del by_g[g]
+        counts[f] -= 1
+        del self._entries[node]
+        return node
+
+    def _remove(self, node, f, g):
+        by_g = self._buckets[f]
+        nodes = by_g[g]
+        del nodes[node]
+        if not nodes:
+            del by_g[g]
+        self._counts[f] -= 1
+
+
+def make_open_list(kind):
+    """
+    Creates a pluggable open list for one noise-free search.
+
+    The binary heap ("heap") is not built here: search_graph inlines heapq,
+    which is faster than calling an open list's methods, and noisy searches
+    (float f-values, which the bucket queue can't hold) always use it.
+
+    Args:
+        kind (str): "bucket"
+
+    Returns:
+        BucketOpenList: Empty open list
+
+    Raises:
+        ValueError: If the kind is unknown or has no open-list object
+    """
+    if kind == "bucket":
+        return BucketOpenList()
+    raise ValueError(f"Unknown open list: {kind}")
@@ -0,0 +1,224 @@
+import heapq
+import random
+from array import array
+
+import numpy as np
+
+from engines.grid_graph import trace_path
+
+# Event kinds
+EXPAND = 0  # Node taken off the open list and expanded
+PUSH = 1  # Node added to the open list (first visit or a cheaper route to an open node)
+REOPEN = 2  # Cheaper route found to a node that was already expanded
+
+EVENT_NAMES = {EXPAND: "expand", PUSH: "push", REOPEN: "reopen"}
+
+
+class TraceBuffer:
+    def __init__(self, width=0, height=0):
+        """
+        Compact, column-oriented store of search events.
+
+        Each event costs 17 bytes (kind, node id, g and f in typed arrays), so
+        traces of millions of events stay small. The buffer is itself a callback
+        sink: pass it (or its record method) wherever a sink is expected.
+
+        Args:
+            width (int): Grid width, used to turn node ids back into tiles
+            height (int): Grid height
+        """
+        self.width = width
+        self.height = height
+        self.kinds = array("b")
+        self.nodes = array("i")
+        self.g = array("i")
+        self.f = array("d")
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __call__(self, kind, node, g, f):
+        self.record(kind, node, g, f)
+
+    def record(self, kind, node, g, f):
+        self.kinds.append(kind)
+        self.nodes.append(node)
+        self.g.append(g)
+        self.f.append(f)
+
+    def events(self):
+        """
+        Yields (kind, (row, col), g, f) for every recorded event, in order.
+        """
+        width = self.width
+        for kind, node, g, f in zip(self.kinds, self.nodes, self.g, self.f):
+            yield kind, divmod(node, width), g, f
+
+    def counts(self):
+        """
+        Returns the number of events of each kind, keyed by event name.
+        """
+        counts = {name: 0 for name in EVENT_NAMES.values()}
+        for kind in self.kinds:
+            counts[EVENT_NAMES[kind]] += 1
+        return counts
+
+    def dump(self, path):
+        """
+        Saves the trace as a compressed .npz file for offline analysis.
+        """
+        np.savez_compressed(
+            path,
+            width=self.width,
+            height=self.height,
+            kinds=np.frombuffer(self.kinds, dtype=np.int8),
+            nodes=np.frombuffer(self.nodes, dtype=np.int32),
+            g=np.frombuffer(self.g, dtype=np.int32),
+            f=np.frombuffer(self.f, dtype=np.float64),
+        )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a trace written by dump().
+        """
+        with np.load(path) as data:
+            buffer = cls(int(data["width"]), int(data["height"]))
+            buffer.kinds.frombytes(data["kinds"].astype(np.int8).tobytes())
+            buffer.nodes.frombytes(data["nodes"].astype(np.int32).tobytes())
+            buffer.g.frombytes(data["g"].astype(np.int32).tobytes())
+            buffer.f.frombytes(data["f"].astype(np.float64).tobytes())
+        return buffer
+
+
+def search_events(graph, start, end, Noise_Level=0, Max_Depth=None, Heuristic=None):
+    """
+    Runs search_graph's A* as a generator of search events.
+
+    Yields (kind, node, g, f) tuples as the search runs and returns the usual
+    (path, explored_count) as the generator's return value. The search, tie-
+    breaking and random draws are the same as search_graph's heap search, so
+    with the same random state both find the same path. This is a separate
+    code path: search_graph itself never checks whether tracing is on.
+
+    Args:
+        graph (GridGraph): Flattened grid built once per map
+        start (tuple[int, int]): Starting tile
+        end (tuple[int, int]): Goal tile
+        Noise_Level (int, optional): Adds randomness to the heuristic
+        Max_Depth (int, optional): Maximum nodes allowed to be expanded
+        Heuristic (LandmarkHeuristic, optional): Supplies per-goal estimate tables instead of Manhattan distance
+    """
+    width = graph.width
+    offsets = graph.offsets
+    targets = graph.targets
+    start_node = graph.to_node(start)
+    end_node = graph.to_node(end)
+    h_table = Heuristic.table_to(end_node) if Heuristic is not None else graph.manhattan_table(end_node)
+
+    g_score = array("i", [-1]) * graph.size
+    came_from = array("i", [-1]) * graph.size
+    closed_set = bytearray(graph.size)
+
+    noisy = bool(Noise_Level and Noise_Level > 0)
+    if noisy:
+        # A_Star_Search draws once for the start tile; keep the RNG stream aligned
+        low, high = -Noise_Level / 10, Noise_Level / 10
+        random.uniform(low, high)
+
+    open_set = [(0, start_node)]
+    g_score[start_node] = 0
+    explored_count = 0
+    yield PUSH, start_node, 0, 0
+
+    while open_set:
+        f, current = heapq.heappop(open_set)
+
+        if closed_set[current]:
+            continue
+        closed_set[current] = 1
+        explored_count += 1
+        yield EXPAND, current, g_score[current], f
+
+        if Max_Depth is not None and explored_count > Max_Depth:
+            return None, explored_count
+
+        if current == end_node:
+            return trace_path(came_from, start_node, current, start, width), explored_count
+
+        new_cost = g_score[current] + 1  # Assume all moves cost 1
+        for index in range(offsets[current], offsets[current + 1]):
+            neighbour = targets[index]
+            old_cost = g_score[neighbour]
+
+            if old_cost == -1 or new_cost < old_cost:
+                came_from[neighbour] = current
+                g_score[neighbour] = new_cost
+                if noisy:
+                    total_estimate = new_cost + h_table[neighbour] * (1 + random.uniform(low, high))
+                else:
+                    total_estimate = new_cost + h_table[neighbour]
+                heapq.heappush(open_set, (total_estimate, neighbour))
+                yield (REOPEN if closed_set[neighbour] else PUSH), neighbour, new_cost, total_estimate
+
+    return None, explored_count  # No path found
+
+
+def traced_search(graph, start, end, sink, Noise_Level=0, Max_Depth=None, Heuristic=None):
+    """
+    Runs search_events to completion, passing every event to a callback sink.
+
+    Args:
+        sink (Callable[[int, int, int, float], None]): Called as sink(kind, node, g, f), e.g. a TraceBuffer
+
+    Returns:
+        tuple[List[tuple[int, int]], int]: The final path (if any) and number of nodes explored
+    """
+    events = search_events(graph, start, end, Noise_Level=Noise_Level, Max_Depth=Max_Depth, Heuristic=Heuristic)
+    while True:
+        try:
+            event = next(events)
+        except StopIteration as finished:
+            return finished.value
+        sink(*event)
+
+
+class FrontierReplay:
+    def __init__(self, trace, events_per_frame=4):
+        """
+        Replays a TraceBuffer a few events per frame to animate the search frontier.
+
+        Args:
+            trace (TraceBuffer): Recorded search
+            events_per_frame (int): Events applied on each call to step()
+        """
+        self.trace = trace
+        self.events_per_frame = events_per_frame
+        self.position = 0
+        self.frontier = set()
+        self.expanded = set()
+
+    @property
+    def finished(self):
+        return self.position >= len(self.trace)
+
+    def step(self):
+        """
+        Applies the next batch of events. Returns False once the trace is exhausted.
+        """
+        trace = self.trace
+        width = trace.width
+        stop = min(self.position + self.events_per_frame, len(trace))
+
+        for index in range(self.position, stop):
+            kind = trace.kinds[index]
+            tile = divmod(trace.nodes[index], width)
+            if kind == EXPAND:
+                self.frontier.discard(tile)
+                self.expanded.add(tile)
+            elif kind == PUSH:
+                self.frontier.add(tile)
+            # A reopened node stays expanded: the search skips it when it is popped again
+
+        self.position = stop
+        return not self.finished
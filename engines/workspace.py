@@ -0,0 +1,83 @@
+import threading
+from array import array
+
+MAX_GENERATION = 2 ** 32 - 1  # Largest value an array("I") slot can hold
+MAX_POOLED_PER_SIZE = 8
+
+
+class SearchWorkspace:
+    def __init__(self, size):
+        """
+        Preallocated per-node arrays for one search at a time on maps with `size` nodes.
+
+        Instead of clearing the arrays between searches, every slot is stamped
+        with the generation that last wrote it. begin() starts a new generation,
+        which makes every slot look untouched in O(1); a g-score or closed flag
+        only counts if its stamp matches the current generation.
+
+        Args:
+            size (int): Number of nodes (height * width)
+        """
+        self.size = size
+        self.g_score = array("i", [0]) * size
+        self.came_from = array("i", [0]) * size
+        self.seen = array("I", [0]) * size  # Generation that last set g_score/came_from
+        self.closed = array("I", [0]) * size  # Generation that expanded the node
+        self.heap = []
+        self.generation = 0
+
+    @property
+    def nbytes(self):
+        """
+        Bytes held by the per-node arrays (the heap list is excluded; it grows with each search).
+        """
+        arrays = (self.g_score, self.came_from, self.seen, self.closed)
+        return sum(len(values) * values.itemsize for values in arrays)
+
+    def begin(self):
+        """
+        Starts a new search and returns its generation number.
+        """
+        if self.generation == MAX_GENERATION:
+            # Stamps are about to wrap around: clear them once
+            self.seen = array("I", [0]) * self.size
+            self.closed = array("I", [0]) * self.size
+            self.generation = 0
+        self.generation += 1
+        self.heap.clear()
+        return self.generation
+
+
+class WorkspacePool:
+    def __init__(self, max_per_size=MAX_POOLED_PER_SIZE):
+        """
+        Hands out SearchWorkspaces by map size and takes them back after each search.
+
+        Each workspace is only ever used by one search at a time, so searches on
+        several threads can share one pool. Up to max_per_size idle workspaces are
+        kept for each map size.
+        """
+        self.max_per_size = max_per_size
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, size):
+        with self._lock:
+            idle = self._idle.get(size)
+            if idle:
+                return idle.pop()
+        return SearchWorkspace(size)
+
+    def release(self, workspace):
+        with self._lock:
+            idle = self._idle.setdefault(workspace.size, [])
+            if len(idle) < self.max_per_size:
+                idle.append(workspace)
+
+    def clear(self):
+        with self._lock:
+            self._idle.clear()
+
+
+# Shared by every search that isn't given its own workspace
+default_pool = WorkspacePool()
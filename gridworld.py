@@ -29,6 +29,9 @@ class GridWorld:
         self.grid = [[0 for _ in range(width)] for _ in range(height)]  # 0 = empty, 1 = wall
         self.start = None
         self.end = None
+        # Role -> callable, called with (row, col) whenever Toggle_Wall changes a tile; one listener
+        # per role, so attaching again replaces the old listener instead of stacking another
+        self.wall_listeners = {}
 
     def draw(self, screen, tileset, coin_frames, coin_anim_index, animation_active):
         """
@@ -116,3 +119,6 @@ class GridWorld:
         """
         row, col = pos
         self.grid[row][col] = 1 if self.grid[row][col] == 0 else 0
+
+        for listener in self.wall_listeners.values():
+            listener(pos)
@@ -1,7 +1,7 @@
 import heapq
 import random
 
-def heuristics(a, b, Noise_Level=0):
+def heuristics(a, b, Noise_Level=0, Heuristic=None):
     """
     Calculates the estimated cost between two tiles using Manhattan Distance.
 
@@ -11,11 +11,16 @@ def heuristics(a, b, Noise_Level=0):
         a (tuple[int, int]): First tile position (row, col)
         b (tuple[int, int]): Second tile position (row, col)
         Noise_Level (int | float): Amount of noise to apply (0 = none)
+        Heuristic (callable, optional): Base estimate to use instead of Manhattan
+            distance, e.g. a LandmarkHeuristic
 
     Returns:
         float: Heuristic estimate of distance from a to b
     """
-    base = abs(a[0] - b[0]) + abs(a[1] - b[1])  # Manhattan distance
+    if Heuristic is not None:
+        base = Heuristic(a, b)
+    else:
+        base = abs(a[0] - b[0]) + abs(a[1] - b[1])  # Manhattan distance
 
     if Noise_Level and Noise_Level > 0:
         noise_factor = 1 + random.uniform(-Noise_Level / 10, Noise_Level / 10)
@@ -48,7 +53,7 @@ def get_Neighbours(pos, grid):
     return neighbours
 
 
-def A_Star_Search(grid, start, end, Noise_Level=0, Max_Depth=None):
+def A_Star_Search(grid, start, end, Noise_Level=0, Max_Depth=None, Heuristic=None):
     """
     Runs A* search with optional noise and depth limit.
 
@@ -61,6 +66,7 @@ def A_Star_Search(grid, start, end, Noise_Level=0, Max_Depth=None):
         end (tuple[int, int]): Goal tile
         Noise_Level (int, optional): Adds randomness to the heuristic
         Max_Depth (int, optional): Maximum nodes allowed to be expanded
+        Heuristic (callable, optional): Base estimate to use instead of Manhattan distance
 
     Returns:
         tuple[List[tuple[int, int]], int]: The final path (if any) and number of nodes explored
@@ -70,7 +76,7 @@ def A_Star_Search(grid, start, end, Noise_Level=0, Max_Depth=None):
 
     came_from = {}  # Tracks where we came from
     g_score = {start: 0}  # Cost from start to current
-    f_score = {start: heuristics(start, end, Noise_Level=Noise_Level)}
+    f_score = {start: heuristics(start, end, Noise_Level=Noise_Level, Heuristic=Heuristic)}
 
     explored_count = 0
     closed_set = set()
@@ -101,7 +107,8 @@ def A_Star_Search(grid, start, end, Noise_Level=0, Max_Depth=None):
             if neighbour not in g_score or new_cost < g_score[neighbour]:
                 came_from[neighbour] = current
                 g_score[neighbour] = new_cost
-                total_estimate = new_cost + heuristics(neighbour, end, Noise_Level=Noise_Level)
+                total_estimate = new_cost + heuristics(
+                    neighbour, end, Noise_Level=Noise_Level, Heuristic=Heuristic)
                 f_score[neighbour] = total_estimate
                 heapq.heappush(open_set, (total_estimate, neighbour))
 
@@ -11,6 +11,7 @@ from simulation_controller import SimulationController
 from ui.ui_screens import draw_start_menu, draw_instructions_screen
 from ui.draw_agent import draw_agent
 from ui.draw_trail import draw_trail
+from ui.draw_frontier import draw_frontier
 from ui.hover_highlight import draw_hover_highlight
 from ui.draw_side_panel import draw_side_panel
 
@@ -122,6 +123,7 @@ while running:
         controller.grid.trail_tiles = controller.trail_tiles
         controller.grid.draw(screen, tileset, coin_frames,
                              coin_anim_index, controller.animation_active)
+        draw_frontier(screen, controller)
         draw_trail(screen, tileset, controller.trail_tiles)
         draw_agent(screen, player_frames, controller)
         back_button_rect = draw_side_panel(screen, controller)
@@ -130,7 +132,8 @@ while running:
 
         pygame.display.flip()
 
-        # Advance pathfinding animation frame
+        # Advance the search replay, then the pathfinding animation
+        controller.update_frontier_step()
         if controller.animation_active:
             controller.update_animation_step()
 
@@ -160,5 +163,6 @@ while running:
 
     clock.tick(120)
 
+controller.metrics.close()
 pygame.quit()
 sys.exit()
@@ -3,10 +3,300 @@ import csv
 import shutil
 import config
 from datetime import datetime
+from engines.counters import COUNTER_COLUMNS
+from utils.memory_profile import MEMORY_COLUMNS
+from utils.timing import TIMING_COLUMNS
+from utils.columnar import RESULT_FORMATS, ParquetResults, columnar_available
 
 # Keep track of which files have already been checked for archiving
 cleared_files = set()
 
+# Keep track of which files have already had their CSV header checked
+checked_headers = set()
+
+# Rows a MetricsSink holds before writing them out
+DEFAULT_BUFFER_ROWS = 256
+
+
+class _CsvResults:
+    def __init__(self, filepath, fieldnames):
+        """
+        Append handle for one metrics CSV; writes the header if the file is new.
+        """
+        self.file = open(filepath, mode="a", newline="", encoding="utf-8")
+        self.writer = csv.DictWriter(self.file, fieldnames=fieldnames)
+        if self.file.tell() == 0:
+            self.writer.writeheader()
+
+    def write_mark(self):
+        """
+        Returns the byte offset the rows written from now on will start at.
+        """
+        return {"offset": self.file.tell()}
+
+    def write_rows(self, records):
+        self.writer.writerows(csv_row(record) for record in records)
+        self.file.flush()
+
+    def sync(self):
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        self.file.close()
+
+
+def csv_row(record):
+    """
+    Renders a metrics record as CSV text: "Yes"/"No" for success and "N/A" for missing values.
+    """
+    row = {}
+    for column, value in record.items():
+        if column == "Timestamp":
+            value = value.strftime("%Y-%m-%d %H:%M:%S")
+        elif column == "Success":
+            value = "Yes" if value else "No"
+        row[column] = value if value is not None else "N/A"
+    return row
+
+
+class MetricsSink:
+    def __init__(self, buffer_rows=DEFAULT_BUFFER_ROWS, static_map=False, results_format="csv"):
+        """
+        Writes metrics rows to the per-agent results files, keeping each file open
+        and buffering rows instead of reopening the file for every run.
+
+        Each file is prepared once when its first row is written (folders,
+        daily archiving and the header check), then rows are written in bulk
+        every buffer_rows rows (if set) and on flush(), commit() or close(). Use it as a context
+        manager so the last rows are written when a batch ends.
+
+        With results_format="parquet" (needs pyarrow) the rows go to a Parquet
+        dataset next to where the CSV would be, with typed columns written in
+        large row groups; see utils.columnar.
+
+        Args:
+            buffer_rows (int | None): Rows held before they are written (1 writes every row straight away,
+                None holds them until flush(), commit() or close())
+            static_map (bool): The map never changes (benchmark batches), so walls are counted only once
+            results_format (str): "csv" (default) or "parquet"
+
+        Raises:
+            ValueError: If the format is unknown, or is "parquet" without pyarrow installed
+        """
+        if results_format not in RESULT_FORMATS:
+            raise ValueError(f"Unknown results format: {results_format}")
+        if results_format == "parquet" and not columnar_available():
+            raise ValueError("The parquet results format needs pyarrow (pip install pyarrow)")
+
+        self.buffer_rows = max(1, buffer_rows) if buffer_rows is not None else None
+        self.static_map = static_map
+        self.results_format = results_format
+        self._walls = None
+        self._files = {}  # filepath -> open _CsvResults or ParquetResults
+        self._pending = {}  # filepath -> records not yet written
+        self._pending_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def log(
+        self,
+        grid,
+        start,
+        end,
+        path,
+        Agent_Type="Unknown",
+        Noise_Level=None,
+        Max_Depth=None,
+        Success=False,
+        Nodes_Explored=None,
+        Search_Time=None,
+        is_benchmark=False,
+        benchmark_name=None,
+        seed=None,
+        Search_Mode="astar",
+        Heuristic="manhattan",
+        Timing="measured",
+        Weight=None,
+        Path_Ratio=None,
+        Node_Savings=None,
+        Counters=None,
+        Memory=None,
+        Precision=None
+    ):
+        """
+        Adds one simulation result; takes the same arguments as Log_Path_Metrics.
+        """
+        now = datetime.now().replace(microsecond=0)
+
+        if is_benchmark and not benchmark_name:
+            raise ValueError(
+                "Must provide benchmark_name when is_benchmark=True")
+
+        if self._walls is None or not self.static_map:
+            self._walls = sum(row.count(1) for row in grid)
+
+        # Typed values; missing ones stay None until the row is rendered for its format
+        record = {
+            "Timestamp": now,
+            "Start": start,
+            "End": end,
+            "Walls": self._walls,
+            "Path Length": len(path) if path else -1,
+            "Agent Type": Agent_Type.capitalize(),
+            "Noise Level": Noise_Level,
+            "Max Depth": Max_Depth,
+            "Success": bool(Success),
+            "Nodes Explored": Nodes_Explored,
+            "Search Time (μs)": int(Search_Time * 1_000_000) if Search_Time is not None else None,
+            "Seed": seed,
+            "Search Mode": Search_Mode,
+            "Heuristic": Heuristic,
+            "Timing": Timing,
+            "Weight": Weight,
+            "Path Ratio": round(Path_Ratio, 4) if Path_Ratio is not None else None,
+            "Node Savings (%)": round(Node_Savings, 2) if Node_Savings is not None else None
+        }
+
+        counters = Counters or {}
+        for key, column in COUNTER_COLUMNS.items():
+            record[column] = counters.get(key)
+
+        memory = Memory or {}
+        for key, column in MEMORY_COLUMNS.items():
+            record[column] = memory.get(key)
+
+        precision = Precision or {}
+        for key, column in TIMING_COLUMNS.items():
+            record[column] = precision.get(key)
+
+        filepath = self.results_path(Agent_Type, is_benchmark, benchmark_name, now)
+        if filepath not in self._files:
+            self._open(filepath, list(record.keys()), Agent_Type, is_benchmark, now)
+
+        self._pending.setdefault(filepath, []).append(record)
+        self._pending_count += 1
+        if self.buffer_rows is not None and self._pending_count >= self.buffer_rows:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes every buffered row to its file.
+        """
+        for filepath, records in self._pending.items():
+            self._files[filepath].write_rows(records)
+        self._pending.clear()
+        self._pending_count = 0
+
+    def write_marks(self):
+        """
+        Returns where the buffered rows of each file will be written: a byte
+        offset for CSV files, the part file name for Parquet datasets.
+
+        A checkpoint journals these before commit(), so if the run stops before
+        the jobs are journaled, discard_rows can remove those rows again.
+
+        Returns:
+            dict: Results path -> write mark (JSON-serialisable)
+        """
+        return {filepath: self._files[filepath].write_mark() for filepath in self._pending}
+
+    def commit(self):
+        """
+        Writes the buffered rows and makes every row written so far durable,
+        so a checkpoint taken afterwards never claims rows that could be lost.
+        """
+        self.flush()
+        for results in self._files.values():
+            results.sync()
+
+    def close(self):
+        """
+        Writes the remaining rows and closes every open file.
+        """
+        self.flush()
+        for results in self._files.values():
+            results.close()
+        self._files.clear()
+
+    def results_path(self, Agent_Type, is_benchmark=False, benchmark_name=None, now=None):
+        """
+        Returns the file (or Parquet dataset folder) an agent's rows are written to.
+        """
+        now = now or datetime.now()
+        agent_folder = f"{config.DATA_DIR}/metrics/{Agent_Type.lower()}"
+        extension = "csv" if self.results_format == "csv" else "parquet"
+
+        # Benchmark data is saved under a fixed file for that map/agent; other logs are grouped by date
+        if is_benchmark:
+            filename = f"{benchmark_name}_{Agent_Type.lower()}_metrics.{extension}"
+            return os.path.join(agent_folder, "benchmark_data", filename)
+        return os.path.join(
+            agent_folder, f"{now.strftime('%Y-%m-%d')}_{Agent_Type.lower()}_metrics.temp.{extension}")
+
+    def _open(self, filepath, fieldnames, Agent_Type, is_benchmark, now):
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+        # Parquet datasets are folders of self-describing part files: nothing to archive
+        if self.results_format == "parquet":
+            self._files[filepath] = ParquetResults(filepath)
+            return
+
+        # Auto-archive yesterday’s log (only for non-benchmark runs)
+        if not is_benchmark and filepath not in cleared_files:
+            archive_folder = os.path.join(os.path.dirname(filepath), "archive")
+            os.makedirs(archive_folder, exist_ok=True)
+            if os.path.exists(filepath):
+                modified_time = datetime.fromtimestamp(os.path.getmtime(filepath))
+                if modified_time.date() != now.date():
+                    archived_name = os.path.join(
+                        archive_folder,
+                        f"{modified_time.strftime('%Y-%m-%d_%H-%M-%S')}_{Agent_Type.lower()}_metrics.temp.csv"
+                    )
+                    shutil.move(filepath, archived_name)
+            cleared_files.add(filepath)
+
+        # Archive files written with an older set of columns
+        if filepath not in checked_headers:
+            if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
+                with open(filepath, newline="", encoding="utf-8") as csvfile:
+                    header = next(csv.reader(csvfile), [])
+                if header != fieldnames:
+                    archive_folder = os.path.join(os.path.dirname(filepath), "archive")
+                    os.makedirs(archive_folder, exist_ok=True)
+                    archived_name = os.path.join(
+                        archive_folder,
+                        f"{now.strftime('%Y-%m-%d_%H-%M-%S')}_{os.path.basename(filepath)}"
+                    )
+                    shutil.move(filepath, archived_name)
+            checked_headers.add(filepath)
+
+        self._files[filepath] = _CsvResults(filepath, fieldnames)
+
+
+def discard_rows(marks):
+    """
+    Removes the rows written after the given write marks (see MetricsSink.write_marks).
+
+    Used on --resume to drop the rows of a checkpoint that stopped before its
+    jobs were journaled, so they are not written twice when those jobs run
+    again. Assumes no other batch wrote to the same results file since.
+    """
+    for filepath, mark in marks.items():
+        if "part" in mark:
+            # Parquet: the part (finished or still in progress) those rows went to
+            for name in (mark["part"], "_" + mark["part"]):
+                path = os.path.join(filepath, name)
+                if os.path.exists(path):
+                    os.remove(path)
+        elif os.path.exists(filepath) and os.path.getsize(filepath) > mark["offset"]:
+            with open(filepath, "r+b") as f:
+                f.truncate(mark["offset"])
+                os.fsync(f.fileno())
+
 
 def Log_Path_Metrics(
     grid,
@@ -21,76 +311,57 @@ def Log_Path_Metrics(
     Search_Time=None,
     is_benchmark=False,
     benchmark_name=None,
-    seed=None
+    seed=None,
+    Search_Mode="astar",
+    Heuristic="manhattan",
+    Timing="measured",
+    Weight=None,
+    Path_Ratio=None,
+    Node_Savings=None,
+    Counters=None,
+    Memory=None,
+    Precision=None
 ):
     """
     Logs all simulation results into a metrics CSV file. Supports both regular and benchmark modes.
 
     If a benchmark is active, the data is saved under a fixed file for that map/agent.
     Otherwise, logs are grouped by date and archived daily.
-    """
-    now = datetime.now()
-    today_str = now.strftime("%Y-%m-%d")
-    timestamp_str = now.strftime("%Y-%m-%d %H:%M:%S")
+    If an existing file was written with different columns, it is archived and a fresh file is started.
+    Timing records where the search time came from: "measured", "repeated" (the median
+    of a precision-timed run), "replan" (a dynamic-agent repair after a wall change),
+    "traced" or "cached" (the last two are logged with a search time of N/A).
+    Weight, Path_Ratio and Node_Savings describe bounded-suboptimal runs: the bound w,
+    path cost relative to the optimal path, and the % of nodes saved against plain A*.
+    Counters is the search's stats dict; the counters in engines.counters get their own
+    columns (N/A when a search mode does not report them).
+    Memory holds the peak traced allocation and frontier/closed sizes of memory-mode
+    benchmark runs (see utils.memory_profile); they are N/A otherwise.
+    Precision holds the min, median and IQR (ns) of precision-timed runs, which
+    repeat the search after warming up (see utils.timing); N/A otherwise.
 
-    agent_folder = f"{config.DATA_DIR}/metrics/{Agent_Type.lower()}"
-
-    if is_benchmark:
-        if not benchmark_name:
-            raise ValueError(
-                "Must provide benchmark_name when is_benchmark=True")
-
-        filename = f"{benchmark_name}_{Agent_Type.lower()}_metrics.csv"
-        filepath = os.path.join(agent_folder, "benchmark_data", filename)
-        graph_folder = os.path.join(agent_folder, "benchmark_data", "graphs")
-
-    else:
-        filepath = os.path.join(
-            agent_folder, f"{today_str}_{Agent_Type.lower()}_metrics.temp.csv")
-        archive_folder = os.path.join(agent_folder, "archive")
-        os.makedirs(archive_folder, exist_ok=True)
-
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-    # Auto-archive yesterday’s log (only for non-benchmark runs)
-    if not is_benchmark and filepath not in cleared_files:
-        if os.path.exists(filepath):
-            modified_time = datetime.fromtimestamp(os.path.getmtime(filepath))
-            if modified_time.date() != now.date():
-                archived_name = os.path.join(
-                    archive_folder,
-                    f"{modified_time.strftime('%Y-%m-%d_%H-%M-%S')}_{Agent_Type.lower()}_metrics.temp.csv"
-                )
-                shutil.move(filepath, archived_name)
-                cleared_files.discard(filepath)
-        cleared_files.add(filepath)
-
-    # Count walls and compute path stats
-    walls = sum(row.count(1) for row in grid)
-    path_length = len(path) if path else -1
-    search_time_micro = int(
-        Search_Time * 1_000_000) if Search_Time is not None else "N/A"
-
-    row_data = {
-        "Timestamp": timestamp_str,
-        "Start": start,
-        "End": end,
-        "Walls": walls,
-        "Path Length": path_length,
-        "Agent Type": Agent_Type.capitalize(),
-        "Noise Level": Noise_Level if Noise_Level is not None else "N/A",
-        "Max Depth": Max_Depth if Max_Depth is not None else "N/A",
-        "Success": "Yes" if Success else "No",
-        "Nodes Explored": Nodes_Explored if Nodes_Explored is not None else "N/A",
-        "Search Time (μs)": search_time_micro,
-        "Seed": seed if seed is not None else "N/A"
-    }
-
-    # Append row to CSV; add header if it's a new file
-    with open(filepath, mode="a", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=row_data.keys())
-
-        if os.path.getsize(filepath) == 0:
-            writer.writeheader()
-
-        writer.writerow(row_data)
+    Writes a single row through a one-off MetricsSink; use a MetricsSink directly
+    to log many rows without reopening the file each time.
+    """
+    with MetricsSink(buffer_rows=1) as sink:
+        sink.log(
+            grid, start, end, path,
+            Agent_Type=Agent_Type,
+            Noise_Level=Noise_Level,
+            Max_Depth=Max_Depth,
+            Success=Success,
+            Nodes_Explored=Nodes_Explored,
+            Search_Time=Search_Time,
+            is_benchmark=is_benchmark,
+            benchmark_name=benchmark_name,
+            seed=seed,
+            Search_Mode=Search_Mode,
+            Heuristic=Heuristic,
+            Timing=Timing,
+            Weight=Weight,
+            Path_Ratio=Path_Ratio,
+            Node_Savings=Node_Savings,
+            Counters=Counters,
+            Memory=Memory,
+            Precision=Precision
+        )
@@ -0,0 +1,418 @@
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from tqdm import tqdm
+
+import config
+from engines.churn import DEFAULT_CHURN_CHANGES, replay_churn
+from engines.grid_graph import GridGraph
+from lookahead import A_Star_Search
+from run_benchmark import BENCHMARK_MAP_PATHS, dispatch_search
+from utils.map_generators import generate_map
+from utils.map_utils import load_full_map
+from utils.timing import measure_repeated
+
+BASELINE_DIR = os.path.join(config.DATA_DIR, "baselines")
+WORKLOAD_SEED = 1234  # Fixed, so noisy workloads draw the same noise on every machine and commit
+DEFAULT_REPEATS = 30
+DEFAULT_WARMUP = 3
+DEFAULT_ROUNDS = 10
+MIN_ROUNDS = 5  # Fewer round medians can't reach a p-value below 0.01
+DEFAULT_ALPHA = 0.01
+DEFAULT_THRESHOLD = 0.10  # Ignore significant differences smaller than this fraction of the baseline median
+
+# Benchmark maps plus generated ones (family, size, seed) large enough for timings to rise above the noise
+WORKLOAD_MAPS = {
+    "easy": None,
+    "medium": None,
+    "true_maze": None,
+    "random64": ("random", 64, 7),
+    "maze63": ("maze", 63, 7),
+    "rooms96": ("rooms", 96, 7),
+}
+
+# Agent -> parameter values; the dynamic agent's is the number of wall changes replayed, as in run_benchmark
+WORKLOAD_AGENTS = {
+    "depth": [10, 40],
+    "noise": [0, 5],
+    "bounded": [1.5, 3.0],
+    "dynamic": [DEFAULT_CHURN_CHANGES],
+}
+
+# "lookahead" is the reference A_Star_Search on the list grid; "grid_graph" is what benchmarks run
+ENGINES = ("lookahead", "grid_graph")
+
+
+def load_workload_map(name):
+    """
+    Loads a benchmark map or generates one of the seeded workload maps.
+    """
+    spec = WORKLOAD_MAPS[name]
+    if spec is None:
+        return load_full_map(BENCHMARK_MAP_PATHS[name])
+    family, size, seed = spec
+    return generate_map(family, size, seed)
+
+
+def workload_matrix(map_names):
+    """
+    Lists every (map, agent, parameter, engine) workload, in a fixed order.
+
+    The bounded and dynamic agents only exist on the array-backed engine and the
+    LPA* planner, so they have no lookahead workload.
+    """
+    return [(map_name, agent, parameter, engine)
+            for map_name in map_names
+            for agent, parameters in WORKLOAD_AGENTS.items()
+            for parameter in parameters
+            for engine in ENGINES
+            if not (agent in ("bounded", "dynamic") and engine == "lookahead")]
+
+
+def workload_key(map_name, agent, parameter, engine):
+    return f"{map_name}/{agent}/{parameter}/{engine}"
+
+
+def run_workload(grid, graph, start, end, agent, parameter, engine):
+    """
+    Runs one search of a workload.
+
+    The dynamic agent plans with LPA* on a copy of the map, then repairs the
+    plan after each of `parameter` seeded wall changes; its nodes explored add
+    up the initial plan and every repair, and its path is the final one.
+
+    Returns:
+        tuple[List[tuple[int, int]], int]: The path (if any) and number of nodes explored
+    """
+    depth = parameter if agent == "depth" else None
+    noise = parameter if agent == "noise" else 0
+    if agent == "dynamic":
+        path, explored = None, 0
+        for step in replay_churn([row[:] for row in grid], start, end, parameter, seed=WORKLOAD_SEED, reference=False):
+            path = step["path"]
+            explored += step["expanded"]
+        return path, explored
+    if engine == "lookahead":
+        return A_Star_Search(grid, start, end, Noise_Level=noise, Max_Depth=depth)
+    return dispatch_search(
+        agent, graph, start, end, depth, noise, WORKLOAD_SEED, "weighted" if agent == "bounded" else "astar",
+        None, "random", "heap", parameter if agent == "bounded" else None, {})
+
+
+def measure_round(matrix, warmup, repeats):
+    """
+    Times every workload of the matrix once, with utils.timing.measure_repeated (GC off while timing).
+
+    Noise is reseeded before every call, so each repeat runs the same search;
+    the node count and path length of that search are recorded next to the timings.
+
+    Returns:
+        dict: Workload key -> (timing samples in ns, nodes explored, path length)
+    """
+    results = {}
+    maps = {}
+    for map_name, agent, parameter, engine in matrix:
+        if map_name not in maps:
+            map_data = load_workload_map(map_name)
+            maps[map_name] = (map_data["grid"], GridGraph(map_data["grid"]),
+                              tuple(map_data["start"]), tuple(map_data["end"]))
+        grid, graph, start, end = maps[map_name]
+
+        (path, explored), samples = measure_repeated(
+            run_workload, grid, graph, start, end, agent, parameter, engine,
+            warmup=warmup, repeats=repeats, disable_gc=True, setup=lambda: random.seed(WORKLOAD_SEED))
+        results[workload_key(map_name, agent, parameter, engine)] = (samples, explored, len(path) if path else -1)
+    return results
+
+
+def measure_workloads(matrix, warmup, repeats, rounds):
+    """
+    Measures the workload matrix in `rounds` rounds, each taking its share of the repeats.
+
+    Every round runs in a freshly spawned interpreter, since memory layout alone
+    makes the same code run faster or slower from one process to the next, and
+    each round's median is kept as one observation for the significance test.
+    Spreading the rounds over the whole run also means the machine slowing down
+    part-way affects every workload alike instead of looking like a change in one of them.
+
+    Returns:
+        dict: Workload key -> median (ns), nodes explored, path length, the median
+        of every round and every timing sample (ns)
+    """
+    results = {}
+    per_round = [repeats // rounds + (index < repeats % rounds) for index in range(rounds)]
+
+    for round_repeats in tqdm(per_round, desc=f"Rounds ({len(matrix)} workloads)"):
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            measured = executor.submit(measure_round, matrix, warmup, round_repeats).result()
+
+        for key, (samples, explored, path_length) in measured.items():
+            entry = results.setdefault(key, {
+                "median_ns": None,
+                "nodes_explored": explored,
+                "path_length": path_length,
+                "round_medians_ns": [],
+                "samples_ns": [],
+            })
+            entry["round_medians_ns"].append(int(np.median(samples)))
+            entry["samples_ns"].extend(samples)
+
+    for entry in results.values():
+        entry["median_ns"] = int(np.median(entry["samples_ns"]))
+    return results
+
+
+def environment():
+    """
+    Describes where a baseline was recorded; timings only compare well on the same machine.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "commit": commit,
+    }
+
+
+def mann_whitney_greater(new, base):
+    """
+    One-sided Mann-Whitney U test that `new` samples tend to be larger than `base` samples.
+
+    Uses the normal approximation with tie and continuity corrections, which is
+    close to the exact test from about 5 samples per side.
+
+    Returns:
+        float: The p-value (small when new is significantly larger)
+    """
+    n1, n2 = len(new), len(base)
+    values = sorted([(value, 0) for value in new] + [(value, 1) for value in base])
+
+    # Average ranks over ties
+    ranks = [0.0] * len(values)
+    tie_term = 0
+    i = 0
+    while i < len(values):
+        j = i
+        while j + 1 < len(values) and values[j + 1][0] == values[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tied = j - i + 1
+        tie_term += tied ** 3 - tied
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, side) in zip(ranks, values) if side == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0  # Every sample is identical
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_results(baseline, current, alpha, threshold):
+    """
+    Compares a run against a baseline, workload by workload.
+
+    A workload is a slowdown (or speedup) when the Mann-Whitney test on the
+    round medians is significant at alpha and the overall median moved by more
+    than threshold. Samples from the same round share one process, so only the
+    round medians are independent observations. Any
+    change in nodes explored or path length is flagged too: every workload is
+    seeded, so those only change when the search itself changed.
+
+    Returns:
+        list[dict]: One entry per workload in both runs, with its status
+    """
+    entries = []
+    for key, new in current.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+
+        ratio = new["median_ns"] / old["median_ns"] if old["median_ns"] else None
+        p_slower = mann_whitney_greater(new["round_medians_ns"], old["round_medians_ns"])
+        p_faster = mann_whitney_greater(old["round_medians_ns"], new["round_medians_ns"])
+
+        if (new["nodes_explored"], new["path_length"]) != (old["nodes_explored"], old["path_length"]):
+            status = "changed"
+        elif p_slower < alpha and ratio is not None and ratio > 1 + threshold:
+            status = "slower"
+        elif p_faster < alpha and ratio is not None and ratio < 1 - threshold:
+            status = "faster"
+        else:
+            status = "same"
+
+        entries.append({
+            "workload": key,
+            "status": status,
+            "baseline_median_ns": old["median_ns"],
+            "median_ns": new["median_ns"],
+            "ratio": round(ratio, 4) if ratio is not None else None,
+            "p_slower": round(p_slower, 6),
+            "p_faster": round(p_faster, 6),
+            "baseline_nodes": old["nodes_explored"],
+            "nodes_explored": new["nodes_explored"],
+            "baseline_path_length": old["path_length"],
+            "path_length": new["path_length"],
+        })
+    return entries
+
+
+def baseline_path(name):
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+def record(args):
+    """
+    Runs the workload matrix and saves it as a baseline.
+    """
+    workloads = measure_workloads(workload_matrix(args.maps), args.warmup, args.repeats, args.rounds)
+    baseline = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment(),
+        "warmup": args.warmup,
+        "repeats": args.repeats,
+        "rounds": args.rounds,
+        "workload_seed": WORKLOAD_SEED,
+        "workloads": workloads,
+    }
+
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    path = baseline_path(args.baseline)
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=4)
+    print(f"\n[✓] Baseline of {len(workloads)} workloads saved to {path}")
+    return 0
+
+
+def compare(args):
+    """
+    Runs the workload matrix and compares it against a saved baseline.
+
+    Returns:
+        int: The exit code: 1 if any workload got slower or changed its results, 0 otherwise
+    """
+    path = baseline_path(args.baseline)
+    if not os.path.isfile(path):
+        raise SystemExit(f"[!] No baseline at {path}; record one first with: python perf_regression.py record")
+    with open(path) as f:
+        baseline = json.load(f)
+
+    env = environment()
+    recorded = baseline["environment"]
+    if (env["platform"], env["python"], env["processor"]) != (
+            recorded["platform"], recorded["python"], recorded["processor"]):
+        print(f"[!] Baseline was recorded on {recorded['platform']} (Python {recorded['python']}); "
+              f"timings may not be comparable with {env['platform']} (Python {env['python']})")
+
+    matrix = workload_matrix(args.maps)
+    current = measure_workloads(matrix, baseline["warmup"], baseline["repeats"], baseline["rounds"])
+    entries = compare_results(baseline["workloads"], current, args.alpha, args.threshold)
+
+    # A slowdown only counts if it shows up again: re-measure just those workloads
+    for _ in range(args.retries):
+        slower = {entry["workload"] for entry in entries if entry["status"] == "slower"}
+        if not slower:
+            break
+        print(f"[~] Re-measuring {len(slower)} slower workloads to confirm")
+        retried = measure_workloads([workload for workload in matrix if workload_key(*workload) in slower],
+                                    baseline["warmup"], baseline["repeats"], baseline["rounds"])
+        confirmed = {entry["workload"]: entry
+                     for entry in compare_results(baseline["workloads"], retried, args.alpha, args.threshold)}
+        entries = [confirmed[entry["workload"]] if entry["workload"] in confirmed else entry for entry in entries]
+
+    missing = sorted(set(current) - set(baseline["workloads"]))
+    if missing:
+        print(f"[!] {len(missing)} workloads are not in the baseline and were skipped (re-record to include them)")
+
+    print(f"\nBaseline: {path} (commit {recorded['commit']}, {baseline['timestamp']})")
+    print(f"{'Workload':<40} {'Base (µs)':>10} {'Now (µs)':>10} {'Ratio':>7} {'p':>9}  Status")
+    for entry in entries:
+        p_value = entry["p_faster"] if entry["status"] == "faster" else entry["p_slower"]
+        line = (f"{entry['workload']:<40} {entry['baseline_median_ns'] / 1000:>10.1f} "
+                f"{entry['median_ns'] / 1000:>10.1f} {entry['ratio'] or 0:>7.3f} {p_value:>9.4f}  {entry['status']}")
+        if entry["status"] == "changed":
+            line += (f" (nodes {entry['baseline_nodes']} -> {entry['nodes_explored']}, "
+                     f"path {entry['baseline_path_length']} -> {entry['path_length']})")
+        print(line)
+
+    counts = {status: sum(1 for e in entries if e["status"] == status)
+              for status in ("slower", "changed", "faster", "same")}
+    print(f"\nSlower: {counts['slower']} | Changed results: {counts['changed']} | "
+          f"Faster: {counts['faster']} | Same: {counts['same']} (alpha {args.alpha}, threshold {args.threshold:.0%})")
+
+    if args.report:
+        os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+        with open(args.report, "w") as f:
+            json.dump({
+                "baseline": path,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "environment": env,
+                "alpha": args.alpha,
+                "threshold": args.threshold,
+                "counts": counts,
+                "workloads": entries,
+            }, f, indent=4)
+
+    failed = counts["slower"] + counts["changed"]
+    print("[!] Performance regression detected" if failed else "[✓] No regressions")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Record search performance baselines and check new runs against them.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="Run the workload matrix and save it as a baseline")
+    record_parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                               help="Timed calls per workload")
+    record_parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP,
+                               help="Untimed calls before the timed ones, in every round")
+    record_parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS,
+                               help="Passes over the matrix the repeats are spread across, each in a fresh process")
+
+    compare_parser = commands.add_parser(
+        "compare", help="Run the workload matrix and compare it with a baseline (exit code 1 on regressions)")
+    compare_parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA,
+                                help="Significance level of the Mann-Whitney U test")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="Smallest change in median time that counts, as a fraction")
+    compare_parser.add_argument("--retries", type=int, default=1,
+                                help="Times a slower workload is re-measured; it only fails if it is slower every time")
+    compare_parser.add_argument("--report",
+                                help="Also save the comparison as JSON to this file")
+
+    for command_parser in (record_parser, compare_parser):
+        command_parser.add_argument("--baseline", default="default",
+                                    help=f"Baseline name, stored as {BASELINE_DIR}/<name>.json")
+        command_parser.add_argument("--maps", nargs="+", choices=list(WORKLOAD_MAPS), default=list(WORKLOAD_MAPS),
+                                    help="Only run the workloads on these maps")
+
+    args = parser.parse_args()
+
+    if args.command == "record" and (args.rounds < MIN_ROUNDS or args.repeats < args.rounds or args.warmup < 0):
+        parser.error(f"--rounds must be at least {MIN_ROUNDS} (for the significance test), --repeats at least "
+                     f"--rounds and --warmup at least 0")
+    if args.command == "compare" and not (0 < args.alpha < 1 and args.threshold >= 0 and args.retries >= 0):
+        parser.error("--alpha must be in (0, 1), --threshold at least 0 and --retries at least 0")
+
+    sys.exit(record(args) if args.command == "record" else compare(args))
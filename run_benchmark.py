@@ -4,14 +4,35 @@ import random
 import time
 import json
 import config
+from itertools import islice
+import numpy as np
 from tqdm import tqdm
 from statistics import mean
+from concurrent.futures import ProcessPoolExecutor
 
 from config import Global_Seed
-from utils.map_utils import load_full_map
+from utils.map_utils import load_full_map, grid_digest
 from gridworld import GridWorld
-from lookahead import A_Star_Search
-from metrics import Log_Path_Metrics
+from engines.grid_graph import GridGraph
+from engines.depth_sweep import DepthTrace
+from engines.modes import SEARCH_MODES, run_search
+from engines.open_list import OPEN_LIST_KINDS
+from engines.workspace import SearchWorkspace
+from engines.trace import TraceBuffer, traced_search
+from engines.counters import SEARCH_COUNTERS, finish_counters
+from engines.bounded import BOUNDED_MODES, DEFAULT_WEIGHT_RANGE, DEFAULT_WEIGHT_STEP, run_bounded
+from engines.landmarks import LandmarkHeuristic, DEFAULT_LANDMARK_COUNT
+from engines.noisy import noisy_search
+from engines.churn import DEFAULT_ADD_FRACTION, DEFAULT_CHURN_CELLS, DEFAULT_CHURN_CHANGES, replay_churn
+from engines.hierarchical import DEFAULT_CLUSTER_SIZE
+from engines.distance_field import distance_field, open_mask_from_grid
+from utils.memory_profile import measure_peak, memory_entry
+from utils.timing import DEFAULT_REPEATS, DEFAULT_WARMUP, measure_repeated, timing_entry
+from utils.columnar import RESULT_FORMATS, columnar_available
+from utils.checkpoint import CHECKPOINT_DIR, CHECKPOINT_EVERY, CHECKPOINT_SECONDS, CheckpointJournal, job_key
+from utils.movingai import iter_scenarios, load_movingai_map, resolve_map_path, scenario_name
+from utils.result_cache import ResultCache, result_key
+from metrics import Log_Path_Metrics, MetricsSink, discard_rows
 
 # Define filepaths for each benchmark map
 BENCHMARK_MAP_PATHS = {
@@ -24,33 +45,155 @@ DEFAULT_DEPTH_RANGE = (5, 35)
 DEFAULT_NOISE_RANGE = (0, 10)
 
 
-def run_simulation(agent_type, grid, start, end, depth=None, noise=None, seed=None, benchmark_name=None):
+def run_simulation(agent_type, grid, start, end, depth=None, noise=None, seed=None, benchmark_name=None, graph=None,
+                   depth_trace=None, search="astar", heuristic=None, noise_engine="random", cache=None, digest=None,
+                   open_list="heap", weight=None, reference=None, trace_file=None, measure_memory=False,
+                   precision=None, log_metrics=Log_Path_Metrics):
     """
     Runs a single simulation with the specified agent and parameters.
 
     Records the result to a CSV file using Log_Path_Metrics and returns summary info.
+    Pass a prebuilt GridGraph to avoid flattening the grid again for every run.
+    Pass a DepthTrace to answer a depth-limited run from a single traced search;
+    no search is timed in that case, so the search time is recorded as N/A.
+    Pass a LandmarkHeuristic to search with ALT instead of Manhattan distance.
+    With noise_engine="numpy" the noise agent draws its noise from a generator
+    seeded with this run's seed instead of the global `random` module.
+    open_list="bucket" runs astar on a bucket queue (noise-free runs only).
+    The bounded agent runs the bounded-suboptimal mode named by `search` with the
+    given weight; pass reference = (optimal path length, optimal nodes explored)
+    to log its path ratio and node savings against plain A*.
+    Pass trace_file to also save the run's search events (.npz) for offline
+    profiling; the traced search is a separate run after the timed one.
+    With measure_memory=True the search is repeated once more under tracemalloc to
+    record its peak allocation and the final frontier and closed-set sizes; like
+    tracing, this run is never timed.
+    Pass precision = (warmup, repeats, disable_gc) to time the search the
+    precision way (see utils.timing): after the warmup calls the search is
+    repeated and the min, median and IQR in ns are logged, with the median as
+    the search time. Counters are reset and noise is reseeded before every call,
+    so each repeat runs the same search.
+    The metrics row is written with log_metrics: Log_Path_Metrics by default,
+    a MetricsSink's log method in run_batch, or a callback that hands the row back
+    to the parent in worker processes.
+    Pass a ResultCache to replay deterministic (noise-free) runs from earlier
+    results; replayed runs are logged with a search time of N/A and a "cached"
+    timing so only measured times feed the averages.
 
     Returns:
-        dict: Contains success status, path length, nodes explored, search time, and seed used.
+        dict: Contains success status, path length, nodes explored, search time, and seed used,
+        plus per-direction node counts for the bidirectional search mode and
+        abstract/concrete node counts for the hierarchical search mode.
+        The "timing" entry is "measured", "repeated" (precision-timed), "traced" (answered by a
+        DepthTrace) or "cached"; precision-timed runs also report time_min_ns, time_median_ns and time_iqr_ns.
+        Bounded runs also report their weight, path ratio and node savings.
+        Memory-mode runs also report peak memory (KiB) and frontier/closed sizes.
     """
-    if seed is not None:
+    if seed is not None and noise_engine == "random":
         random.seed(seed)
 
-    start_time = time.perf_counter()
+    if graph is None:
+        graph = GridGraph(grid)
 
-    if agent_type == "depth":
-        path, explored = A_Star_Search(grid, start, end, Max_Depth=depth)
-    elif agent_type == "noise":
-        path, explored = A_Star_Search(grid, start, end, Noise_Level=noise)
+    stats = {}
+    cache_key = None
+    cached = None
+    timing_stats = None
+
+    # Without noise the result depends only on the map and the search settings
+    if cache is not None and not (agent_type == "noise" and noise):
+        cache_key = result_key(
+            digest or grid_digest(grid),
+            agent=agent_type,
+            start=start,
+            end=end,
+            depth=depth,
+            search=search,
+            heuristic="alt" if heuristic is not None else "manhattan",
+            landmarks=heuristic.count if heuristic is not None else None,
+            cluster_size=DEFAULT_CLUSTER_SIZE if search == "hierarchical" else None,
+            open_list=open_list,
+            weight=weight,
+        )
+        cached = cache.get(cache_key)
+
+    if cached is not None:
+        path, explored = cached["path"], cached["explored"]
+        stats = dict(cached["stats"])
+        duration = None
+        timing = "cached"
+    elif agent_type == "depth" and depth_trace is not None:
+        path, explored = depth_trace.result(depth)
+        duration = None
+        timing = "traced"
+    elif precision is not None:
+        warmup, repeats, disable_gc = precision
+
+        def reset():
+            # Every call starts from the same state: fresh counters and (for noise) the same draws
+            stats.clear()
+            if seed is not None and noise_engine == "random":
+                random.seed(seed)
+
+        (path, explored), samples = measure_repeated(
+            dispatch_search, agent_type, graph, start, end, depth, noise, seed, search, heuristic, noise_engine,
+            open_list, weight, stats, warmup=warmup, repeats=repeats, disable_gc=disable_gc, setup=reset)
+        timing_stats = timing_entry(samples)
+        duration = timing_stats["median_ns"] / 1e9
+        timing = "repeated"
     else:
-        path, explored = A_Star_Search(grid, start, end)
+        start_time = time.perf_counter()
+        path, explored = dispatch_search(
+            agent_type, graph, start, end, depth, noise, seed, search, heuristic, noise_engine,
+            open_list, weight, stats)
+        end_time = time.perf_counter()
+        duration = end_time - start_time
+        timing = "measured"
+
+    if timing in ("measured", "repeated"):
+        # Derived from the raw counters after the clock has stopped, so it never adds to the search time
+        finish_counters(stats, path, explored)
+
+    if cache_key is not None and cached is None:
+        cache.put(cache_key, path, explored, stats)
 
-    end_time = time.perf_counter()
-    duration = end_time - start_time
+    memory = None
+    if measure_memory:
+        # A separate run: tracemalloc slows allocation down, so it never overlaps the timed search
+        if seed is not None and noise_engine == "random":
+            random.seed(seed)
+        memory_stats = {}
+        _, peak_bytes = measure_peak(
+            dispatch_search, agent_type, graph, start, end, depth, noise, seed, search, heuristic,
+            noise_engine, open_list, weight, memory_stats)
+        memory = memory_entry(peak_bytes, memory_stats)
+
+    if trace_file is not None:
+        # Replay the same random draws so the trace matches the logged run
+        if seed is not None:
+            random.seed(seed)
+        trace = TraceBuffer(graph.width, graph.height)
+        traced_search(
+            graph, start, end, trace,
+            Noise_Level=noise if agent_type == "noise" else 0,
+            Max_Depth=depth if agent_type == "depth" else None,
+            Heuristic=heuristic)
+        os.makedirs(os.path.dirname(trace_file), exist_ok=True)
+        trace.dump(trace_file)
 
     success = path is not None and len(path) >= 2
 
-    Log_Path_Metrics(
+    path_ratio = None
+    node_savings = None
+    if reference is not None:
+        optimal_length, optimal_explored = reference
+        if success and optimal_length and optimal_length > 1:
+            # Compare path costs (moves), which is what the weight bounds
+            path_ratio = (len(path) - 1) / (optimal_length - 1)
+        if optimal_explored:
+            node_savings = 100 * (1 - explored / optimal_explored)
+
+    log_metrics(
         grid=grid,
         start=start,
         end=end,
@@ -63,70 +206,546 @@ def run_simulation(agent_type, grid, start, end, depth=None, noise=None, seed=No
         Search_Time=duration,
         is_benchmark=True,
         benchmark_name=benchmark_name,
-        seed=seed
+        seed=seed,
+        Search_Mode=search,
+        Heuristic="alt" if heuristic is not None else "manhattan",
+        Timing=timing,
+        Weight=weight,
+        Path_Ratio=path_ratio,
+        Node_Savings=node_savings,
+        Counters=stats,
+        Memory=memory,
+        Precision=timing_stats
     )
 
-    return {
+    result = {
         "seed": seed,
         "success": success,
         "path_length": len(path) if path else -1,
         "nodes_explored": explored,
-        "search_time_sec": round(duration, 6)
+        "search_time_sec": round(duration, 6) if duration is not None else None,
+        "timing": timing
     }
 
+    if agent_type == "bounded":
+        result["weight"] = weight
+        result["path_ratio"] = round(path_ratio, 4) if path_ratio is not None else None
+        result["node_savings_pct"] = round(node_savings, 2) if node_savings is not None else None
 
-def run_batch(args):
+    for key in SEARCH_COUNTERS:
+        if stats.get(key) is not None:
+            result[key] = stats[key]
+
+    if timing_stats is not None:
+        result["time_min_ns"] = timing_stats["min_ns"]
+        result["time_median_ns"] = timing_stats["median_ns"]
+        result["time_iqr_ns"] = timing_stats["iqr_ns"]
+
+    if memory is not None:
+        result["peak_memory_kib"] = memory["peak_kib"]
+        result["frontier_size"] = memory["frontier"]
+        result["closed_size"] = memory["closed"]
+
+    if "forward" in stats:
+        result["nodes_forward"] = stats["forward"]
+        result["nodes_backward"] = stats["backward"]
+    if "abstract" in stats:
+        result["nodes_abstract"] = stats["abstract"]
+        result["nodes_concrete"] = stats["concrete"]
+
+    return result
+
+
+def run_churn(context, grid, agent_type, search, seed, churn, churn_cells, churn_add, measure_memory=False,
+              trace_file=None, precision=None, log_metrics=Log_Path_Metrics):
     """
-    Runs a full batch of benchmark simulations for the given agent and settings.
+    Runs the dynamic agent under wall churn: one LPA* plan on the benchmark map,
+    then `churn` seeded changes of churn_cells tiles each, with the plan repaired
+    after every change (see engines.churn).
 
-    Aggregates and prints performance metrics, and saves them as a JSON summary.
+    A metrics row is logged for the initial plan (timing "measured") and for
+    every replan (timing "replan"), each with the walls of the map at that point.
+    Every change is also solved by a fresh, separately timed A* search, which
+    gives the cost of replanning from zero and the optimal length the repaired
+    path is checked against.
+
+    Returns:
+        dict: Like run_simulation for the initial plan, plus the per-change
+        samples under "replan" (latency, nodes re-expanded, success, fresh A*
+        nodes and time, and whether the path length matched fresh A*)
     """
-    benchmark_path = BENCHMARK_MAP_PATHS[args.benchmark]
-    map_data = load_full_map(benchmark_path)
+    start, end = context["start"], context["end"]
+    result = None
+    samples = {"seconds": [], "expanded": [], "success": [], "fresh_seconds": [], "fresh_expanded": [],
+               "matches": []}
+
+    for step in replay_churn(grid, start, end, churn, churn_cells, churn_add, seed=seed):
+        path = step["path"]
+        success = path is not None and len(path) >= 2
+        log_metrics(
+            grid=grid,
+            start=start,
+            end=end,
+            path=path if success else None,
+            Agent_Type=agent_type,
+            Success=success,
+            Nodes_Explored=step["expanded"],
+            Search_Time=step["seconds"],
+            is_benchmark=True,
+            benchmark_name=context["benchmark_name"],
+            seed=seed,
+            Search_Mode=search,
+            Timing="replan" if step["change"] else "measured"
+        )
+
+        if result is None:
+            result = {
+                "seed": seed,
+                "success": success,
+                "path_length": len(path) if path else -1,
+                "nodes_explored": step["expanded"],
+                "search_time_sec": round(step["seconds"], 6),
+                "timing": "measured",
+                "replan": samples
+            }
+            continue
+
+        samples["seconds"].append(round(step["seconds"], 6))
+        samples["expanded"].append(step["expanded"])
+        samples["success"].append(success)
+        samples["fresh_seconds"].append(round(step["fresh_seconds"], 6))
+        samples["fresh_expanded"].append(step["fresh_expanded"])
+        samples["matches"].append((len(path) if path else -1) == step["fresh_length"])
+
+    return result
 
+
+def replanning_summary(results, args):
+    """
+    Pools the replan samples of every run into the summary's "replanning" section.
+    """
+    seconds = [value for r in results for value in r["replan"]["seconds"]]
+    expanded = [value for r in results for value in r["replan"]["expanded"]]
+    fresh_seconds = [value for r in results for value in r["replan"]["fresh_seconds"]]
+    fresh_expanded = [value for r in results for value in r["replan"]["fresh_expanded"]]
+    successes = [value for r in results for value in r["replan"]["success"]]
+    matches = [value for r in results for value in r["replan"]["matches"]]
+    if not seconds:
+        return None
+
+    percentiles = np.percentile(seconds, [50, 90, 99])
+    return {
+        "changes_per_run": args.churn,
+        "cells_per_change": args.churn_cells,
+        "add_fraction": args.churn_add,
+        "replans": len(seconds),
+        "avg_replan_time_sec": round(mean(seconds), 6),
+        "p50_replan_time_sec": round(float(percentiles[0]), 6),
+        "p90_replan_time_sec": round(float(percentiles[1]), 6),
+        "p99_replan_time_sec": round(float(percentiles[2]), 6),
+        "max_replan_time_sec": max(seconds),
+        "avg_nodes_reexpanded": round(mean(expanded), 2),
+        "max_nodes_reexpanded": max(expanded),
+        "success_rate_after_change": round(sum(successes) / len(successes), 4),
+        "avg_fresh_time_sec": round(mean(fresh_seconds), 6),
+        "avg_fresh_nodes_explored": round(mean(fresh_expanded), 2),
+        # Below 1: repairing expands fewer nodes (or takes less time) than replanning from zero
+        "reexpansion_ratio": round(sum(expanded) / sum(fresh_expanded), 4) if sum(fresh_expanded) else None,
+        "time_ratio": round(sum(seconds) / sum(fresh_seconds), 4) if sum(fresh_seconds) else None,
+        "path_mismatches": matches.count(False),
+    }
+
+
+def dispatch_search(agent_type, graph, start, end, depth, noise, seed, search, heuristic, noise_engine,
+                    open_list, weight, stats):
+    """
+    Runs the search for one benchmark run of the given agent.
+
+    Returns:
+        tuple[List[tuple[int, int]], int]: The path (if any) and number of nodes explored
+    """
+    if agent_type == "depth":
+        return run_search(
+            search, graph, start, end, Max_Depth=depth, stats=stats, Heuristic=heuristic,
+            open_list=open_list)
+    if agent_type == "bounded":
+        return run_bounded(
+            search, graph, start, end, Weight=weight, Heuristic=heuristic, stats=stats)
+    if agent_type == "noise" and noise_engine == "numpy":
+        return noisy_search(
+            graph, start, end, noise, np.random.default_rng(seed), Heuristic=heuristic, stats=stats)
+    if agent_type == "noise":
+        return run_search(
+            search, graph, start, end, Noise_Level=noise, stats=stats, Heuristic=heuristic,
+            open_list=open_list)
+    return run_search(
+        search, graph, start, end, stats=stats, Heuristic=heuristic, open_list=open_list)
+
+
+def weight_range(min_weight, max_weight, step):
+    """
+    Returns the weights from min_weight to max_weight (inclusive) in steps of `step`.
+    """
+    count = int(round((max_weight - min_weight) / step)) + 1 if step > 0 else 1
+    return [round(min_weight + i * step, 4) for i in range(max(count, 1))]
+
+
+def load_context(args):
+    """
+    Loads the benchmark map and builds everything its runs share: the flattened
+    graph, landmark heuristic, result cache and (with --sweep) the depth trace.
+
+    Called once by the parent process and once by every worker process.
+
+    Returns:
+        dict: The shared per-map state, passed to run_job
+    """
+    map_data = load_full_map(BENCHMARK_MAP_PATHS[args.benchmark])
     grid_data = map_data["grid"]
+
+    # The benchmark map never changes during a batch, so flatten it once
+    graph = GridGraph(grid_data)
+
+    # Landmark tables are loaded from (or saved to) the on-disk cache on first use
+    heuristic = LandmarkHeuristic(grid_data, args.landmarks) if args.heuristic == "alt" else None
+
     start = tuple(map_data["start"])
     end = tuple(map_data["end"])
-    rows, cols = len(grid_data), len(grid_data[0])
 
-    print(
-        f"\n[~] Starting benchmark for agent: {args.agent} | Map: {args.benchmark} | Runs: {args.runs}")
+    # One traced search answers every depth budget on this map
+    depth_trace = None
+    if args.agent == "depth" and args.sweep:
+        depth_trace = DepthTrace(graph, start, end, Heuristic=heuristic, open_list=args.open_list)
+
+    return {
+        "grid_data": grid_data,
+        "start": start,
+        "end": end,
+        "rows": len(grid_data),
+        "cols": len(grid_data[0]),
+        "graph": graph,
+        "heuristic": heuristic,
+        # Noise-free runs are replayed from earlier results when the cache is enabled
+        "cache": ResultCache() if args.cache else None,
+        "digest": grid_digest(grid_data) if args.cache else None,
+        "depth_trace": depth_trace,
+        "benchmark_name": args.benchmark,
+    }
+
+
+def run_job(context, job, log_metrics=Log_Path_Metrics):
+    """
+    Runs one benchmark job (the run_simulation arguments that change between runs)
+    on a fresh copy of the map. Dynamic-agent jobs with churn go to run_churn instead.
+    """
+    grid = GridWorld(context["cols"], context["rows"])
+    grid.grid = [row[:] for row in context["grid_data"]]
+    if job.get("churn"):
+        return run_churn(context, grid.grid, log_metrics=log_metrics, **job)
+    return run_simulation(
+        grid=grid.grid, start=context["start"], end=context["end"], benchmark_name=context["benchmark_name"],
+        graph=context["graph"], depth_trace=context["depth_trace"], heuristic=context["heuristic"],
+        cache=context["cache"], digest=context["digest"], log_metrics=log_metrics, **job)
+
 
-    summary_results = []
+# Per-process state of --workers runs, set up once by the pool initializer
+_worker_context = None
 
-    # Loop for depth-limited agent
+
+def _init_worker(args):
+    global _worker_context
+    _worker_context = load_context(args)
+
+
+def _run_worker_job(job):
+    """
+    Runs a job in a worker process and hands its metrics rows back to the parent, which does all the writing.
+    """
+    records = []
+    result = run_job(_worker_context, job, log_metrics=lambda **record: records.append(record))
+    return result, records
+
+
+def parameter_settings(args):
+    """
+    Lists the parameter values the agent is swept over, with the run_simulation
+    arguments each value sets.
+
+    Returns:
+        list[tuple[str, dict]]: A progress label and the settings for each parameter value
+    """
     if args.agent == "depth":
-        for depth in range(args.min_depth, args.max_depth + 1):
-            print(f"  [Depth = {depth}]")
-            for run_id in tqdm(range(args.runs), desc="    Runs", leave=False):
-                grid = GridWorld(cols, rows)
-                grid.grid = [row[:] for row in grid_data]
-                seed = (args.seed or 0) + depth * 1000 + run_id
-                result = run_simulation(
-                    "depth", grid.grid, start, end, depth=depth, seed=seed, benchmark_name=args.benchmark)
-                summary_results.append(result)
-
-    # Loop for noisy heuristic agent
-    elif args.agent == "noise":
-        for noise in range(args.min_noise, args.max_noise + 1):
-            print(f"  [Noise = {noise}]")
-            for run_id in tqdm(range(args.runs), desc="    Runs", leave=False):
-                grid = GridWorld(cols, rows)
-                grid.grid = [row[:] for row in grid_data]
-                seed = (args.seed or 0) + noise * 1000 + run_id
-                result = run_simulation(
-                    "noise", grid.grid, start, end, noise=noise, seed=seed, benchmark_name=args.benchmark)
-                summary_results.append(result)
-
-    # Loop for dynamic environment agent
-    elif args.agent == "dynamic":
-        for run_id in tqdm(range(args.runs), desc="  Dynamic Runs"):
-            grid = GridWorld(cols, rows)
-            grid.grid = [row[:] for row in grid_data]
-            seed = (args.seed or 0) + run_id
-            result = run_simulation(
-                "dynamic", grid.grid, start, end, seed=seed, benchmark_name=args.benchmark)
-            summary_results.append(result)
+        return [(f"  [Depth = {depth}]",
+                 dict(agent_type="depth", depth=depth, search=args.search, open_list=args.open_list))
+                for depth in range(args.min_depth, args.max_depth + 1)]
+    if args.agent == "noise":
+        return [(f"  [Noise = {noise}]",
+                 dict(agent_type="noise", noise=noise, search=args.search, noise_engine=args.noise_engine,
+                      open_list=args.open_list))
+                for noise in range(args.min_noise, args.max_noise + 1)]
+    if args.agent == "bounded":
+        return [(f"  [Weight = {weight}]", dict(agent_type="bounded", search=args.bounded_mode, weight=weight))
+                for weight in weight_range(args.min_weight, args.max_weight, args.weight_step)]
+    if churn_enabled(args):
+        # Replanning under churn: LPA* repairs its plan after every seeded wall change
+        return [("  [Dynamic]", dict(agent_type="dynamic", search="incremental", churn=args.churn,
+                                     churn_cells=args.churn_cells, churn_add=args.churn_add))]
+    return [("  [Dynamic]", dict(agent_type="dynamic", search=args.search, open_list=args.open_list))]
+
+
+def search_name(args):
+    """
+    Returns the search the agent actually runs, as recorded in summaries and checkpoints.
+    """
+    if args.agent == "bounded":
+        return args.bounded_mode
+    return "incremental" if churn_enabled(args) else args.search
+
+
+def precision_settings(args):
+    """
+    Returns the (warmup, repeats, disable_gc) passed to run_simulation with --precise, or None.
+    """
+    return (args.warmup, args.repeats, args.no_gc) if args.precise else None
+
+
+def precision_summary(groups, results):
+    """
+    Condenses the precision timings of a batch per parameter value: the fastest
+    run, the median of the runs' medians and the median of their IQRs (ns).
+    """
+    timings = {}
+    for job, result in zip((job for _, jobs in groups for job in jobs), results):
+        if "time_median_ns" in result:
+            timings.setdefault(job_parameter(job), []).append(result)
+
+    return [{
+        "parameter": parameter,
+        "runs": len(runs),
+        "min_ns": min(r["time_min_ns"] for r in runs),
+        "median_ns": int(np.median([r["time_median_ns"] for r in runs])),
+        "iqr_ns": int(np.median([r["time_iqr_ns"] for r in runs])),
+    } for parameter, runs in timings.items()]
+
+
+def churn_enabled(args):
+    """
+    Returns True if the dynamic agent replays wall churn (scenario runs keep their maps static).
+    """
+    return args.agent == "dynamic" and args.churn > 0 and not args.scen
+
+
+def build_jobs(args, reference=None):
+    """
+    Lists every run of the batch in the order a serial run performs them.
+
+    Seeds follow the usual scheme (seed base + parameter * 1000 + run id), so a
+    job gives the same result whichever process runs it.
+
+    Returns:
+        list[tuple[str, list[dict]]]: A progress label and the jobs for each parameter value
+    """
+    # Search event traces for offline profiling: first run of every parameter value
+    trace_dir = os.path.join(config.DATA_DIR, "traces", args.benchmark) if args.dump_trace else None
+
+    def trace_file(label, run_id):
+        if trace_dir is None or run_id != 0:
+            return None
+        return os.path.join(trace_dir, f"{args.agent}_{label}.npz")
+
+    seed_base = args.seed or 0
+    groups = []
+
+    for label, settings in parameter_settings(args):
+        parameter = job_parameter(settings)
+        # Weights are fractional, so they are scaled to whole numbers for the seed
+        seed_offset = round(parameter * 100) if args.agent == "bounded" else parameter or 0
+        trace_name = f"{args.agent}{parameter}" if parameter is not None else args.agent
+
+        jobs = []
+        for run_id in range(args.runs):
+            job = dict(settings, seed=seed_base + seed_offset * 1000 + run_id, measure_memory=args.memory,
+                       precision=precision_settings(args))
+            if args.agent == "bounded":
+                job["reference"] = reference
+            else:
+                job["trace_file"] = trace_file(trace_name, run_id)
+            jobs.append(job)
+        groups.append((label, jobs))
+
+    return groups
+
+
+def job_parameter(job):
+    """
+    Returns the swept parameter value of a job (None for the dynamic agent).
+    """
+    for name in ("depth", "noise", "weight"):
+        if job.get(name) is not None:
+            return job[name]
+    return None
+
+
+def run_jobs(args, context, groups, sink, journal):
+    """
+    Runs the jobs in order, in this process or (with --workers N) on a process pool.
+
+    Workers load the map once each and send back their results and metrics rows;
+    only this process writes the CSV (through the MetricsSink), in the same order
+    as a serial run.
+
+    After CHECKPOINT_EVERY finished jobs or CHECKPOINT_SECONDS, whichever comes
+    first, the journal records where the sink's rows will go, the rows are made
+    durable and then the jobs are committed to the checkpoint journal. Jobs the
+    journal already holds (with --resume) are not run again; their stored
+    results are used instead.
+
+    Returns:
+        list[dict]: The run_simulation result of every job, in job order
+    """
+    pending = []
+    last_checkpoint = time.monotonic()
+
+    def checkpoint():
+        nonlocal last_checkpoint
+        if pending:
+            journal.begin(sink.write_marks())
+            sink.commit()
+            journal.record(pending)
+        pending.clear()
+        last_checkpoint = time.monotonic()
+
+    def finished(key, result):
+        pending.append((key, result))
+        if len(pending) >= CHECKPOINT_EVERY or time.monotonic() - last_checkpoint >= CHECKPOINT_SECONDS:
+            checkpoint()
+
+    def key_of(job):
+        return job_key(job["agent_type"], args.benchmark, job_parameter(job), job["seed"])
+
+    if args.workers <= 1:
+        results = []
+        for label, jobs in groups:
+            print(label)
+            for job in tqdm(jobs, desc="    Runs", leave=False):
+                key = key_of(job)
+                if key in journal.completed:
+                    results.append(journal.completed[key])
+                    continue
+                result = run_job(context, job, log_metrics=sink.log)
+                results.append(result)
+                finished(key, result)
+        checkpoint()
+        return results
+
+    jobs = [job for _, group in groups for job in group]
+    keys = [key_of(job) for job in jobs]
+    results = [journal.completed.get(key) for key in keys]
+    todo = [index for index, result in enumerate(results) if result is None]
+
+    # Build the landmark tables here, so the workers all load the saved file instead of racing to write it
+    if context["heuristic"] is not None:
+        context["heuristic"].prepare()
+
+    # A few chunks per worker keeps the pool busy without paying a round trip per run
+    chunksize = max(1, len(todo) // (args.workers * 4))
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker, initargs=(args,)) as executor:
+        outcomes = executor.map(_run_worker_job, [jobs[index] for index in todo], chunksize=chunksize)
+        for index, (result, records) in tqdm(
+                zip(todo, outcomes), total=len(todo), desc=f"  Runs ({args.workers} workers)"):
+            for record in records:
+                sink.log(**record)
+            results[index] = result
+            finished(keys[index], result)
+    checkpoint()
+    return results
+
+
+def summary_suffix(args):
+    """
+    Returns the file name suffix that keeps summaries (and checkpoints) of different search settings apart.
+    """
+    # Plain A* with Manhattan keeps the original file name so other modes sit side by side with it
+    suffix = "" if args.search == "astar" else f"_{args.search}"
+    if args.agent == "bounded":
+        suffix += f"_{args.bounded_mode}"
+    if args.heuristic != "manhattan":
+        suffix += f"_{args.heuristic}"
+    if args.open_list != "heap":
+        suffix += f"_{args.open_list}"
+    if args.agent == "noise" and args.noise_engine != "random":
+        suffix += f"_{args.noise_engine}"
+    return suffix
+
+
+def checkpoint_settings(args):
+    """
+    Returns the batch settings a checkpoint journal must match before it can be resumed.
+    """
+    return {
+        "agent": args.agent,
+        "benchmark": args.benchmark,
+        "search": search_name(args),
+        "heuristic": args.heuristic,
+        "landmarks": args.landmarks if args.heuristic == "alt" else None,
+        "open_list": args.open_list,
+        "noise_engine": args.noise_engine if args.agent == "noise" else None,
+        "sweep": args.sweep,
+        "memory": args.memory,
+        "results_format": args.results_format,
+        "churn": [args.churn, args.churn_cells, args.churn_add] if churn_enabled(args) else None,
+        "precision": list(precision_settings(args)) if args.precise else None,
+    }
+
+
+def run_batch(args):
+    """
+    Runs a full batch of benchmark simulations for the given agent and settings.
+
+    Aggregates and prints performance metrics, and saves them as a JSON summary.
+    """
+    context = load_context(args)
+    graph = context["graph"]
+    depth_trace = context["depth_trace"]
+
+    print(
+        f"\n[~] Starting benchmark for agent: {args.agent} | Map: {args.benchmark} | Runs: {args.runs}"
+        f" | Search: {search_name(args)}")
+
+    if depth_trace is not None:
+        print(f"  [Sweep] Traced {depth_trace.total_expanded} expansions "
+              f"in {depth_trace.search_time:.6f} sec")
+
+    reference = None
+    if args.agent == "bounded":
+        # Plain A* gives the optimal path and node count every weight is compared against
+        optimal_path, optimal_explored = run_search(
+            "astar", graph, context["start"], context["end"], Heuristic=context["heuristic"])
+        reference = (len(optimal_path) if optimal_path else None, optimal_explored)
+        print(f"  [Optimal] Path length {reference[0]} | Nodes explored {optimal_explored}")
+
+    # Finished jobs are journaled so a killed batch can pick up where it stopped (--resume)
+    journal_path = os.path.join(CHECKPOINT_DIR, f"{args.agent}_{args.benchmark}{summary_suffix(args)}.jsonl")
+    try:
+        journal = CheckpointJournal(journal_path, checkpoint_settings(args), resume=args.resume)
+    except ValueError as error:
+        raise SystemExit(f"[!] {error}")
+    resumed_runs = len(journal.completed)
+    if resumed_runs:
+        print(f"  [Resume] {resumed_runs} finished runs found in {journal_path}")
+    if journal.uncommitted:
+        # The last checkpoint stopped before its jobs were committed: they run again, so drop their rows
+        discard_rows(journal.uncommitted)
+        print("  [Resume] Removed the rows of an unfinished checkpoint")
+
+    # Rows are only written by the sink's commit at each checkpoint, however many rows a job logs (a churn
+    # job logs one per change), so the journal knows where every row not yet committed starts;
+    # unless churn changes it, the map is fixed and its walls are counted once
+    sink = MetricsSink(buffer_rows=None, static_map=not churn_enabled(args),
+                       results_format=args.results_format)
+    groups = build_jobs(args, reference)
+    with journal, sink:
+        summary_results = run_jobs(args, context, groups, sink, journal)
 
     print("\n[✓] Benchmark complete!")
 
@@ -135,28 +754,108 @@ def run_batch(args):
     avg_path_len = round(mean([r["path_length"]
                                for r in successes]), 2) if successes else 0
     avg_nodes = round(mean([r["nodes_explored"] for r in summary_results]), 2)
-    avg_time = round(mean([r["search_time_sec"] for r in summary_results]), 6)
+    timed = [r["search_time_sec"]
+             for r in summary_results if r["search_time_sec"] is not None]
+    avg_time = round(mean(timed), 6) if timed else None
+    cached_runs = sum(1 for r in summary_results if r["timing"] == "cached")
 
     summary = {
         "agent": args.agent,
         "benchmark": args.benchmark,
+        "search": search_name(args),
+        "heuristic": args.heuristic,
+        "landmarks": args.landmarks if args.heuristic == "alt" else None,
+        "open_list": args.open_list,
+        "noise_engine": args.noise_engine if args.agent == "noise" else None,
         "runs": len(summary_results),
         "successes": len(successes),
         "success_rate": round(len(successes) / len(summary_results), 2) if summary_results else 0,
         "avg_path_length": avg_path_len,
         "avg_nodes_explored": avg_nodes,
         "avg_search_time_sec": avg_time,
+        "measured_runs": len(timed),
+        "cached_runs": cached_runs,
+        "resumed_runs": resumed_runs,
         "seed_base": args.seed,
+        "sweep_search_time_sec": round(depth_trace.search_time, 6) if depth_trace else None,
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
         "seed_results": summary_results
     }
 
+    # Precision timing: warm, repeated timings per parameter value instead of single cold calls
+    if args.precise:
+        summary["precision_timing"] = {
+            "warmup": args.warmup,
+            "repeats": args.repeats,
+            "gc_disabled": args.no_gc,
+            "by_parameter": precision_summary(groups, summary_results),
+        }
+
+    # Replanning under churn: the initial plans fill the usual fields, the repairs get their own section
+    replanning = replanning_summary(summary_results, args) if churn_enabled(args) else None
+    if churn_enabled(args):
+        summary["replanning"] = replanning
+        seed_results = []
+        for r in summary_results:
+            samples = r["replan"]
+            entry = {key: value for key, value in r.items() if key != "replan"}
+            entry["avg_replan_time_sec"] = round(mean(samples["seconds"]), 6) if samples["seconds"] else None
+            entry["avg_nodes_reexpanded"] = round(mean(samples["expanded"]), 2) if samples["expanded"] else None
+            seed_results.append(entry)
+        summary["seed_results"] = seed_results
+
+    # The Parquet dataset already holds every run with typed columns, so the summary only points to it
+    if args.results_format == "parquet":
+        del summary["seed_results"]
+        summary["results_file"] = sink.results_path(args.agent, is_benchmark=True, benchmark_name=args.benchmark)
+
+    # Report the speed-versus-quality trade-off of bounded-suboptimal runs
+    if args.agent == "bounded":
+        ratios = [r["path_ratio"] for r in summary_results if r["path_ratio"] is not None]
+        savings = [r["node_savings_pct"] for r in summary_results if r["node_savings_pct"] is not None]
+        summary["optimal_path_length"] = reference[0]
+        summary["optimal_nodes_explored"] = reference[1]
+        summary["avg_path_ratio"] = round(mean(ratios), 4) if ratios else None
+        summary["max_path_ratio"] = round(max(ratios), 4) if ratios else None
+        summary["avg_node_savings_pct"] = round(mean(savings), 2) if savings else None
+
+    # Search-internals counters: queue overhead (pushes, stale pops, peak open) versus search effort
+    for key in SEARCH_COUNTERS:
+        values = [r[key] for r in summary_results if key in r]
+        if values:
+            summary[f"avg_{key}"] = round(mean(values), 4 if key == "branching_factor" else 2)
+
+    # Memory mode: peak allocation per search on top of the per-map workspace arrays
+    profiled = [r for r in summary_results if "peak_memory_kib" in r]
+    if profiled:
+        peaks = [r["peak_memory_kib"] for r in profiled]
+        frontiers = [r["frontier_size"] for r in profiled if r["frontier_size"] is not None]
+        closed = [r["closed_size"] for r in profiled if r["closed_size"] is not None]
+        summary["avg_peak_memory_kib"] = round(mean(peaks), 2)
+        summary["max_peak_memory_kib"] = max(peaks)
+        summary["max_frontier_size"] = max(frontiers) if frontiers else None
+        summary["max_closed_size"] = max(closed) if closed else None
+        summary["workspace_kib"] = round(SearchWorkspace(graph.size).nbytes / 1024, 2)
+
+    # Report how the expansions split between the two frontiers
+    directional = [r for r in summary_results if "nodes_forward" in r]
+    if directional:
+        summary["avg_nodes_forward"] = round(mean([r["nodes_forward"] for r in directional]), 2)
+        summary["avg_nodes_backward"] = round(mean([r["nodes_backward"] for r in directional]), 2)
+
+    # Report how the expansions split between the abstract graph and tile refinement
+    layered = [r for r in summary_results if "nodes_abstract" in r]
+    if layered:
+        summary["avg_nodes_abstract"] = round(mean([r["nodes_abstract"] for r in layered]), 2)
+        summary["avg_nodes_concrete"] = round(mean([r["nodes_concrete"] for r in layered]), 2)
+
     # Save benchmark summary to JSON
     json_folder = os.path.join(
         "data", "metrics", args.agent, "benchmark_data")
     os.makedirs(json_folder, exist_ok=True)
+    suffix = summary_suffix(args)
     json_path = os.path.join(
-        json_folder, f"summary_{args.benchmark}.temp.json")
+        json_folder, f"summary_{args.benchmark}{suffix}.temp.json")
     with open(json_path, "w") as f:
         json.dump(summary, f, indent=4)
 
@@ -164,36 +863,305 @@ def run_batch(args):
     print(f"""
 Agent: {args.agent}
 Benchmark: {args.benchmark}
+Search: {summary['search']}
+Heuristic: {args.heuristic}
 Total runs: {summary['runs']}
 Successes: {summary['successes']}
 Success rate: {summary['success_rate']}
 Avg path length: {avg_path_len}
 Avg nodes explored: {avg_nodes}
-Avg search time sec: {avg_time}
+Avg search time sec: {avg_time} (measured runs: {len(timed)}, cached runs: {cached_runs})
 Seed base: {args.seed}
 """)
+    counter_line = " | ".join(
+        f"{key}: {summary[f'avg_{key}']}" for key in SEARCH_COUNTERS if f"avg_{key}" in summary)
+    if counter_line:
+        print(f"Avg counters: {counter_line}\n")
+    if profiled:
+        print(f"Peak memory KiB: avg {summary['avg_peak_memory_kib']} | max {summary['max_peak_memory_kib']}"
+              f" (+ {summary['workspace_kib']} workspace)")
+        print(f"Max frontier/closed size: {summary['max_frontier_size']} / {summary['max_closed_size']}\n")
+    if args.precise:
+        print(f"Precision timing ({args.repeats} repeats after {args.warmup} warmup"
+              f"{', GC off' if args.no_gc else ''}), ns:")
+        for entry in summary["precision_timing"]["by_parameter"]:
+            label = entry["parameter"] if entry["parameter"] is not None else args.agent
+            print(f"  {label}: min {entry['min_ns']} | median {entry['median_ns']} | IQR {entry['iqr_ns']}")
+        print()
+    if replanning:
+        print(f"Replans: {replanning['replans']} ({args.churn} changes x {args.churn_cells} tiles per run)")
+        print(f"Replan time sec: avg {replanning['avg_replan_time_sec']} | p50 {replanning['p50_replan_time_sec']}"
+              f" | p99 {replanning['p99_replan_time_sec']} (fresh A*: {replanning['avg_fresh_time_sec']})")
+        print(f"Nodes re-expanded per change: {replanning['avg_nodes_reexpanded']}"
+              f" (fresh A*: {replanning['avg_fresh_nodes_explored']})")
+        print(f"Success rate after change: {replanning['success_rate_after_change']}"
+              f" | Path mismatches: {replanning['path_mismatches']}\n")
+    if args.agent == "bounded":
+        print(f"Avg path ratio: {summary['avg_path_ratio']} (max {summary['max_path_ratio']})")
+        print(f"Avg node savings %: {summary['avg_node_savings_pct']}\n")
+    if directional:
+        print(f"Avg nodes forward/backward: {summary['avg_nodes_forward']} / {summary['avg_nodes_backward']}\n")
+    if layered:
+        print(f"Avg nodes abstract/concrete: {summary['avg_nodes_abstract']} / {summary['avg_nodes_concrete']}\n")
+
+
+def load_scenario_map(args, map_name, map_dir):
+    """
+    Loads a MovingAI map referenced by a scenario and builds what its queries share.
+    """
+    map_data = load_movingai_map(resolve_map_path(map_name, map_dir))
+    grid_data = map_data["grid"]
+    return {
+        "name": map_name,
+        "grid_data": grid_data,
+        "rows": map_data["height"],
+        "cols": map_data["width"],
+        "graph": GridGraph(grid_data),
+        "open_mask": open_mask_from_grid(grid_data),
+        "heuristic": LandmarkHeuristic(grid_data, args.landmarks) if args.heuristic == "alt" else None,
+    }
+
+
+def run_scenarios(args):
+    """
+    Runs the queries of a MovingAI scenario file (--scen) for every parameter value of the agent.
+
+    Queries are streamed from the file once per parameter value and each runs once,
+    seeded with seed base + query index. Every path is checked against two optimal
+    lengths: the 4-connected optimum our agents can reach (a BFS from the goal,
+    computed once per query) and the scenario's published length, which allows
+    diagonal moves and so can never be longer; a path shorter than it means the
+    map and scenario do not match.
+
+    Per-query metrics go to the agent's benchmark results under the scenario's
+    name, and a summary per parameter value is saved as JSON.
+    """
+    map_dir = args.map_dir or os.path.dirname(os.path.abspath(args.scen))
+    name = scenario_name(args.scen)
+    seed_base = args.seed or 0
+    optimal_moves = {}  # Query index -> 4-connected optimal moves, shared by every parameter value
+    context = None
+    parameters = []
+
+    print(f"\n[~] Starting scenario benchmark for agent: {args.agent} | Scenario: {args.scen}"
+          f" | Search: {search_name(args)}")
+
+    for label, settings in parameter_settings(args):
+        print(label)
+        queries = successes = optimal_paths = below_published = 0
+        nodes_total = 0
+        timed = []
+        ratios = []
+        published_ratios = []
+        sink = sink_map = None
+
+        try:
+            for query in tqdm(islice(iter_scenarios(args.scen), args.max_queries), desc="    Queries", leave=False):
+                if sink is None or query["map"] != sink_map:
+                    # One sink per map, so walls are counted once per map rather than once per query
+                    if sink is not None:
+                        sink.close()
+                    if context is None or query["map"] != context["name"]:
+                        context = load_scenario_map(args, query["map"], map_dir)
+                    sink = MetricsSink(buffer_rows=CHECKPOINT_EVERY, static_map=True,
+                                       results_format=args.results_format)
+                    sink_map = query["map"]
+                if (query["height"], query["width"]) != (context["rows"], context["cols"]):
+                    raise SystemExit(f"[!] Query {query['index']} expects a {query['width']}x{query['height']} map, "
+                                     f"but {query['map']} is {context['cols']}x{context['rows']}")
+
+                start, end = query["start"], query["end"]
+                index = query["index"]
+                if index not in optimal_moves:
+                    dist = distance_field(context["open_mask"], end, targets=[start])
+                    optimal_moves[index] = int(dist[start])  # -1 if unreachable
+                moves = optimal_moves[index]
+
+                job = dict(settings, seed=seed_base + index, measure_memory=args.memory,
+                           precision=precision_settings(args))
+                if args.agent == "bounded":
+                    job["reference"] = (moves + 1 if moves >= 0 else None, None)
+                result = run_simulation(
+                    grid=context["grid_data"], start=start, end=end, benchmark_name=name, graph=context["graph"],
+                    heuristic=context["heuristic"], log_metrics=sink.log, **job)
+
+                queries += 1
+                nodes_total += result["nodes_explored"]
+                if result["search_time_sec"] is not None:
+                    timed.append(result["search_time_sec"])
+                if not result["success"]:
+                    continue
+
+                successes += 1
+                taken = result["path_length"] - 1
+                if moves > 0:
+                    ratios.append(taken / moves)
+                optimal_paths += taken == moves
+                if query["optimal"] > 0:
+                    published_ratios.append(taken / query["optimal"])
+                # A 4-connected path is also a valid octile path, so it can't beat the published optimum
+                below_published += taken < query["optimal"] - 1e-6
+        finally:
+            if sink is not None:
+                sink.close()
+
+        parameters.append({
+            "parameter": job_parameter(settings),
+            "queries": queries,
+            "successes": successes,
+            "success_rate": round(successes / queries, 4) if queries else 0,
+            "optimal_paths": optimal_paths,
+            "avg_path_ratio": round(mean(ratios), 4) if ratios else None,
+            "max_path_ratio": round(max(ratios), 4) if ratios else None,
+            "avg_published_ratio": round(mean(published_ratios), 4) if published_ratios else None,
+            "below_published_optimal": below_published,
+            "avg_nodes_explored": round(nodes_total / queries, 2) if queries else 0,
+            "avg_search_time_sec": round(mean(timed), 6) if timed else None,
+        })
+        print(f"    Success rate {parameters[-1]['success_rate']} | optimal {optimal_paths}/{successes}"
+              f" | avg path ratio {parameters[-1]['avg_path_ratio']}")
+        if below_published:
+            print(f"    [!] {below_published} paths are shorter than the published optimum: "
+                  f"check that the map matches the scenario")
+
+    summary = {
+        "agent": args.agent,
+        "scenario": args.scen,
+        "search": search_name(args),
+        "heuristic": args.heuristic,
+        "landmarks": args.landmarks if args.heuristic == "alt" else None,
+        "open_list": args.open_list,
+        "noise_engine": args.noise_engine if args.agent == "noise" else None,
+        "queries": len(optimal_moves),
+        "unreachable_queries": sum(1 for moves in optimal_moves.values() if moves < 0),
+        "seed_base": args.seed,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "parameters": parameters,
+    }
+
+    json_folder = os.path.join("data", "metrics", args.agent, "benchmark_data")
+    os.makedirs(json_folder, exist_ok=True)
+    json_path = os.path.join(json_folder, f"summary_{name}_scen{summary_suffix(args)}.temp.json")
+    with open(json_path, "w") as f:
+        json.dump(summary, f, indent=4)
+
+    print(f"\n[✓] Scenario benchmark complete! Summary saved to {json_path}")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Run benchmark simulations for lookahead agents.")
     parser.add_argument(
-        "--agent", choices=["depth", "noise", "dynamic"], required=True, help="Agent type")
+        "--agent", choices=["depth", "noise", "dynamic", "bounded"], required=True, help="Agent type")
     parser.add_argument("--runs", type=int, default=5,
                         help="Number of repetitions per parameter value")
     parser.add_argument(
-        "--benchmark", choices=["easy", "medium", "true_maze"], required=True, help="Benchmark map")
+        "--benchmark", choices=["easy", "medium", "true_maze"], help="Benchmark map")
+    parser.add_argument("--scen",
+                        help="Run the queries of a MovingAI scenario file (.scen) instead of a benchmark map")
+    parser.add_argument("--map-dir",
+                        help="Folder holding the scenario's .map files (default: the scenario's folder)")
+    parser.add_argument("--max-queries", type=int,
+                        help="Only run the first N queries of the scenario file")
 
     parser.add_argument("--min-depth", type=int,
                         default=DEFAULT_DEPTH_RANGE[0], help="Minimum depth (for depth agent)")
     parser.add_argument("--max-depth", type=int,
                         default=DEFAULT_DEPTH_RANGE[1], help="Maximum depth (for depth agent)")
+    parser.add_argument("--sweep", action="store_true",
+                        help="Answer every depth from one traced search (for depth agent)")
     parser.add_argument("--min-noise", type=int,
                         default=DEFAULT_NOISE_RANGE[0], help="Minimum noise (for noise agent)")
     parser.add_argument("--max-noise", type=int,
                         default=DEFAULT_NOISE_RANGE[1], help="Maximum noise (for noise agent)")
+    parser.add_argument("--min-weight", type=float,
+                        default=DEFAULT_WEIGHT_RANGE[0], help="Minimum weight w (for bounded agent)")
+    parser.add_argument("--max-weight", type=float,
+                        default=DEFAULT_WEIGHT_RANGE[1], help="Maximum weight w (for bounded agent)")
+    parser.add_argument("--weight-step", type=float,
+                        default=DEFAULT_WEIGHT_STEP, help="Weight sweep step (for bounded agent)")
+    parser.add_argument("--bounded-mode", choices=list(BOUNDED_MODES), default="weighted",
+                        help="Weighted A* or focal search (for bounded agent)")
+    parser.add_argument("--noise-engine", choices=["random", "numpy"], default="random",
+                        help="Noise source: global random module or a seeded NumPy generator per run")
+    parser.add_argument("--churn", type=int, default=DEFAULT_CHURN_CHANGES,
+                        help="Wall changes replayed per run, replanned with LPA* (for dynamic agent; 0 = static map)")
+    parser.add_argument("--churn-cells", type=int, default=DEFAULT_CHURN_CELLS,
+                        help="Tiles toggled per wall change (for dynamic agent)")
+    parser.add_argument("--churn-add", type=float, default=DEFAULT_ADD_FRACTION,
+                        help="Share of toggles that add a wall rather than remove one (for dynamic agent)")
+
+    parser.add_argument("--search", choices=list(SEARCH_MODES), default="astar",
+                        help="Search mode used by the agent")
+    parser.add_argument("--heuristic", choices=["manhattan", "alt"], default="manhattan",
+                        help="Heuristic: Manhattan distance or ALT landmarks")
+    parser.add_argument("--open-list", choices=list(OPEN_LIST_KINDS), default="heap",
+                        help="Open list for astar: binary heap or bucket queue. The bucket queue is faster on open maps but can "
+                             "be ~2x slower on mazes (noisy runs always use the heap)")
+    parser.add_argument("--landmarks", type=int, default=DEFAULT_LANDMARK_COUNT,
+                        help="Number of landmarks for the ALT heuristic")
+
+    parser.add_argument("--dump-trace", action="store_true",
+                        help="Save search event traces to data/traces/<map>/ (A* only, first run per value)")
+    parser.add_argument("--memory", action="store_true",
+                        help="Also record each search's peak memory (tracemalloc) and frontier/closed sizes")
+    parser.add_argument("--precise", action="store_true",
+                        help="Time each search over --repeats calls after --warmup calls and log min/median/IQR")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                        help="Timed calls per run (with --precise)")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP,
+                        help="Untimed calls before the timed ones (with --precise)")
+    parser.add_argument("--no-gc", action="store_true",
+                        help="Switch the garbage collector off while timing (with --precise)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Replay noise-free runs from the result cache in data/cache/results")
 
+    parser.add_argument("--results-format", choices=list(RESULT_FORMATS), default="csv",
+                        help="Write per-run metrics as CSV or as a typed Parquet dataset (needs pyarrow)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip runs already finished by an interrupted batch with the same settings")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Spread the runs over this many worker processes (the parent writes all output)")
     parser.add_argument("--seed", type=int, default=Global_Seed,
                         help="Base random seed (optional)")
     args = parser.parse_args()
-    run_batch(args)
+
+    if (args.benchmark is None) == (args.scen is None):
+        parser.error("Pass exactly one of --benchmark or --scen")
+    if args.scen and (args.sweep or args.dump_trace or args.cache or args.resume or args.workers != 1):
+        parser.error("--scen runs each query once in this process: --sweep, --dump-trace, --cache, --resume "
+                     "and --workers are not available")
+    if args.churn < 0 or args.churn_cells < 1 or not 0 <= args.churn_add <= 1:
+        parser.error("--churn must be at least 0, --churn-cells at least 1 and --churn-add in [0, 1]")
+    if churn_enabled(args) and (args.search != "astar" or args.open_list != "heap" or args.heuristic != "manhattan"
+                                or args.memory or args.dump_trace or args.cache):
+        parser.error("The dynamic agent replans with LPA* under churn: --search, --open-list, --heuristic, --memory, "
+                     "--dump-trace and --cache need --churn 0")
+    if args.precise and (args.repeats < 1 or args.warmup < 0):
+        parser.error("--repeats must be at least 1 and --warmup at least 0")
+    if args.precise and churn_enabled(args):
+        parser.error("--precise repeats a search on a fixed map; use it with --churn 0 for the dynamic agent")
+    if args.max_queries is not None and args.max_queries < 1:
+        parser.error("--max-queries must be at least 1")
+    if args.sweep and args.search != "astar":
+        parser.error("--sweep is only available with --search astar")
+    if args.agent == "bounded" and (args.search != "astar" or args.open_list != "heap"):
+        parser.error("The bounded agent picks its search with --bounded-mode")
+    if args.agent == "bounded" and (args.min_weight < 1 or args.weight_step <= 0):
+        parser.error("Weights must be at least 1 and --weight-step must be positive")
+    if args.dump_trace and (args.agent == "bounded" or args.search != "astar" or args.open_list != "heap"
+                            or args.noise_engine != "random"):
+        parser.error("--dump-trace is only available for plain A* (--search astar, heap open list, random noise)")
+    if args.open_list != "heap" and args.search != "astar":
+        parser.error("--open-list is only available with --search astar")
+    if args.noise_engine == "numpy" and args.search != "astar":
+        parser.error("--noise-engine numpy is only available with --search astar")
+    if args.results_format == "parquet" and not columnar_available():
+        parser.error("--results-format parquet needs pyarrow (pip install pyarrow)")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if args.scen:
+        run_scenarios(args)
+    else:
+        run_batch(args)
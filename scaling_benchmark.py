@@ -0,0 +1,316 @@
+import argparse
+import csv
+import json
+import os
+import random
+import time
+from statistics import mean
+
+import matplotlib
+matplotlib.use("Agg")  # Curves are only saved to file
+import matplotlib.pyplot as plt
+import numpy as np
+from tqdm import tqdm
+
+import config
+from config import Global_Seed
+from engines.churn import DEFAULT_CHURN_CELLS, replay_churn
+from engines.grid_graph import GridGraph
+from run_benchmark import dispatch_search
+from utils.map_generators import DEFAULT_DENSITY, MAP_FAMILIES, MAX_MAP_SIZE, MIN_MAP_SIZE, generate_map
+from utils.memory_profile import measure_peak
+
+SCALING_AGENTS = ["depth", "noise", "bounded", "dynamic"]
+DEFAULT_SIZES = [15, 32, 64, 128, 256, 512]
+DEFAULT_DEPTH_FRACTION = 0.25
+DEFAULT_NOISE = 5
+DEFAULT_WEIGHT = 2.0
+DEFAULT_MAX_QUERY_SECONDS = 10.0
+DEFAULT_MAX_BUILD_SECONDS = 10.0
+DEFAULT_SCALING_CHURN = 20  # Wall changes replayed per map instance for the dynamic agent
+SCALING_DIR = os.path.join(config.DATA_DIR, "metrics", "scaling")
+
+
+def family_label(family, density):
+    return f"random-{density:g}" if family == "random" else family
+
+
+def agent_query(agent, graph, start, end, seed, args):
+    """
+    Runs one search for a static-map agent with the suite's settings, through the
+    same dispatch as run_benchmark. The depth budget scales with the map size.
+
+    Returns:
+        tuple[List[tuple[int, int]], int]: The path (if any) and number of nodes explored
+    """
+    depth = max(1, int(graph.size * args.depth_fraction)) if agent == "depth" else None
+    noise = args.noise if agent == "noise" else None
+    search = "weighted" if agent == "bounded" else "astar"
+    weight = args.weight if agent == "bounded" else None
+    if agent == "noise":
+        random.seed(seed)  # Same noise draws for the timed and the profiled run
+    return dispatch_search(
+        agent, graph, start, end, depth, noise, seed, search, None, "random", "heap", weight, {})
+
+
+def churn_query(grid, start, end, seed, args):
+    """
+    Runs the dynamic agent on a copy of the map: one LPA* plan, then args.churn
+    seeded wall changes with the plan repaired after each one (see engines.churn).
+
+    Returns:
+        List[dict]: The initial plan, then one step per change
+    """
+    return list(replay_churn([row[:] for row in grid], start, end, args.churn, args.churn_cells, seed=seed,
+                             reference=False))
+
+
+def measure_point(agent, maps, args):
+    """
+    Times every query of one (family, size, agent) point and condenses the samples.
+
+    Each map is searched args.repeats times; a failed or depth-limited search still
+    counts towards latency and throughput, since the work was done. The dynamic
+    agent instead replays one churn stream per map, and each LPA* repair after a
+    wall change is one query; its initial plans are reported separately.
+
+    Returns:
+        dict: Throughput (nodes/sec), latency percentiles (ms), success rate, the median
+        initial plan (ms, dynamic agent only) and, with --memory, the largest peak traced
+        allocation of one search (or churn replay)
+    """
+    latencies = []
+    explored_total = 0
+    successes = 0
+    initial_plans = []
+    peaks = []
+
+    for map_seed, graph, grid, start, end in maps:
+        if agent == "dynamic":
+            steps = churn_query(grid, start, end, map_seed * 1000, args)
+            initial_plans.append(steps[0]["seconds"])
+            for step in steps[1:]:
+                latencies.append(step["seconds"])
+                explored_total += step["expanded"]
+                successes += step["path"] is not None
+        else:
+            for repeat in range(args.repeats):
+                query_seed = map_seed * 1000 + repeat
+                start_time = time.perf_counter()
+                path, explored = agent_query(agent, graph, start, end, query_seed, args)
+                latencies.append(time.perf_counter() - start_time)
+                explored_total += explored
+                successes += path is not None
+
+        if args.memory:
+            # Separate, untimed run: tracemalloc slows every allocation down
+            if agent == "dynamic":
+                _, peak = measure_peak(churn_query, grid, start, end, map_seed * 1000, args)
+            else:
+                _, peak = measure_peak(agent_query, agent, graph, start, end, map_seed * 1000, args)
+            peaks.append(peak)
+
+    total_time = sum(latencies)
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "queries": len(latencies),
+        "success_rate": round(successes / len(latencies), 3),
+        "avg_nodes_explored": round(explored_total / len(latencies), 1),
+        "nodes_per_sec": round(explored_total / total_time) if total_time > 0 else None,
+        "latency_p50_ms": round(float(np.percentile(latencies_ms, 50)), 4),
+        "latency_p90_ms": round(float(np.percentile(latencies_ms, 90)), 4),
+        "latency_p99_ms": round(float(np.percentile(latencies_ms, 99)), 4),
+        "initial_plan_ms": round(float(np.median(initial_plans)) * 1000, 4) if initial_plans else None,
+        "peak_memory_kib": round(max(peaks) / 1024, 2) if peaks else None,
+    }
+
+
+def run_suite(args):
+    """
+    Sweeps every map family and size for every agent and saves the scaling points.
+
+    An agent whose median query (or, for the dynamic agent, median initial plan)
+    takes longer than --max-query-seconds is dropped for the larger sizes of that
+    family; the size where that happened is recorded as where the agent stopped
+    scaling. Map building is capped too: building grows with the tile count, so a
+    size whose maps would take longer than --max-build-seconds each (extrapolated
+    from the previous size) is skipped along with every larger one.
+    """
+    families = [(family, density) for family in args.families
+                for density in (args.densities if family == "random" else [None])]
+    points = []
+    stopped = {}
+
+    for family, density in families:
+        label = family_label(family, density)
+        active = list(args.agents)
+        build_time = previous_size = None
+        print(f"\n[~] Family: {label}")
+
+        for size in sorted(args.sizes):
+            if not active:
+                break
+
+            if build_time is not None:
+                expected_build = build_time * (size / previous_size) ** 2
+                if expected_build > args.max_build_seconds:
+                    for agent in active:
+                        stopped[f"{label}/{agent}"] = size
+                    print(f"  [!] Building a {size}x{size} map would take ~{expected_build:.1f}s "
+                          f"(over {args.max_build_seconds}s); skipping it and larger sizes")
+                    break
+
+            # Build the map instances once per size; every agent searches the same ones
+            build_start = time.perf_counter()
+            maps = []
+            open_tiles = []
+            for instance in range(args.maps):
+                map_seed = (args.seed or 0) + size * 100 + instance
+                map_data = generate_map(family, size, map_seed, density=density or DEFAULT_DENSITY)
+                graph = GridGraph(map_data["grid"])
+                maps.append((map_seed, graph, map_data["grid"], tuple(map_data["start"]), tuple(map_data["end"])))
+                open_tiles.append(sum(row.count(0) for row in map_data["grid"]))
+            build_time = (time.perf_counter() - build_start) / args.maps
+            previous_size = size
+
+            for agent in tqdm(list(active), desc=f"  {size}x{size}", leave=False):
+                point = {
+                    "family": label,
+                    "size": size,
+                    "tiles": size * size,
+                    "open_tiles": round(mean(open_tiles)),
+                    "agent": agent,
+                    "maps": args.maps,
+                    "map_build_sec": round(build_time, 4),
+                    **measure_point(agent, maps, args),
+                }
+                points.append(point)
+                tqdm.write(f"  {size:>5} {agent:<8} p50 {point['latency_p50_ms']:>10.3f} ms"
+                           f" | {point['nodes_per_sec'] or 0:>9} nodes/s | success {point['success_rate']}")
+
+                if max(point["latency_p50_ms"], point["initial_plan_ms"] or 0) / 1000 > args.max_query_seconds:
+                    active.remove(agent)
+                    stopped[f"{label}/{agent}"] = size
+                    tqdm.write(f"  [!] {agent} exceeded {args.max_query_seconds}s per query at {size}x{size}; "
+                               f"skipping larger sizes")
+
+            del maps
+
+    return points, stopped
+
+
+def save_results(points, stopped, args):
+    """
+    Writes the scaling points as CSV and JSON and draws one set of curves per map family.
+    """
+    os.makedirs(SCALING_DIR, exist_ok=True)
+
+    csv_path = os.path.join(SCALING_DIR, "scaling_results.temp.csv")
+    fields = list(points[0].keys())
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows({key: ("N/A" if value is None else value) for key, value in point.items()}
+                         for point in points)
+
+    summary = {
+        "sizes": sorted(args.sizes),
+        "agents": args.agents,
+        "maps_per_size": args.maps,
+        "repeats": args.repeats,
+        "depth_fraction": args.depth_fraction,
+        "noise": args.noise,
+        "weight": args.weight,
+        "max_query_seconds": args.max_query_seconds,
+        "max_build_seconds": args.max_build_seconds,
+        "churn": args.churn if "dynamic" in args.agents else None,
+        "churn_cells": args.churn_cells if "dynamic" in args.agents else None,
+        "seed_base": args.seed,
+        "stopped_scaling_at": stopped,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "points": points,
+    }
+    json_path = os.path.join(SCALING_DIR, "summary_scaling.temp.json")
+    with open(json_path, "w") as f:
+        json.dump(summary, f, indent=4)
+
+    # Log-log curves: one figure per family, one line per agent
+    graph_folder = os.path.join(SCALING_DIR, "graphs")
+    os.makedirs(graph_folder, exist_ok=True)
+    metrics = [("nodes_per_sec", "Nodes / sec"), ("latency_p50_ms", "p50 latency (ms)"),
+               ("latency_p99_ms", "p99 latency (ms)")]
+    if args.memory:
+        metrics.append(("peak_memory_kib", "Peak memory (KiB)"))
+
+    for label in dict.fromkeys(point["family"] for point in points):
+        fig, axes = plt.subplots(1, len(metrics), figsize=(5 * len(metrics), 4))
+        for axis, (key, title) in zip(axes, metrics):
+            for agent in args.agents:
+                series = [(p["tiles"], p[key]) for p in points
+                          if p["family"] == label and p["agent"] == agent and p[key]]
+                if series:
+                    axis.plot(*zip(*series), marker="o", label=agent.capitalize())
+            axis.set_xscale("log")
+            axis.set_yscale("log")
+            axis.set_xlabel("Tiles")
+            axis.set_title(title)
+            axis.grid(True)
+        axes[0].legend(title="Agent")
+        fig.suptitle(f"Scaling: {label}")
+        fig.tight_layout()
+        fig.savefig(os.path.join(graph_folder, f"scaling_{label}.temp.png"))
+        plt.close(fig)
+
+    print(f"\n[✓] Scaling results saved to {SCALING_DIR}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure how each agent scales on generated map families.")
+    parser.add_argument("--families", nargs="+", choices=list(MAP_FAMILIES), default=list(MAP_FAMILIES),
+                        help="Map families to generate")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES,
+                        help=f"Map widths/heights, from {MIN_MAP_SIZE} to {MAX_MAP_SIZE}")
+    parser.add_argument("--densities", nargs="+", type=float, default=[0.1, DEFAULT_DENSITY, 0.35],
+                        help="Wall densities for the random family")
+    parser.add_argument("--agents", nargs="+", choices=SCALING_AGENTS, default=SCALING_AGENTS,
+                        help="Agents to measure")
+    parser.add_argument("--maps", type=int, default=3,
+                        help="Map instances generated per family and size")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="Timed queries per map instance")
+    parser.add_argument("--depth-fraction", type=float, default=DEFAULT_DEPTH_FRACTION,
+                        help="Depth agent budget as a fraction of the map's tiles")
+    parser.add_argument("--noise", type=int, default=DEFAULT_NOISE,
+                        help="Noise level for the noise agent")
+    parser.add_argument("--weight", type=float, default=DEFAULT_WEIGHT,
+                        help="Weight for the bounded agent (weighted A*)")
+    parser.add_argument("--max-query-seconds", type=float, default=DEFAULT_MAX_QUERY_SECONDS,
+                        help="Stop growing the maps for an agent once its median query takes longer")
+    parser.add_argument("--max-build-seconds", type=float, default=DEFAULT_MAX_BUILD_SECONDS,
+                        help="Skip sizes whose maps would take longer to generate and flatten, each")
+    parser.add_argument("--churn", type=int, default=DEFAULT_SCALING_CHURN,
+                        help="Wall changes replayed per map for the dynamic agent; each LPA* repair is one query")
+    parser.add_argument("--churn-cells", type=int, default=DEFAULT_CHURN_CELLS,
+                        help="Tiles toggled per wall change (for dynamic agent)")
+    parser.add_argument("--memory", action="store_true",
+                        help="Also record each agent's peak memory per search (tracemalloc)")
+    parser.add_argument("--seed", type=int, default=Global_Seed,
+                        help="Seed base for the generated maps and noisy queries")
+
+    args = parser.parse_args()
+
+    if any(not MIN_MAP_SIZE <= size <= MAX_MAP_SIZE for size in args.sizes):
+        parser.error(f"--sizes must be between {MIN_MAP_SIZE} and {MAX_MAP_SIZE}")
+    if any(not 0 <= density < 1 for density in args.densities):
+        parser.error("--densities must be in [0, 1)")
+    if args.maps < 1 or args.repeats < 1:
+        parser.error("--maps and --repeats must be at least 1")
+    if args.weight < 1:
+        parser.error("--weight must be at least 1")
+    if args.churn < 1 or args.churn_cells < 1:
+        parser.error("--churn and --churn-cells must be at least 1")
+
+    points, stopped = run_suite(args)
+    if points:
+        save_results(points, stopped, args)
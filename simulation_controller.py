@@ -6,8 +6,14 @@ import config
 
 from gridworld import GridWorld
 from lookahead import A_Star_Search
+from engines.incremental import IncrementalPlanner
+from engines.grid_graph import GridGraph
+from engines.modes import SEARCH_MODES, run_search
+from engines.hierarchical import HierarchicalGrid
+from engines.trace import TraceBuffer, FrontierReplay, traced_search
 from config import Grid_Width, Grid_Height, Global_Seed
-from metrics import Log_Path_Metrics
+from metrics import MetricsSink
+from engines.counters import finish_counters
 from utils.map_utils import load_full_map
 
 
@@ -17,16 +23,34 @@ class SimulationController:
         self.selected_agent = None
         self.depth_value = 15
         self.noise_value = 5
+        self.search_mode = "astar"
+
+        # Search frontier replay (A* mode only); recorded outside the timed search
+        self.show_frontier = False
+        self.frontier_replay = None
 
         # Pathfinding results
         self.path = []
         self.success = False
         self.search_time = 0
         self.nodes_explored = 0
+        self.search_stats = {}
+
+        # Metrics CSVs stay open for the session; every row is written straight away
+        self.metrics = MetricsSink(buffer_rows=1)
 
         # Grid setup
         self.grid = GridWorld(Grid_Width, Grid_Height)
 
+        # Dynamic agent replanning state (survives between searches)
+        self.dynamic_planner = None
+        self.changed_cells = set()
+        self.fresh_nodes_explored = 0
+
+        # HPA* abstraction for the hierarchical search mode (built on first use)
+        self.hierarchy = None
+        self.watch_grid()
+
         # Animation state
         self.trail_tiles = []
         self.agent_start = None
@@ -59,6 +83,17 @@ class SimulationController:
         if Global_Seed is not None:
             random.seed(Global_Seed)
 
+    def watch_grid(self):
+        """
+        Tracks wall changes on the current grid so the dynamic agent can repair its search.
+        Any previous planner or abstraction belongs to the old grid and is discarded.
+        """
+        self.dynamic_planner = None
+        self.hierarchy = None
+        self.changed_cells.clear()
+        self.grid.wall_listeners.pop("hierarchy", None)  # A discarded abstraction must stop updating
+        self.grid.wall_listeners["changes"] = self.changed_cells.add
+
     def set_agent(self, agent_type: str):
         self.selected_agent = agent_type
 
@@ -68,6 +103,10 @@ class SimulationController:
     def set_noise(self, value: int):
         self.noise_value = max(0, min(value, 15))
 
+    def cycle_search_mode(self):
+        modes = list(SEARCH_MODES)
+        self.search_mode = modes[(modes.index(self.search_mode) + 1) % len(modes)]
+
     def handle_mouse_input(self, mouse_pos, button):
         """
         Handles left/right mouse clicks for wall placement and start/end configuration.
@@ -125,11 +164,11 @@ class SimulationController:
             return
 
         if self.mouse_held and self.click_mode == 0 and self.grid.grid[row][col] == 0:
-            self.grid.grid[row][col] = 1
+            self.grid.Toggle_Wall(pos)
             self.reset_path()
 
         elif self.mouse_right_held and self.click_mode == 0 and self.grid.grid[row][col] == 1:
-            self.grid.grid[row][col] = 0
+            self.grid.Toggle_Wall(pos)
             self.reset_path()
 
         self.last_dragged_tile = pos
@@ -147,6 +186,14 @@ class SimulationController:
         elif key == pygame.K_RETURN:
             self.run_simulation()
 
+        elif key == pygame.K_b and self.selected_agent in ("depth", "noise"):
+            self.cycle_search_mode()
+            self.reset_path()
+
+        elif key == pygame.K_f and self.selected_agent in ("depth", "noise"):
+            self.show_frontier = not self.show_frontier
+            self.reset_path()
+
         elif key == pygame.K_d and self.selected_agent == "dynamic":
             self.dynamic_update_occurred = True
 
@@ -155,7 +202,8 @@ class SimulationController:
                 c = random.randint(0, Grid_Width - 1)
                 if (r, c) != self.grid.start and (r, c) != self.grid.end:
                     self.reset_path()
-                    self.grid.grid[r][c] = 1
+                    if self.grid.grid[r][c] == 0:
+                        self.grid.Toggle_Wall((r, c))
 
             self.path_notification = "Environment Updated!"
             self.path_notification_colour = (255, 204, 77)
@@ -186,6 +234,16 @@ class SimulationController:
                 else:
                     self.animation_active = False
 
+    def update_frontier_step(self):
+        """
+        Advances the frontier replay, then starts the path animation once it has finished.
+        """
+        replay = self.frontier_replay
+        if replay is None or replay.finished:
+            return
+        if not replay.step() and self.success:
+            self.animation_active = True
+
     def update_notification_timer(self):
         """
         Gradually decreases the display time for notifications.
@@ -206,6 +264,7 @@ class SimulationController:
         Re-initialises a clean grid for manual wall placement.
         """
         self.grid = GridWorld(Grid_Width, Grid_Height)
+        self.watch_grid()
         self.reset_path()
 
     def reset_path(self):
@@ -221,12 +280,16 @@ class SimulationController:
         self.interpolation_progress = 0.0
         self.search_time = 0
         self.nodes_explored = 0
+        self.fresh_nodes_explored = 0
+        self.search_stats = {}
+        self.frontier_replay = None
 
     def trigger_random_walls(self, count=85):
         """
         Randomly populates the grid with a specified number of walls.
         """
         self.grid = GridWorld(Grid_Width, Grid_Height)
+        self.watch_grid()
         for _ in range(count):
             r = random.randint(0, Grid_Height - 1)
             c = random.randint(0, Grid_Width - 1)
@@ -245,9 +308,70 @@ class SimulationController:
         self.grid.grid = loaded_grid
         self.grid.start = tuple(data["start"]) if data["start"] else None
         self.grid.end = tuple(data["end"]) if data["end"] else None
+        self.watch_grid()
         self.is_benchmark_run = True
         self.benchmark_name = name
 
+    def ensure_hierarchy(self):
+        """
+        Builds the HPA* abstraction for the grid and attaches it, if there is none yet.
+
+        The abstraction is reused by every search until the grid is replaced;
+        it only rebuilds the clusters touched by Toggle_Wall.
+        """
+        if self.hierarchy is None:
+            self.hierarchy = HierarchicalGrid(self.grid.grid, config.HPA_Cluster_Size)
+            self.hierarchy.attach(self.grid)
+
+    def run_mode_search(self, graph, Noise_Level=0, Max_Depth=None):
+        """
+        Runs the selected search mode for the depth and noise agents.
+
+        The hierarchical mode searches the abstraction from ensure_hierarchy.
+        """
+        if self.search_mode == "hierarchical":
+            self.ensure_hierarchy()
+            return self.hierarchy.find_path(
+                self.grid.start, self.grid.end,
+                Noise_Level=Noise_Level, Max_Depth=Max_Depth, stats=self.search_stats, lazy=True)
+
+        return run_search(
+            self.search_mode, graph, self.grid.start, self.grid.end,
+            Noise_Level=Noise_Level, Max_Depth=Max_Depth, stats=self.search_stats)
+
+    def record_frontier(self, graph, rng_state, Noise_Level=0, Max_Depth=None):
+        """
+        Re-runs the A* search with tracing on, from the same random state, and
+        prepares a replay of its frontier. Called after the timed search so
+        tracing never affects the measured time.
+        """
+        search_state = random.getstate()
+        random.setstate(rng_state)
+
+        trace = TraceBuffer(graph.width, graph.height)
+        traced_search(graph, self.grid.start, self.grid.end, trace, Noise_Level=Noise_Level, Max_Depth=Max_Depth)
+        self.frontier_replay = FrontierReplay(trace)
+
+        random.setstate(search_state)
+
+    def run_dynamic_search(self):
+        """
+        Plans with the incremental (LPA*) planner, repairing only what changed since the last search.
+
+        Returns:
+            tuple[List[tuple[int, int]], int]: The path (if any) and number of nodes (re-)expanded
+        """
+        planner = self.dynamic_planner
+        if planner is None or planner.start != self.grid.start or planner.end != self.grid.end:
+            self.dynamic_planner = IncrementalPlanner(
+                self.grid.grid, self.grid.start, self.grid.end)
+            self.changed_cells.clear()
+            return self.dynamic_planner.plan()
+
+        changed = list(self.changed_cells)
+        self.changed_cells.clear()
+        return planner.update_cells(changed)
+
     def run_simulation(self):
         """
         Runs A* simulation and updates internal state + notification feedback.
@@ -268,23 +392,46 @@ class SimulationController:
 
         log_noise = self.noise_value if self.selected_agent == "noise" else None
         log_depth = self.depth_value if self.selected_agent == "depth" else None
+        log_mode = "incremental" if self.selected_agent == "dynamic" else self.search_mode
+
+        # The hierarchical mode keeps its own abstraction in sync with the grid instead
+        graph = GridGraph(self.grid.grid) if self.search_mode != "hierarchical" else None
+        if self.search_mode == "hierarchical" and self.selected_agent in ("depth", "noise"):
+            self.ensure_hierarchy()  # Built before the timer, like the GridGraph
+        self.search_stats = {}
+        self.frontier_replay = None
+
+        trace_frontier = (self.show_frontier and self.search_mode == "astar"
+                          and self.selected_agent in ("depth", "noise"))
+        rng_state = random.getstate() if trace_frontier else None
 
         start_time = time.perf_counter()
         if self.selected_agent == "depth":
-            temp_path, explored = A_Star_Search(
-                self.grid.grid, self.grid.start, self.grid.end, Max_Depth=self.depth_value)
+            temp_path, explored = self.run_mode_search(graph, Max_Depth=self.depth_value)
         elif self.selected_agent == "noise":
-            temp_path, explored = A_Star_Search(
-                self.grid.grid, self.grid.start, self.grid.end, Noise_Level=self.noise_value)
+            temp_path, explored = self.run_mode_search(graph, Noise_Level=self.noise_value)
         elif self.selected_agent == "dynamic":
-            temp_path, explored = A_Star_Search(
-                self.grid.grid, self.grid.start, self.grid.end)
+            temp_path, explored = self.run_dynamic_search()
         else:
             temp_path, explored = None, 0
         end_time = time.perf_counter()
 
+        if self.selected_agent == "dynamic":
+            # Reference cost of replanning from zero, measured outside the timed section
+            _, self.fresh_nodes_explored = A_Star_Search(
+                self.grid.grid, self.grid.start, self.grid.end)
+
+        if trace_frontier:
+            self.record_frontier(
+                graph, rng_state,
+                Noise_Level=self.noise_value if self.selected_agent == "noise" else 0,
+                Max_Depth=self.depth_value if self.selected_agent == "depth" else None)
+
         self.search_time = end_time - start_time
         self.nodes_explored = explored
+        if self.selected_agent != "dynamic":
+            # LPA* only re-expands what changed, so its count says nothing about the branching factor
+            finish_counters(self.search_stats, temp_path, explored)
         self.success = temp_path is not None and len(temp_path) >= 2
 
         if self.success:
@@ -294,7 +441,8 @@ class SimulationController:
             self.agent_start = self.path[0]
             self.agent_end = self.path[1]
             self.interpolation_progress = 0.0
-            self.animation_active = True
+            # With a frontier replay, the walk starts once the replay has finished
+            self.animation_active = self.frontier_replay is None
 
             if self.selected_agent == "dynamic" and self.dynamic_update_occurred:
                 self.path_notification = "Path Found After Update!"
@@ -316,7 +464,7 @@ class SimulationController:
 
         self.dynamic_update_occurred = False
 
-        Log_Path_Metrics(
+        self.metrics.log(
             grid=self.grid.grid,
             start=self.grid.start,
             end=self.grid.end,
@@ -328,5 +476,7 @@ class SimulationController:
             Nodes_Explored=self.nodes_explored,
             Search_Time=self.search_time,
             is_benchmark=self.is_benchmark_run,
-            benchmark_name=self.benchmark_name if self.is_benchmark_run else None
+            benchmark_name=self.benchmark_name if self.is_benchmark_run else None,
+            Search_Mode=log_mode,
+            Counters=self.search_stats
         )
@@ -0,0 +1,171 @@
+import random
+
+import numpy as np
+import pytest
+
+from engines.bidirectional import bidirectional_search
+from engines.bounded import run_bounded
+from engines.churn import churn_stream
+from engines.grid_graph import GridGraph, search_graph
+from engines.hierarchical import HierarchicalGrid
+from engines.incremental import IncrementalPlanner
+from engines.jps import jump_point_search
+from engines.landmarks import LandmarkHeuristic
+from engines.noisy import noisy_search
+from lookahead import A_Star_Search
+
+SEEDS = range(8)
+QUERIES = 6
+
+
+def random_grid(rng, size, density):
+    return [[1 if rng.random() < density else 0 for _ in range(size)] for _ in range(size)]
+
+
+def random_queries(rng, grid, count=QUERIES):
+    """
+    Picks start/goal pairs on open tiles (not necessarily connected).
+    """
+    open_tiles = [(row, col) for row, line in enumerate(grid) for col, cell in enumerate(line) if cell == 0]
+    return [tuple(rng.sample(open_tiles, 2)) for _ in range(count)]
+
+
+def make_case(seed):
+    rng = random.Random(seed)
+    grid = random_grid(rng, rng.choice([16, 25, 40]), rng.choice([0.1, 0.25, 0.35]))
+    return grid, random_queries(rng, grid)
+
+
+def assert_valid_path(grid, path, start, end):
+    assert path[0] == start and path[-1] == end
+    for row, col in path:
+        assert grid[row][col] != 1
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        assert abs(r1 - r2) + abs(c1 - c2) == 1
+
+
+def optimal_length(grid, start, end):
+    path, _ = A_Star_Search(grid, start, end)
+    return len(path) if path else None
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_search_graph_matches_a_star(seed):
+    grid, queries = make_case(seed)
+    graph = GridGraph(grid)
+    for start, end in queries:
+        assert search_graph(graph, start, end) == A_Star_Search(grid, start, end)
+        assert search_graph(graph, start, end, Max_Depth=20) == A_Star_Search(grid, start, end, Max_Depth=20)
+
+        random.seed(seed)
+        noisy = search_graph(graph, start, end, Noise_Level=5)
+        random.seed(seed)
+        assert noisy == A_Star_Search(grid, start, end, Noise_Level=5)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_bucket_queue_is_optimal(seed):
+    grid, queries = make_case(seed)
+    graph = GridGraph(grid)
+    for start, end in queries:
+        path, _ = search_graph(graph, start, end, open_list="bucket")
+        expected = optimal_length(grid, start, end)
+        assert (len(path) if path else None) == expected
+        if path:
+            assert_valid_path(grid, path, start, end)
+
+
+@pytest.mark.parametrize("search", [bidirectional_search, jump_point_search])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_bidirectional_and_jps_are_optimal(search, seed):
+    grid, queries = make_case(seed)
+    graph = GridGraph(grid)
+    for start, end in queries:
+        path, _ = search(graph, start, end)
+        expected = optimal_length(grid, start, end)
+        assert (len(path) if path else None) == expected
+        if path:
+            assert_valid_path(grid, path, start, end)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_hierarchical_paths(seed):
+    grid, queries = make_case(seed)
+    hierarchy = HierarchicalGrid(grid, cluster_size=8)
+    for start, end in queries:
+        stats = {}
+        path, explored = hierarchy.find_path(start, end, stats=stats)
+        assert explored == stats["abstract"] + stats["concrete"]
+
+        # Near-optimal rather than optimal, but it finds a path exactly when one exists
+        assert (path is not None) == (optimal_length(grid, start, end) is not None)
+        if path is None:
+            continue
+        assert_valid_path(grid, path, start, end)
+
+        lazy_stats = {}
+        lazy_path, lazy_explored = hierarchy.find_path(start, end, stats=lazy_stats, lazy=True)
+        assert lazy_explored == lazy_stats["abstract"] + lazy_stats["concrete"]
+        assert len(lazy_path) == len(path)
+        assert list(lazy_path) == path
+
+        # The depth budget covers abstract and tile expansions alike
+        assert hierarchy.find_path(start, end, Max_Depth=explored)[0] == path
+        assert hierarchy.find_path(start, end, Max_Depth=explored - 1)[0] is None
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_incremental_matches_a_star_under_churn(seed):
+    grid, queries = make_case(seed)
+    start, end = queries[0]
+    planner = IncrementalPlanner(grid, start, end)
+    path, _ = planner.plan()
+    assert (len(path) if path else None) == optimal_length(grid, start, end)
+
+    for cells in churn_stream(grid, start, end, 10, cells_per_change=5, seed=seed):
+        path, _ = planner.update_cells(cells)
+        assert (len(path) if path else None) == optimal_length(grid, start, end)
+        if path:
+            assert_valid_path(grid, path, start, end)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_alt_is_admissible_and_optimal(seed, tmp_path):
+    grid, queries = make_case(seed)
+    graph = GridGraph(grid)
+    heuristic = LandmarkHeuristic(grid, count=4, cache_dir=str(tmp_path))
+    for start, end in queries:
+        path, _ = search_graph(graph, start, end, Heuristic=heuristic)
+        expected = optimal_length(grid, start, end)
+        assert (len(path) if path else None) == expected
+        if path:
+            assert heuristic.table_to(graph.to_node(end))[graph.to_node(start)] <= expected - 1
+
+
+@pytest.mark.parametrize("mode", ["weighted", "focal"])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_bounded_stays_within_weight(mode, seed):
+    grid, queries = make_case(seed)
+    graph = GridGraph(grid)
+    for start, end in queries:
+        expected = optimal_length(grid, start, end)
+        for weight in (1.0, 1.5, 3.0):
+            path, _ = run_bounded(mode, graph, start, end, Weight=weight)
+            assert (path is not None) == (expected is not None)
+            if path:
+                assert_valid_path(grid, path, start, end)
+                assert len(path) - 1 <= weight * (expected - 1)
+                if weight == 1.0:
+                    assert len(path) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_numpy_noise_is_seeded(seed):
+    grid, queries = make_case(seed)
+    graph = GridGraph(grid)
+    for start, end in queries:
+        path, _ = noisy_search(graph, start, end, 0, np.random.default_rng(seed))
+        assert (len(path) if path else None) == optimal_length(grid, start, end)
+
+        first = noisy_search(graph, start, end, 5, np.random.default_rng(seed))
+        assert noisy_search(graph, start, end, 5, np.random.default_rng(seed)) == first
@@ -0,0 +1,23 @@
+import pygame
+import config
+
+
+def draw_frontier(screen, controller):
+    """
+    Draws the search replay over the grid: expanded tiles in blue, the open frontier in orange.
+    Only active while the frontier view is on and a trace has been recorded.
+    """
+    replay = controller.frontier_replay
+    if replay is None:
+        return
+
+    tile_size = config.Tile_Size
+    overlay = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+
+    overlay.fill((*config.Blue, 70))
+    for row, col in replay.expanded:
+        screen.blit(overlay, (col * tile_size, row * tile_size))
+
+    overlay.fill((*config.Orange, 110))
+    for row, col in replay.frontier:
+        screen.blit(overlay, (col * tile_size, row * tile_size))
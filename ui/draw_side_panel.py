@@ -1,5 +1,6 @@
 import pygame
 import config
+from engines.modes import SEARCH_MODE_LABELS
 
 
 def draw_side_panel(screen, controller):
@@ -21,15 +22,35 @@ def draw_side_panel(screen, controller):
         ("Search Time", f"{controller.search_time:.6f} s"),
     ]
 
+    # Show the search mode and, for bidirectional search, the per-direction split
+    if controller.selected_agent in ("depth", "noise"):
+        entries.append(("Search Mode", SEARCH_MODE_LABELS[controller.search_mode]))
+        if "forward" in controller.search_stats:
+            entries.append(("Forward / Backward",
+                            f"{controller.search_stats['forward']} / {controller.search_stats['backward']}"))
+        if "abstract" in controller.search_stats:
+            entries.append(("Abstract / Concrete",
+                            f"{controller.search_stats['abstract']} / {controller.search_stats['concrete']}"))
+
+    # Search-internals counters from the last search (only the astar mode reports queue counters)
+    stats = controller.search_stats
+    if "pushes" in stats:
+        entries.append(("Pushes / Stale Pops", f"{stats['pushes']} / {stats['stale_pops']}"))
+        entries.append(("Peak Open / Reopens", f"{stats['peak_open']} / {stats['reopens']}"))
+    if stats.get("branching_factor") is not None:
+        entries.append(("Branching Factor", f"{stats['branching_factor']:.3f}"))
+
     # Add relevant parameter depending on agent type
     if controller.selected_agent == "depth":
         entries.append(("Depth Limit", str(controller.depth_value)))
     elif controller.selected_agent == "noise":
         entries.append(("Noise Level", str(controller.noise_value)))
+    elif controller.selected_agent == "dynamic":
+        entries.append(("Fresh Search Nodes", str(controller.fresh_nodes_explored)))
 
     # Draw each label-value pair
     y_offset = 20
-    spacing = 40
+    spacing = 40 if len(entries) <= 8 else 32  # Tighten up so the counters leave room for the instructions
     for label, value in entries:
         label_text = config.FONT_BOLD_28.render(f"{label}:", True, config.White)
         value_text = config.FONT_REGULAR_24.render(value, True, config.Light_Grey)
@@ -52,6 +73,10 @@ def draw_side_panel(screen, controller):
     ]
     if controller.selected_agent == "dynamic":
         instructions.append("D - Dynamic Update")
+    else:
+        instructions.append("B - Switch Search Mode")
+        frontier_state = "On" if controller.show_frontier else "Off"
+        instructions.append(f"F - Show Search Frontier ({frontier_state})")
 
     for line in instructions:
         text = config.FONT_REGULAR_24.render(line, True, config.White)
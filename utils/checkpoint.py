@@ -0,0 +1,116 @@
+import json
+import os
+
+import config
+
+CHECKPOINT_DIR = os.path.join(config.DATA_DIR, "checkpoints")
+# A checkpoint journals where its rows will go, makes the finished jobs' rows durable and then
+# journals the jobs; it is taken after this many finished jobs or this many seconds, whichever comes first
+CHECKPOINT_EVERY = 4096
+CHECKPOINT_SECONDS = 30
+
+
+def job_key(agent, benchmark, parameter, seed):
+    """
+    Identifies one benchmark job: the agent, map, swept parameter value and seed.
+    """
+    return f"{agent}|{benchmark}|{parameter}|{seed}"
+
+
+class CheckpointJournal:
+    def __init__(self, path, settings, resume=False):
+        """
+        Append-only JSON Lines journal of finished benchmark jobs.
+
+        The first line records the batch settings. Each checkpoint then adds a
+        "writing" line (where its metrics rows are about to be written, see
+        MetricsSink.write_marks), one line per job key and result, and a
+        "committed" line. Jobs only count as finished once their checkpoint is
+        committed. When resuming a journal that ends in an uncommitted
+        checkpoint, its write marks are kept in `uncommitted`, so the rows it
+        may have written can be discarded before its jobs run again.
+
+        Args:
+            path (str): Journal file
+            settings (dict): Everything the results depend on besides the job key
+            resume (bool): Keep the finished jobs of an existing journal instead of starting over
+
+        Raises:
+            ValueError: If resuming a journal that was written with different settings
+        """
+        self.path = path
+        self.settings = settings
+        self.completed = {}
+        self.uncommitted = None
+
+        if resume and os.path.exists(path):
+            self._load()
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"settings": settings}) + "\n")
+
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _load(self):
+        with open(self.path, encoding="utf-8") as f:
+            text = f.read()
+        lines = text.splitlines()
+
+        header = json.loads(lines[0]) if lines else {}
+        if header.get("settings") != self.settings:
+            raise ValueError(
+                f"Checkpoint {self.path} was written with different settings; run without --resume to start over")
+
+        valid = 1
+        checkpoint = {}
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break  # Partial line from a run that was killed while writing it
+            if "writing" in entry:
+                self.uncommitted = entry["writing"]
+                checkpoint = {}
+            elif "committed" in entry:
+                self.completed.update(checkpoint)
+                self.uncommitted = None
+                checkpoint = {}
+            else:
+                checkpoint[entry["key"]] = entry["result"]
+            valid += 1
+
+        if valid < len(lines) or not text.endswith("\n"):
+            # Drop the partial line so new entries start on a clean one
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines[:valid]) + "\n")
+
+    def begin(self, marks):
+        """
+        Starts a checkpoint: records where its rows are about to be written, before they are.
+        """
+        self._file.write(json.dumps({"writing": marks}) + "\n")
+        self._sync()
+
+    def record(self, entries):
+        """
+        Appends (key, result) pairs for finished jobs and commits the checkpoint.
+        """
+        for key, result in entries:
+            self.completed[key] = result
+            self._file.write(json.dumps({"key": key, "result": result}) + "\n")
+        self._file.write(json.dumps({"committed": len(entries)}) + "\n")
+        self._sync()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
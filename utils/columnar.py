@@ -0,0 +1,239 @@
+import json
+import os
+import uuid
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: only needed for --results-format parquet
+    pa = None
+    pq = None
+
+RESULT_FORMATS = ("csv", "parquet")
+ROW_GROUP_ROWS = 65536  # Small row groups make Parquet files slow to read back
+REPLACES_KEY = b"replaces"  # Metadata of a compacted part: JSON list of the part files it merged
+
+# Arrow type of every metrics column; tiles are split into row and column integers
+COLUMN_TYPES = {
+    "Timestamp": "timestamp",
+    "Start Row": "int32",
+    "Start Col": "int32",
+    "End Row": "int32",
+    "End Col": "int32",
+    "Walls": "int32",
+    "Path Length": "int32",
+    "Agent Type": "string",
+    "Noise Level": "int32",
+    "Max Depth": "int32",
+    "Success": "bool",
+    "Nodes Explored": "int64",
+    "Search Time (μs)": "int64",
+    "Seed": "int64",
+    "Search Mode": "string",
+    "Heuristic": "string",
+    "Timing": "string",
+    "Weight": "float64",
+    "Path Ratio": "float64",
+    "Node Savings (%)": "float64",
+    "Heap Pushes": "int64",
+    "Stale Pops": "int64",
+    "Peak Open": "int64",
+    "Reopens": "int64",
+    "Branching Factor": "float64",
+    "Peak Memory (KiB)": "float64",
+    "Frontier Size": "int64",
+    "Closed Size": "int64",
+    "Time Min (ns)": "int64",
+    "Time Median (ns)": "int64",
+    "Time IQR (ns)": "int64",
+}
+
+
+def columnar_available():
+    """
+    Returns True if pyarrow is installed, so the Parquet results format can be used.
+    """
+    return pa is not None
+
+
+def results_schema():
+    """
+    Builds the Arrow schema shared by every Parquet metrics file.
+    """
+    types = {
+        "timestamp": pa.timestamp("s"),
+        "int32": pa.int32(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+        "string": pa.string(),
+    }
+    return pa.schema([(column, types[kind]) for column, kind in COLUMN_TYPES.items()])
+
+
+def dataset_parts(dataset_dir):
+    """
+    Lists the part files of a Parquet metrics dataset that hold current rows.
+
+    Parts still being written ("_" names) are skipped, and so are parts that a
+    compacted part has already merged but that were not deleted yet (the run
+    stopped between renaming the compacted part and deleting them).
+
+    Returns:
+        tuple[List[str], List[str]]: Paths of the current parts and of the merged leftovers
+    """
+    names = sorted(name for name in os.listdir(dataset_dir)
+                   if name.endswith(".parquet") and not name.startswith(("_", ".")))
+    replaced = set()
+    for name in names:
+        metadata = pq.read_schema(os.path.join(dataset_dir, name)).metadata or {}
+        if REPLACES_KEY in metadata:
+            replaced.update(json.loads(metadata[REPLACES_KEY]))
+
+    current = [os.path.join(dataset_dir, name) for name in names if name not in replaced]
+    leftovers = [os.path.join(dataset_dir, name) for name in names if name in replaced]
+    return current, leftovers
+
+
+def records_to_table(records, schema):
+    """
+    Converts metrics records (as built by MetricsSink) into an Arrow table.
+
+    Missing values stay null instead of "N/A", and the Start/End tiles are split
+    into separate row and column integers.
+    """
+    columns = {column: [] for column in COLUMN_TYPES}
+    for record in records:
+        for column in COLUMN_TYPES:
+            if column.startswith(("Start ", "End ")):
+                continue
+            columns[column].append(record.get(column))
+        for name in ("Start", "End"):
+            tile = record.get(name)
+            columns[f"{name} Row"].append(tile[0] if tile is not None else None)
+            columns[f"{name} Col"].append(tile[1] if tile is not None else None)
+    return pa.table(columns, schema=schema)
+
+
+class ParquetResults:
+    def __init__(self, dataset_dir, row_group_rows=ROW_GROUP_ROWS):
+        """
+        Appends metrics records to a Parquet dataset: a folder of part files.
+
+        Rows are converted to Arrow as they arrive and written out in row groups
+        of row_group_rows, so a batch streams its rows to disk without rewriting
+        earlier data. A part is written under a "_" name (which readers skip) and
+        only renamed once it is complete, so a killed run never leaves a broken
+        part behind. sync() finishes the current part; later rows start a new one.
+
+        A Parquet file can only be read once it is closed, so every checkpoint
+        needs a part of its own. close() then merges the parts this writer
+        finished into a single file with full-size row groups, so a batch leaves
+        one part behind rather than one per checkpoint.
+
+        Args:
+            dataset_dir (str): Folder holding the part files (created if missing)
+            row_group_rows (int): Rows per row group (the last one may be smaller)
+        """
+        os.makedirs(dataset_dir, exist_ok=True)
+        self.dataset_dir = dataset_dir
+        self.schema = results_schema()
+        self.row_group_rows = row_group_rows
+        self.path = None
+        self._next_path = self._new_part_path()  # Where the rows not yet synced will be finished
+        self._tables = []
+        self._buffered_rows = 0
+        self._writer = None
+        self._parts = []  # Parts finished by this writer, merged by close()
+
+        # Parts left behind by a compaction that stopped before deleting them
+        for path in dataset_parts(dataset_dir)[1]:
+            os.remove(path)
+
+    def _new_part_path(self):
+        return os.path.join(self.dataset_dir, f"part-{uuid.uuid4().hex}.parquet")
+
+    def write_mark(self):
+        """
+        Returns the name of the part the rows written from now on will be finished under.
+        """
+        return {"part": os.path.basename(self._next_path)}
+
+    def write_rows(self, records):
+        if not records:
+            return
+        self._tables.append(records_to_table(records, self.schema))
+        self._buffered_rows += len(records)
+        if self._buffered_rows >= self.row_group_rows:
+            self._write_row_group()
+
+    def _write_row_group(self):
+        if not self._tables:
+            return
+        if self._writer is None:
+            self.path = self._next_path
+            self._writer = pq.ParquetWriter(self._in_progress_path(), self.schema)
+        table = pa.concat_tables(self._tables).combine_chunks()
+        self._writer.write_table(table, row_group_size=len(table))
+        self._tables = []
+        self._buffered_rows = 0
+
+    def _in_progress_path(self):
+        return os.path.join(self.dataset_dir, "_" + os.path.basename(self.path))
+
+    def sync(self):
+        self._write_row_group()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.replace(self._in_progress_path(), self.path)
+            self._parts.append(self.path)
+            self._next_path = self._new_part_path()
+
+    def close(self):
+        self.sync()
+        if len(self._parts) > 1:
+            self._compact()
+
+    def _compact(self):
+        """
+        Merges the parts this writer finished into one part, in full-size row groups.
+
+        The merged part records the names of the parts it replaces in its
+        metadata and is renamed into place before they are deleted, so a run
+        killed in between never shows a row twice (see dataset_parts).
+        """
+        self.path = self._new_part_path()
+        replaced = [os.path.basename(path) for path in self._parts]
+        schema = self.schema.with_metadata({REPLACES_KEY: json.dumps(replaced).encode("utf-8")})
+
+        with pq.ParquetWriter(self._in_progress_path(), schema) as writer:
+            tables, rows = [], 0
+            for part in self._parts:
+                for batch in pq.ParquetFile(part).iter_batches(batch_size=self.row_group_rows):
+                    # Parquet has no second timestamps, so parts read back in ms; cast to the schema again
+                    tables.append(pa.Table.from_batches([batch]).cast(schema))
+                    rows += batch.num_rows
+                    if rows >= self.row_group_rows:
+                        table = pa.concat_tables(tables).combine_chunks()
+                        writer.write_table(table.slice(0, self.row_group_rows), row_group_size=self.row_group_rows)
+                        tables = [table.slice(self.row_group_rows)]
+                        rows = tables[0].num_rows
+            if rows:
+                table = pa.concat_tables(tables).combine_chunks()
+                writer.write_table(table, row_group_size=len(table))
+
+        os.replace(self._in_progress_path(), self.path)
+        for part in self._parts:
+            os.remove(part)
+        self._parts = [self.path]
+
+
+def read_results(dataset_dir):
+    """
+    Loads every part file of a Parquet metrics dataset into one DataFrame.
+    """
+    parts, _ = dataset_parts(dataset_dir)
+    if not parts:
+        return results_schema().empty_table().to_pandas()
+    return pq.read_table(parts, schema=results_schema()).to_pandas()
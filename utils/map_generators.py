@@ -0,0 +1,175 @@
+import random
+
+import numpy as np
+
+MIN_MAP_SIZE = 15
+MAX_MAP_SIZE = 4096
+DEFAULT_DENSITY = 0.25
+ROOM_SPACING = 12  # Roughly one room per ROOM_SPACING x ROOM_SPACING block
+
+
+def _corner_end(size):
+    # Bottom-right tile that lies on the even lattice used by the maze generator
+    last = size - 1
+    return last - last % 2
+
+
+def _as_map(walls, start, end):
+    """
+    Packs a boolean wall array into the same dict layout as the JSON benchmark maps.
+    """
+    return {
+        "grid": walls.astype(np.int8).tolist(),
+        "start": [int(start[0]), int(start[1])],
+        "end": [int(end[0]), int(end[1])],
+    }
+
+
+def random_obstacles(size, seed, density=DEFAULT_DENSITY):
+    """
+    Scatters walls uniformly at the given density.
+
+    A random monotone staircase from the top-left to the bottom-right corner is
+    cleared afterwards, so the start and goal are always connected; it touches
+    only 2 * size - 1 tiles, so the density is barely changed.
+
+    Args:
+        size (int): Width and height in tiles
+        seed (int): Seed for the layout
+        density (float): Fraction of tiles that start out as walls
+
+    Returns:
+        dict: {"grid", "start", "end"} like the JSON benchmark maps
+    """
+    rng = np.random.default_rng(seed)
+    walls = rng.random((size, size)) < density
+
+    # Shuffle size - 1 down moves and size - 1 right moves into one staircase path
+    moves = rng.permutation(np.repeat([0, 1], size - 1))
+    rows = np.concatenate(([0], np.cumsum(moves == 0)))
+    cols = np.concatenate(([0], np.cumsum(moves == 1)))
+    walls[rows, cols] = False
+
+    return _as_map(walls, (0, 0), (size - 1, size - 1))
+
+
+def recursive_maze(size, seed):
+    """
+    Carves a perfect maze with an iterative recursive backtracker.
+
+    Rooms sit on even coordinates and walls between them are knocked through,
+    so every open tile is reachable from every other along exactly one route.
+
+    Args:
+        size (int): Width and height in tiles
+        seed (int): Seed for the layout
+
+    Returns:
+        dict: {"grid", "start", "end"} like the JSON benchmark maps
+    """
+    rng = random.Random(seed)
+    cells = (size + 1) // 2  # Rooms per side
+    walls = np.ones((size, size), dtype=bool)
+    visited = bytearray(cells * cells)
+    steps = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+    stack = [(0, 0)]
+    visited[0] = 1
+    walls[0, 0] = False
+    while stack:
+        row, col = stack[-1]
+        options = []
+        for dr, dc in steps:
+            r, c = row + dr, col + dc
+            if 0 <= r < cells and 0 <= c < cells and not visited[r * cells + c]:
+                options.append((r, c))
+        if not options:
+            stack.pop()
+            continue
+
+        r, c = rng.choice(options)
+        visited[r * cells + c] = 1
+        walls[row + r, col + c] = False  # The wall tile between the two rooms
+        walls[2 * r, 2 * c] = False
+        stack.append((r, c))
+
+    end = _corner_end(size)
+    return _as_map(walls, (0, 0), (end, end))
+
+
+def rooms_and_corridors(size, seed):
+    """
+    Places rectangular rooms and joins them with L-shaped corridors.
+
+    Rooms are visited in a snaking row order, so corridors stay short and the
+    start corner, every room and the goal corner form one connected network.
+
+    Args:
+        size (int): Width and height in tiles
+        seed (int): Seed for the layout
+
+    Returns:
+        dict: {"grid", "start", "end"} like the JSON benchmark maps
+    """
+    rng = np.random.default_rng(seed)
+    walls = np.ones((size, size), dtype=bool)
+    bands = max(1, size // ROOM_SPACING)
+    block = size / bands
+
+    centres = [(0, 0)]
+    for band in range(bands):
+        columns = range(bands) if band % 2 == 0 else reversed(range(bands))
+        for column in columns:
+            top, left = int(band * block), int(column * block)
+            span = max(3, int(block) - 2)
+            height = int(rng.integers(3, span + 1))
+            width = int(rng.integers(3, span + 1))
+            row = top + int(rng.integers(0, max(1, int(block) - height)))
+            col = left + int(rng.integers(0, max(1, int(block) - width)))
+            walls[row:row + height, col:col + width] = False
+            centres.append((min(row + height // 2, size - 1), min(col + width // 2, size - 1)))
+    centres.append((size - 1, size - 1))
+
+    # L-shaped corridors between consecutive rooms (and the two corners)
+    for (r1, c1), (r2, c2) in zip(centres, centres[1:]):
+        if rng.random() < 0.5:
+            walls[min(r1, r2):max(r1, r2) + 1, c1] = False
+            walls[r2, min(c1, c2):max(c1, c2) + 1] = False
+        else:
+            walls[r1, min(c1, c2):max(c1, c2) + 1] = False
+            walls[min(r1, r2):max(r1, r2) + 1, c2] = False
+
+    return _as_map(walls, (0, 0), (size - 1, size - 1))
+
+
+def open_field(size, seed):
+    """
+    An empty map: the worst case for uninformed search and the best for A*.
+    """
+    return _as_map(np.zeros((size, size), dtype=bool), (0, 0), (size - 1, size - 1))
+
+
+# Map families used by the scaling suite; each takes (size, seed)
+MAP_FAMILIES = {
+    "random": random_obstacles,
+    "maze": recursive_maze,
+    "rooms": rooms_and_corridors,
+    "open": open_field,
+}
+
+
+def generate_map(family, size, seed, density=DEFAULT_DENSITY):
+    """
+    Generates one map of the given family; the same arguments always give the same map.
+
+    Raises:
+        ValueError: If the family is unknown or the size is out of range
+    """
+    if family not in MAP_FAMILIES:
+        raise ValueError(f"Unknown map family: {family}")
+    if not MIN_MAP_SIZE <= size <= MAX_MAP_SIZE:
+        raise ValueError(f"Map size must be between {MIN_MAP_SIZE} and {MAX_MAP_SIZE}, got {size}")
+
+    if family == "random":
+        return random_obstacles(size, seed, density=density)
+    return MAP_FAMILIES[family](size, seed)
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import os
 
@@ -35,3 +36,23 @@ def load_full_map(filepath):
             f"Map file is missing required keys {required_keys}: {filepath}")
 
     return data
+
+
+def grid_digest(grid):
+    """
+    Returns a stable content hash of a grid, used to key per-map caches.
+
+    Walls are hashed as 1 and everything else as 0, together with the grid
+    dimensions, so two grids share a digest only if they have the same layout.
+
+    Args:
+        grid (List[List[int]]): The map grid (0 = empty, 1 = wall)
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    height = len(grid)
+    width = len(grid[0]) if grid else 0
+    digest = hashlib.sha256(f"{height}x{width}:".encode("ascii"))
+    digest.update(bytes(1 if value == 1 else 0 for row in grid for value in row))
+    return digest.hexdigest()
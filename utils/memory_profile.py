@@ -0,0 +1,44 @@
+import tracemalloc
+
+# Column names used in the metrics CSVs for memory-mode runs
+MEMORY_COLUMNS = {
+    "peak_kib": "Peak Memory (KiB)",
+    "frontier": "Frontier Size",
+    "closed": "Closed Size",
+}
+
+
+def measure_peak(function, *args, **kwargs):
+    """
+    Calls function(*args, **kwargs) under tracemalloc and reports its peak allocation.
+
+    The peak is measured above whatever was already allocated when the call
+    started, so it covers only memory the call itself held at its high point.
+    tracemalloc slows every allocation down, so never time a call measured here.
+
+    Returns:
+        tuple[Any, int]: The function's return value and its peak traced allocation in bytes
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        result = function(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return result, max(peak - baseline, 0)
+
+
+def memory_entry(peak_bytes, stats):
+    """
+    Builds the memory record logged for one run from a peak allocation and the search's stats dict.
+    """
+    return {
+        "peak_kib": round(peak_bytes / 1024, 2),
+        "frontier": stats.get("frontier"),
+        "closed": stats.get("closed"),
+    }
@@ -0,0 +1,133 @@
+import os
+
+# Terrain the agents can walk on; trees, water and out-of-bounds tiles become walls
+PASSABLE_TERRAIN = frozenset(".GS")
+
+
+def load_movingai_map(filepath):
+    """
+    Loads a MovingAI grid map (.map) as a wall grid.
+
+    Expected structure:
+        type octile
+        height <rows>
+        width <cols>
+        map
+        <rows lines of <cols> terrain characters>
+
+    Args:
+        filepath (str): Path to the .map file
+
+    Returns:
+        dict: 'grid' (0 = empty, 1 = wall) plus the map's 'height', 'width' and 'type'
+
+    Raises:
+        FileNotFoundError: If the specified file doesn't exist
+        ValueError: If the header is malformed or the grid doesn't match its dimensions
+    """
+    if not os.path.isfile(filepath):
+        raise FileNotFoundError(f"Map file not found: {filepath}")
+
+    header = {}
+    with open(filepath, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line == "map":
+                break
+            if line:
+                key, _, value = line.partition(" ")
+                header[key] = value.strip()
+        else:
+            raise ValueError(f"Map file has no 'map' line: {filepath}")
+
+        try:
+            height, width = int(header["height"]), int(header["width"])
+        except (KeyError, ValueError):
+            raise ValueError(f"Map file is missing its height/width: {filepath}")
+
+        grid = []
+        for line in f:
+            line = line.rstrip("\r\n")
+            if not line:
+                continue
+            if len(line) != width:
+                raise ValueError(f"Map row {len(grid)} has {len(line)} tiles, expected {width}: {filepath}")
+            grid.append([0 if tile in PASSABLE_TERRAIN else 1 for tile in line])
+
+    if len(grid) != height:
+        raise ValueError(f"Map has {len(grid)} rows, expected {height}: {filepath}")
+
+    return {"grid": grid, "height": height, "width": width, "type": header.get("type", "octile")}
+
+
+def iter_scenarios(filepath):
+    """
+    Streams the queries of a MovingAI scenario file (.scen) one at a time.
+
+    Each line holds: bucket, map, map width, map height, start x, start y,
+    goal x, goal y, optimal length (tab separated). Coordinates are converted
+    to (row, col) tiles. Lines are read lazily, so a large scenario file is
+    never held in memory.
+
+    Args:
+        filepath (str): Path to the .scen file
+
+    Yields:
+        dict: 'index', 'bucket', 'map', 'width', 'height', 'start', 'end' and 'optimal'
+        (the published optimal length, with diagonal moves costing sqrt(2))
+
+    Raises:
+        FileNotFoundError: If the specified file doesn't exist
+        ValueError: If a line is malformed
+    """
+    if not os.path.isfile(filepath):
+        raise FileNotFoundError(f"Scenario file not found: {filepath}")
+
+    with open(filepath, "r") as f:
+        index = 0
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("version"):
+                continue
+
+            fields = line.split("\t") if "\t" in line else line.split()
+            if len(fields) != 9:
+                raise ValueError(f"Expected 9 fields on line {line_number} of {filepath}, got {len(fields)}")
+
+            bucket, map_name, width, height, start_x, start_y, goal_x, goal_y, optimal = fields
+            yield {
+                "index": index,
+                "bucket": int(bucket),
+                "map": map_name,
+                "width": int(width),
+                "height": int(height),
+                "start": (int(start_y), int(start_x)),
+                "end": (int(goal_y), int(goal_x)),
+                "optimal": float(optimal),
+            }
+            index += 1
+
+
+def resolve_map_path(map_name, map_dir):
+    """
+    Finds the .map file a scenario refers to. Scenario files often keep the path
+    the map had in the original benchmark set, so the bare file name is tried too.
+
+    Raises:
+        FileNotFoundError: If neither location holds the map
+    """
+    for candidate in (os.path.join(map_dir, map_name), os.path.join(map_dir, os.path.basename(map_name))):
+        if os.path.isfile(candidate):
+            return candidate
+    raise FileNotFoundError(f"Map {map_name} not found in {map_dir}")
+
+
+def scenario_name(filepath):
+    """
+    Short name of a scenario file for results files, e.g. "arena2" for "arena2.map.scen".
+    """
+    name = os.path.basename(filepath)
+    for extension in (".scen", ".map"):
+        if name.endswith(extension):
+            name = name[:-len(extension)]
+    return name
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+import config
+
+RESULT_CACHE_DIR = os.path.join(config.DATA_DIR, "cache", "results")
+RESULT_CACHE_VERSION = 2  # Bump when a search engine changes its results
+DEFAULT_MEMORY_ENTRIES = 1024
+
+
+def result_key(digest, **params):
+    """
+    Builds a content address for one deterministic search.
+
+    Args:
+        digest (str): grid_digest of the map searched
+        **params: Everything else the result depends on (agent, start, end, depth, search mode, ...)
+
+    Returns:
+        str: Hex SHA-256 key
+    """
+    payload = json.dumps(
+        {"version": RESULT_CACHE_VERSION, "grid": digest, **params},
+        sort_keys=True, default=list)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, cache_dir=RESULT_CACHE_DIR, max_entries=DEFAULT_MEMORY_ENTRIES):
+        """
+        Two-layer cache of search results: an in-memory LRU in front of one JSON file per key.
+
+        Only deterministic searches (no heuristic noise) should be stored, since a
+        hit replays the stored path and node counts instead of searching.
+
+        Args:
+            cache_dir (str): Folder holding the on-disk entries
+            max_entries (int): Entries kept in memory before the least recently used is dropped
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key):
+        # Fan out by key prefix so one folder never holds every entry
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key):
+        """
+        Looks up a stored result, checking memory first and then disk.
+
+        Returns:
+            dict | None: {"path", "explored", "stats"} or None on a miss
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        entry_path = self._entry_path(key)
+        if os.path.exists(entry_path):
+            try:
+                with open(entry_path, "r") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None  # Unreadable entry: treat as a miss and overwrite it later
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry["path"] is not None:
+            entry["path"] = [tuple(pos) for pos in entry["path"]]
+        self._remember(key, entry)
+        self.hits += 1
+        return entry
+
+    def put(self, key, path, explored, stats=None):
+        """
+        Stores a search result in memory and on disk.
+
+        Args:
+            key (str): Key from result_key
+            path (List[tuple[int, int]] | None): Path found, if any
+            explored (int): Nodes explored
+            stats (dict, optional): Mode-specific counters to replay with the result
+        """
+        entry = {"path": path, "explored": explored, "stats": dict(stats or {})}
+        self._remember(key, entry)
+
+        entry_path = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        # A temp file of its own, so parallel workers storing the same key never share one
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), prefix=f"{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(temp_path, entry_path)  # Never leave a half-written entry behind
+        except OSError:
+            # Losing the race to another writer is fine: the result is deterministic, so its entry is the same
+            if not os.path.exists(entry_path):
+                raise
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
@@ -0,0 +1,66 @@
+import gc
+import time
+
+import numpy as np
+
+DEFAULT_WARMUP = 3
+DEFAULT_REPEATS = 15
+
+# Column names used in the metrics CSVs for precision-timed runs
+TIMING_COLUMNS = {
+    "min_ns": "Time Min (ns)",
+    "median_ns": "Time Median (ns)",
+    "iqr_ns": "Time IQR (ns)",
+}
+
+
+def measure_repeated(function, *args, warmup=DEFAULT_WARMUP, repeats=DEFAULT_REPEATS, disable_gc=False, setup=None,
+                     **kwargs):
+    """
+    Times function(*args, **kwargs) over several calls with perf_counter_ns.
+
+    The warmup calls are not timed; they fill the workspace pool, caches and
+    lazily built tables so the timed calls all see the same warm state. With
+    disable_gc=True the garbage collector is run once and then switched off for
+    the warmup and timed calls, so a collection never lands inside a sample.
+    setup() runs before every call, outside the timed section (e.g. to reseed the noise).
+
+    Returns:
+        tuple[Any, List[int]]: The last call's return value and the duration of every timed call (ns)
+    """
+    gc_was_enabled = gc.isenabled()
+    samples = []
+    try:
+        # Collect before the warmup: a collection right before the timed calls would leave the caches cold
+        if disable_gc:
+            gc.collect()
+            gc.disable()
+
+        for _ in range(warmup):
+            if setup is not None:
+                setup()
+            function(*args, **kwargs)
+
+        for _ in range(repeats):
+            if setup is not None:
+                setup()
+            start_time = time.perf_counter_ns()
+            result = function(*args, **kwargs)
+            samples.append(time.perf_counter_ns() - start_time)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return result, samples
+
+
+def timing_entry(samples):
+    """
+    Builds the timing record logged for one run: the fastest, median and
+    interquartile range of its timed calls (ns).
+    """
+    q1, median, q3 = np.percentile(samples, [25, 50, 75])
+    return {
+        "min_ns": int(min(samples)),
+        "median_ns": int(round(median)),
+        "iqr_ns": int(round(q3 - q1)),
+    }
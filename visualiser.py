@@ -8,11 +8,20 @@ from matplotlib.backends.backend_pdf import PdfPages
 import tkinter as tk
 from tkinter import ttk, messagebox
 import config
+from utils.columnar import columnar_available, read_results
 
 # Enable interactive plotting
 plt.ion()
 
-AGENTS = ["depth", "noise", "dynamic"]
+AGENTS = ["depth", "noise", "dynamic", "bounded"]
+
+# Parameter each agent's runs are plotted against
+X_COLUMNS = {
+    "depth": "Max Depth",
+    "noise": "Noise Level",
+    "dynamic": "Run",
+    "bounded": "Weight",
+}
 
 
 class MetricsVisualizer:
@@ -49,7 +58,7 @@ class MetricsVisualizer:
         agent_menu.grid(row=0, column=1, sticky="w")
 
         # Graphing options
-        ttk.Button(frame, text="Plot: Path Length vs Depth/Noise",
+        ttk.Button(frame, text="Plot: Path Length vs Depth/Noise/Weight",
                    command=lambda: self.plot_path_vs_param(is_benchmark)).grid(row=1, column=0, columnspan=2, pady=10, sticky="ew")
         ttk.Button(frame, text="Plot: Success Rate",
                    command=lambda: self.plot_success_rate(is_benchmark)).grid(row=2, column=0, columnspan=2, pady=10, sticky="ew")
@@ -80,25 +89,40 @@ class MetricsVisualizer:
 
     def load_all_data(self, agent, is_benchmark=False):
         """
-        Loads and merges all CSVs for a given agent, including from archives.
+        Loads and merges all CSVs (and Parquet datasets) for a given agent, including from archives.
         """
         folder = f"{config.METRICS_DIR}/{agent}/{'benchmark_data' if is_benchmark else ''}"
         archive_folder = os.path.join(folder, "archive")
 
         all_files = []
-        if os.path.exists(folder):
-            all_files += [os.path.join(folder, f)
-                          for f in os.listdir(folder) if f.endswith(".csv")]
-        if os.path.exists(archive_folder):
-            all_files += [os.path.join(archive_folder, f)
-                          for f in os.listdir(archive_folder) if f.endswith(".csv")]
-
-        dfs = [pd.read_csv(f).assign(_source_file=f) for f in all_files]
+        for source in (folder, archive_folder):
+            if os.path.exists(source):
+                all_files += [os.path.join(source, f)
+                              for f in os.listdir(source) if f.endswith((".csv", ".parquet"))]
+
+        dfs = [self.read_metrics_file(f).assign(_source_file=f) for f in sorted(all_files)]
+        dfs = [df for df in dfs if not df.empty]
         if not dfs:
             return pd.DataFrame()
 
         df = pd.concat(dfs, ignore_index=True)
         df.insert(0, "Run", range(1, len(df) + 1))
+        return df
+
+    @staticmethod
+    def read_metrics_file(path):
+        """
+        Reads one metrics CSV or Parquet dataset and adds a boolean Success_Bool column.
+        """
+        if path.endswith(".parquet"):
+            if not columnar_available():
+                print(f"[!] Skipping {path}: reading Parquet results needs pyarrow")
+                return pd.DataFrame()
+            df = read_results(path)
+            df["Success_Bool"] = df["Success"].astype(bool)
+            return df
+
+        df = pd.read_csv(path)
         df["Success_Bool"] = df["Success"] == "Yes"
         return df
 
@@ -119,7 +143,7 @@ class MetricsVisualizer:
 
     def plot_path_vs_param(self, is_benchmark):
         """
-        Plots path length against the relevant parameter (depth, noise, or run).
+        Plots path length against the relevant parameter (depth, noise, weight, or run).
         """
         agent = self.selected_agent.get()
         df = self.load_all_data(agent, is_benchmark)
@@ -128,8 +152,7 @@ class MetricsVisualizer:
                 "No Data", f"No data found for {agent} agent.")
             return
 
-        x_col = "Run" if agent == "dynamic" else (
-            "Max Depth" if agent == "depth" else "Noise Level")
+        x_col = X_COLUMNS[agent]
         plt.figure(figsize=(8, 5))
         sns.lineplot(data=df, x=x_col, y="Path Length",
                      errorbar="sd", label=agent.capitalize())
@@ -147,8 +170,7 @@ class MetricsVisualizer:
                 "No Data", f"No data found for {agent} agent.")
             return
 
-        x_col = "Run" if agent == "dynamic" else (
-            "Max Depth" if agent == "depth" else "Noise Level")
+        x_col = X_COLUMNS[agent]
         plt.figure(figsize=(8, 5))
         sns.lineplot(data=df, x=x_col, y="Success_Bool",
                      errorbar="sd", label=agent.capitalize())
@@ -167,8 +189,7 @@ class MetricsVisualizer:
                 "No Data", f"No data found for {agent} agent.")
             return
 
-        x_col = "Run" if agent == "dynamic" else (
-            "Max Depth" if agent == "depth" else "Noise Level")
+        x_col = X_COLUMNS[agent]
         plt.figure(figsize=(8, 5))
         sns.lineplot(data=df, x=x_col, y="Nodes Explored",
                      errorbar="sd", label=agent.capitalize())
@@ -184,8 +205,7 @@ class MetricsVisualizer:
             df = self.load_all_data(agent, is_benchmark)
             if df.empty:
                 continue
-            x_col = "Run" if agent == "dynamic" else (
-                "Max Depth" if agent == "depth" else "Noise Level")
+            x_col = X_COLUMNS[agent]
             sns.lineplot(data=df, x=x_col, y=metric,
                          errorbar="sd", label=agent.capitalize())
 
@@ -207,8 +227,7 @@ class MetricsVisualizer:
                 "No Data", f"No data found for {agent} agent.")
             return
 
-        x_col = "Run" if agent == "dynamic" else (
-            "Max Depth" if agent == "depth" else "Noise Level")
+        x_col = X_COLUMNS[agent]
         pdf_path = os.path.join(
             config.METRICS_DIR, agent, "benchmark_data" if is_benchmark else "", "graphs", "summary_report.temp.pdf")
         os.makedirs(os.path.dirname(pdf_path), exist_ok=True)